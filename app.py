@@ -1,49 +1,165 @@
+import argparse
+import sys
+
 from src.game import Game
-from src.match import Match
+from src.rng import derive_seed, make_rng
+from src.session import majority_guess_policy, always_greater_policy, always_continue_policy, always_stop_policy
+from src.solver import OptimalStopSolver
 
 STARTING_POINTS = 60
 MATCH_COST = 25
 WIN_THRESHOLD = 1000
 LOSE_THRESHOLD = 30
+HISTORY_SIZE = 1000
 
-game = Game(STARTING_POINTS, MATCH_COST, WIN_THRESHOLD, LOSE_THRESHOLD)
-
-print(f"START THE GAME WITH {game.points} POINTS")
-while game.can_play_match():
-    game.pay_for_match()
-    print(f"Paid {game.match_cost} points. Current points: {game.points}")
-
-    # Start playing a Match
-    match = Match()
-    while True:
-        # Deal cards and get the match result
-        house_card = match.deal_cards()
-        print(f"House's card: {house_card}")
-        guess = input("Greater or less? (g/l): ").strip().lower()
-        player_card = match.reveal_player_card()
-        print(f"Your card: {player_card}")
-        if match.is_guess_correct(guess):
-            print("Correct!")
-
-            # Automatically end the match if the player reaches win_threshold
-            if match.get_reward() >= match.win_threshold:
-                break
 
-            decision = input(f"Continue? (y/stop): ").strip().lower()
-            if decision == "stop":
+def run_game(game, read, say, solver=None):
+    """
+    Play one game with the console rules.
+    Args:
+        read (callable): read(kind, prompt, match) returns the player's raw answer,
+            kind being "guess" or "decision".
+        say (callable): Receives every line of output.
+        solver (OptimalStopSolver): If given, prints its advice before each decision.
+    Returns:
+        Game: The same game, in its final state.
+    """
+    say(f"START THE GAME WITH {game.points} POINTS")
+    while game.can_play_match():
+        game.pay_for_match()
+        say(f"Paid {game.match_cost} points. Current points: {game.points}")
+
+        # Start playing a Match
+        match = game.new_match()
+        while True:
+            # Deal cards and get the match result
+            house_card = match.deal_cards()
+            say(f"House's card: {house_card}")
+            guess = read("guess", "Greater or less? (g/l): ", match).strip().lower()
+            player_card = match.reveal_player_card()
+            say(f"Your card: {player_card}")
+            if match.is_guess_correct(guess):
+                say("Correct!")
+
+                # Automatically end the match if the player reaches win_threshold
+                if match.get_reward() >= match.win_threshold:
+                    break
+
+                if solver is not None:
+                    advice = "continue" if solver.should_continue(match) else "stop"
+                    say(f"Advice: {advice} (expected reward if you continue: {solver.continue_value(match):.1f})")
+                decision = read("decision", "Continue? (y/stop): ", match).strip().lower()
+                if decision == "stop":
+                    break
+                match.double_reward()
+                say(f"Reward doubled to {match.get_reward()}")
+            else:
+                say("Wrong!")
+                match.remove_reward()
                 break
-            match.double_reward()
-            print(f"Reward doubled to {match.get_reward()}")
-        else:
-            print("Wrong!")
-            match.remove_reward()
+
+        game.add_reward(match.get_reward())
+        game.record_match(match)
+        say(f"Match reward: {match.get_reward()}. Total points: {game.points}")
+        if game.check_win():
+            say("You win!")
+            break
+    if not game.can_play_match():
+        say(f"Not enough {game.lose_threshold} points (having {game.points} now) to continue!")
+    say(f"Final score: {game.points}")
+    return game
+
+
+def play_interactive():
+    """Play one game reading answers with input()."""
+    game = Game(STARTING_POINTS, MATCH_COST, WIN_THRESHOLD, LOSE_THRESHOLD, history_size=HISTORY_SIZE)
+    return run_game(game, lambda kind, prompt, match: input(prompt), print, OptimalStopSolver())
+
+
+def script_reader(lines):
+    """Return a reader answering every prompt with the next line of `lines`."""
+    answers = iter(lines)
+
+    def read(kind, prompt, match):
+        try:
+            return next(answers).rstrip("\n")
+        except StopIteration:
+            raise EOFError("Ran out of scripted answers.") from None
+    return read
+
+
+def strategy_reader(choose_guess, choose_continue):
+    """Return a reader answering prompts with player callables from src.session."""
+    def read(kind, prompt, match):
+        if kind == "guess":
+            return choose_guess(match)
+        return "y" if choose_continue(match) else "stop"
+    return read
+
+
+STRATEGIES = {
+    "majority": (majority_guess_policy, always_continue_policy),
+    "majority-stop": (majority_guess_policy, always_stop_policy),
+    "greater": (always_greater_policy, always_continue_policy),
+}
+
+
+def play_batch(games, read, out, seed=None, transcript=True):
+    """
+    Play `games` games back to back without prompting.
+    Each game's output is collected and written to `out` in one call, followed
+    by a one-line summary. A game whose scripted answers run out is reported as unfinished
+    and ends the batch.
+    Returns:
+        list of Game: The finished games.
+    """
+    finished = []
+    for index in range(1, games + 1):
+        rng = make_rng(derive_seed(seed, index)) if seed is not None else None
+        game = Game(STARTING_POINTS, MATCH_COST, WIN_THRESHOLD, LOSE_THRESHOLD, rng=rng)
+        lines = []
+
+        def read_echoed(kind, prompt, match):
+            answer = read(kind, prompt, match)
+            lines.append(prompt + answer)
+            return answer
+
+        try:
+            run_game(game, read_echoed, lines.append)
+            result = "win" if game.check_win() else "bankrupt"
+        except EOFError:
+            result = "unfinished"
+        summary = f"game={index} result={result} points={game.points} matches={game.matches_played}"
+        out.write("\n".join(lines + [summary]) + "\n" if transcript else summary + "\n")
+        if result == "unfinished":
             break
-    
-    game.add_reward(match.get_reward())
-    print(f"Match reward: {match.get_reward()}. Total points: {game.points}")
-    if game.check_win():
-        print("You win!")
-        break
-if not game.can_play_match():
-    print(f"Not enough {game.lose_threshold} points (having {game.points} now) to continue!")
-print(f"Final score: {game.points}")
\ No newline at end of file
+        finished.append(game)
+    out.flush()
+    return finished
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Card guessing game (console).")
+    parser.add_argument('--script', help="Answers file, one per line; '-' reads from stdin.")
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), help="Answer prompts with a built-in player.")
+    parser.add_argument('--games', type=int, default=1, help="Games to play back to back in batch mode.")
+    parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible batch runs.")
+    parser.add_argument('--summary-only', action='store_true', help="Only print the per-game summaries.")
+    args = parser.parse_args(argv)
+
+    if args.script is None and args.strategy is None:
+        play_interactive()
+        return
+
+    if args.strategy is not None:
+        read = strategy_reader(*STRATEGIES[args.strategy])
+        play_batch(args.games, read, sys.stdout, args.seed, not args.summary_only)
+    elif args.script == "-":
+        play_batch(args.games, script_reader(sys.stdin), sys.stdout, args.seed, not args.summary_only)
+    else:
+        with open(args.script) as f:
+            play_batch(args.games, script_reader(f), sys.stdout, args.seed, not args.summary_only)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Benchmarks for the Card, Deck, Match and Game hot paths.
+
+Every benchmark builds its inputs from a fixed seed, times its operation with
+`time.perf_counter` (best of several repeats) and traces one run with
+`tracemalloc`: its peak memory, and the blocks and bytes it allocated that are
+still alive when it returns (its result included). Results can be saved as a
+JSON baseline and later compared against it; the run fails when a checked
+benchmark's ops/sec drops more than the threshold below its baseline, or when
+a checked benchmark has no result or no baseline to compare with.
+
+    python -m benchmarks.bench --save baseline.json
+    python -m benchmarks.bench --compare baseline.json --threshold 0.2 --check match_round
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.deck import Deck, LazyDeck, StandardDeckFactory, JokerDeckFactory
+from src import metrics
+from src.game import Game
+from src.match import Match
+from src.match_batch import MatchBatch
+from src.session import play_game, majority_guess_policy, always_continue_policy
+
+SEED = 1234
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register a benchmark. The decorated function takes a seeded random.Random
+    and returns (operation, ops): a zero-argument callable and the number of
+    operations one call performs.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark("card_compare")
+def _card_compare(rng):
+    cards = list(JokerDeckFactory._prototype)
+    pairs = [(rng.choice(cards), rng.choice(cards)) for _ in range(1000)]
+
+    def run():
+        for a, b in pairs:
+            a < b
+            a > b
+            a == b
+    return run, 3 * len(pairs)
+
+
+@benchmark("card_sort")
+def _card_sort(rng):
+    cards = list(JokerDeckFactory._prototype)
+    rng.shuffle(cards)
+    return lambda: sorted(cards), 1
+
+
+@benchmark("standard_deck_create")
+def _standard_deck_create(rng):
+    factory = StandardDeckFactory(rng=rng)
+    return factory.create_deck, 1
+
+
+@benchmark("joker_deck_create")
+def _joker_deck_create(rng):
+    factory = JokerDeckFactory(rng=rng)
+    return factory.create_deck, 1
+
+
+@benchmark("lazy_deck_create")
+def _lazy_deck_create(rng):
+    factory = JokerDeckFactory(LazyDeck, rng=rng)
+    return factory.create_deck, 1
+
+
+@benchmark("lazy_match_round")
+def _lazy_match_round(rng):
+    return _match_round(rng, JokerDeckFactory(LazyDeck, rng=rng))
+
+
+@benchmark("new_match")
+def _new_match(rng, deck_factory=None):
+    # One short match: a fresh deck, as Game.new_match() makes, and two rounds
+    deck_factory = deck_factory or JokerDeckFactory(rng=rng)
+
+    def run():
+        match = Match(deck_factory=deck_factory)
+        for _ in range(2):
+            match.deal_cards()
+            match.is_guess_correct("g")
+    return run, 1
+
+
+@benchmark("lazy_new_match")
+def _lazy_new_match(rng):
+    return _new_match(rng, JokerDeckFactory(LazyDeck, rng=rng))
+
+
+@benchmark("deck_deal_add")
+def _deck_deal_add(rng):
+    deck = JokerDeckFactory(rng=rng).create_deck()
+
+    def run():
+        cards = [deck.deal_card() for _ in range(54)]
+        for card in cards:
+            deck.add_card(card)
+    return run, 2 * 54
+
+
+@benchmark("deck_contains")
+def _deck_contains(rng):
+    deck = Deck(rng.sample(JokerDeckFactory._prototype, 27), rng=rng)
+    probes = list(JokerDeckFactory._prototype)
+
+    def run():
+        for card in probes:
+            card in deck
+    return run, len(probes)
+
+
+@benchmark("match_round")
+def _match_round(rng, deck_factory=None):
+    match = Match(rng=rng, deck_factory=deck_factory)
+
+    def run():
+        for _ in range(100):
+            match.deal_cards()
+            match.is_guess_correct("g")
+            match.double_reward()
+            match.reset_reward()
+    return run, 100
+
+
+@benchmark("match_round_metrics_disabled")
+def _match_round_metrics_disabled(rng):
+    # Turning metrics on and off again must leave match_round's speed unchanged
+    metrics.enable(metrics.Registry())
+    metrics.disable()
+    return _match_round(rng)
+
+
+@benchmark("match_round_metrics_enabled")
+def _match_round_metrics_enabled(rng):
+    run, ops = _match_round(rng)
+    registry = metrics.Registry()
+
+    def instrumented():
+        metrics.enable(registry)
+        try:
+            run()
+        finally:
+            metrics.disable()
+    return instrumented, ops
+
+
+@benchmark("match_batch_round")
+def _match_batch_round(rng):
+    batch = MatchBatch(10000, rng=np.random.default_rng(rng.getrandbits(32)))
+
+    def run():
+        batch.active[:] = True
+        batch.rewards[:] = batch.initial_reward
+        batch.deal()
+        batch.step(batch.player > batch.house)
+        batch.double()
+    return run, len(batch)
+
+
+@benchmark("game_session")
+def _game_session(rng):
+    def run():
+        play_game(Game(rng=rng), majority_guess_policy, always_continue_policy)
+    return run, 1
+
+
+def measure(name, repeat=5, min_time=0.2):
+    """Run one benchmark and return {'ops_per_sec', 'peak_bytes', 'alloc_blocks', 'alloc_bytes'}."""
+    run, ops = BENCHMARKS[name](random.Random(SEED))
+    run()  # warm up
+
+    # Pick a loop count that takes at least min_time per repeat
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    start_bytes = tracemalloc.get_traced_memory()[0]
+    result = run()
+    peak = tracemalloc.get_traced_memory()[1] - start_bytes
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    allocated = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    return {"ops_per_sec": loops * ops / best, "peak_bytes": peak,
+            "alloc_blocks": sum(stat.count_diff for stat in allocated),
+            "alloc_bytes": sum(stat.size_diff for stat in allocated)}
+
+
+def find_regressions(results, baseline, threshold, names=None):
+    """Return [(name, current, baseline)] for benchmarks slower than baseline * (1 - threshold)."""
+    regressions = []
+    for name in names or results:
+        if name not in results or name not in baseline:
+            continue
+        current = results[name]["ops_per_sec"]
+        expected = baseline[name]["ops_per_sec"]
+        if current < expected * (1 - threshold):
+            regressions.append((name, current, expected))
+    return regressions
+
+
+def missing_benchmarks(results, baseline, names):
+    """Return the names in `names` that have no result or no baseline entry to compare."""
+    return [name for name in names if name not in results or name not in baseline]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths.")
+    parser.add_argument('names', nargs='*', help="Benchmarks to run (default: all).")
+    parser.add_argument('--save', help="Write the results to this JSON file.")
+    parser.add_argument('--compare', help="JSON baseline to compare against.")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Allowed slowdown as a fraction of the baseline (default: 0.2).")
+    parser.add_argument('--check', nargs='*', default=None,
+                        help="Benchmarks that fail the run on regression (default: all run).")
+    parser.add_argument('--list', action='store_true', help="List benchmark names and exit.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = {}
+    for name in args.names or BENCHMARKS:
+        results[name] = measure(name)
+        result = results[name]
+        print(f"{name:<30} {result['ops_per_sec']:>14,.0f} ops/s {result['peak_bytes']:>10,} B peak "
+              f"{result['alloc_blocks']:>6,} blocks {result['alloc_bytes']:>8,} B kept")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold, args.check)
+        for name, current, expected in regressions:
+            print(f"REGRESSION {name}: {current:,.0f} ops/s vs baseline {expected:,.0f} ops/s")
+        # A checked benchmark that was not run or has no baseline fails the gate
+        missing = missing_benchmarks(results, baseline, args.check or [])
+        for name in missing:
+            print(f"MISSING {name}: no result or no baseline to compare")
+        for name in missing_benchmarks(results, baseline, [] if args.check else results):
+            print(f"WARNING {name}: not in the baseline, not compared")
+        if regressions or missing:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
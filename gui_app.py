@@ -1,18 +1,13 @@
 import tkinter as tk
 from src.game import Game
 from src.match import Match
+from src.solver import OptimalStopSolver
+
+from src.log_queue import start_queued_logging
+from src.gui_worker import BackgroundRunner, WidgetBatcher
 
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # Or DEBUG for more detailed info
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler("number_guessing_game.log"),  # Logs to a file
-        logging.StreamHandler()               # Also prints to console
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
@@ -25,8 +20,14 @@ class GUIApp:
         self.WIN_THRESHOLD = 50
         self.LOSE_THRESHOLD = 30
 
-        self.game = Game(self.STARTING_POINTS, self.MATCH_COST, self.WIN_THRESHOLD, self.LOSE_THRESHOLD)
+        self.game = Game(self.STARTING_POINTS, self.MATCH_COST, self.WIN_THRESHOLD, self.LOSE_THRESHOLD,
+                         history_size=1000)
         self.match = None
+        self.solver = OptimalStopSolver()
+
+        # Game computation runs on a worker thread; label text changes are applied once per frame
+        self.runner = BackgroundRunner(root)
+        self.labels = WidgetBatcher(root)
 
         # GUI elements
         self.points_label = tk.Label(root, text=f"Points: {self.game.points}")
@@ -59,87 +60,155 @@ class GUIApp:
 
     def update_points(self):
         """Update the points display."""
-        self.points_label.config(text=f"Points: {self.game.points}")
+        self.labels.config(self.points_label, text=f"Points: {self.game.points}")
 
     def start_match(self):
         """Start a new match if possible."""
-        logger.info(f"Attempting to start a new match. Current point is {self.game.points}")
+        if self.runner.busy:
+            return
+        logger.info("Attempting to start a new match. Current point is %s", self.game.points)
         if not self.game.can_play_match():
             logger.warning("Not enough points to play a new match.")
-            self.status_label.config(text=f"Not enough points to play (need at least {self.game.lose_threshold})!")
+            self.labels.config(self.status_label,
+                               text=f"Not enough points to play (need at least {self.game.lose_threshold})!")
             return
         if not self.game.pay_for_match():
             logger.error("Payment for match failed unexpectedly.")
-            self.status_label.config(text="Error paying for match!")
+            self.labels.config(self.status_label, text="Error paying for match!")
             return
 
-        self.match = Match()
-        house_card = self.match.deal_cards()
-        logger.info(f"House card dealt: {house_card}")
         self.update_points()
-        self.status_label.config(text="Guess if your card is greater or less.")
-        self.card_label.config(text=f"House's Card: {house_card}")
         self.start_button.pack_forget()
+        # Building and shuffling the deck happens on the worker thread
+        self.runner.submit(self._deal_new_match, self._show_new_match, on_error=self._deal_failed)
+
+    def _deal_new_match(self):
+        """Worker thread: create a match and deal its first cards."""
+        match = Match()
+        house_card = match.deal_cards()
+        logger.info("House card dealt: %s", house_card)
+        return match, house_card
+
+    def _deal_failed(self, error):
+        """No match was dealt: refund it and offer the Start button again."""
+        logger.error("Dealing a new match failed", exc_info=error)
+        self.game.points += self.game.match_cost
+        self.update_points()
+        self.labels.config(self.status_label, text="Could not deal a match. Click 'Start Match' to try again.")
+        self.start_button.pack()
+
+    def _show_new_match(self, result):
+        self.match, house_card = result
+        self.labels.config(self.status_label, text="Guess if your card is greater or less.")
+        self.labels.config(self.card_label, text=f"House's Card: {house_card}")
         self.guess_frame.pack()
         self.decision_frame.pack_forget()
 
     def make_guess(self, guess):
         """Process the user's guess."""
+        if self.runner.busy:
+            return
+        self.runner.submit(self._evaluate_guess, self._show_guess_result, guess, on_error=self._guess_failed)
+
+    def _evaluate_guess(self, guess):
+        """Worker thread: check the guess and work out the advice for a correct one."""
         player_card = self.match.reveal_player_card()
-        logger.info(f"Player guessed '{guess}'")
-        logger.info(f"House card: {self.match.house_card}, Player card: {player_card}")
-        self.card_label.config(text=f"House's Card: {self.match.house_card}\nYour Card: {player_card}")
-        if self.match.is_guess_correct(guess):
+        logger.info("Player guessed '%s'", guess)
+        logger.info("House card: %s, Player card: %s", self.match.house_card, player_card)
+        correct = self.match.is_guess_correct(guess)
+        advice = None
+        if correct:
             logger.info("Guess is correct.")
-            if self.match.get_reward() >= self.match.win_threshold:
-                self.status_label.config(text=f"Correct! Reward reached {self.match.get_reward()}!")
+            if self.match.get_reward() < self.match.win_threshold:
+                advice = "continue" if self.solver.should_continue(self.match) else "stop"
+        else:
+            logger.info("Guess is wrong! Match ended.")
+        return player_card, correct, advice
+
+    def _guess_failed(self, error):
+        """The guess could not be checked: let the player guess again."""
+        logger.error("Evaluating the guess failed", exc_info=error)
+        self.labels.config(self.status_label, text="Something went wrong. Please guess again.")
+        self.decision_frame.pack_forget()
+        self.guess_frame.pack()
+
+    def _show_guess_result(self, result):
+        player_card, correct, advice = result
+        self.labels.config(self.card_label, text=f"House's Card: {self.match.house_card}\nYour Card: {player_card}")
+        if correct:
+            if advice is None:
+                self.labels.config(self.status_label, text=f"Correct! Reward reached {self.match.get_reward()}!")
                 self.end_match(self.match.get_reward())
             else:
-                self.status_label.config(text="Correct guess! Continue to double reward?")
+                self.labels.config(self.status_label, text=f"Correct guess! Continue to double reward? (advice: {advice})")
                 self.guess_frame.pack_forget()
                 self.decision_frame.pack()
         else:
-            logger.info("Guess is wrong! Match ended.")
-            self.status_label.config(text="Wrong guess! Match ended.")
+            self.labels.config(self.status_label, text="Wrong guess! Match ended.")
             self.end_match(0)
 
     def continue_match(self):
         """Continue the match by doubling the reward."""
+        if self.runner.busy:
+            return
+        self.runner.submit(self._double_and_deal, self._show_next_round, on_error=self._continue_failed)
+
+    def _double_and_deal(self):
+        """Worker thread: double the reward and deal the next cards."""
         self.match.double_reward()
-        logger.info(f"Reward doubled to {self.match.get_reward()}")
+        logger.info("Reward doubled to %s", self.match.get_reward())
         house_card = self.match.deal_cards()
-        logger.info(f"House card dealt: {house_card}")
-        self.status_label.config(text=f"Reward doubled to {self.match.get_reward()}. Guess again.")
-        self.card_label.config(text=f"House's Card: {house_card}")
+        logger.info("House card dealt: %s", house_card)
+        return house_card
+
+    def _continue_failed(self, error):
+        """The next round could not be dealt: end the match with its current reward."""
+        logger.error("Dealing the next round failed", exc_info=error)
+        self.labels.config(self.status_label, text=f"Could not deal the next round. "
+                                                   f"Match ended with reward {self.match.get_reward()}.")
+        self.end_match(self.match.get_reward())
+
+    def _show_next_round(self, house_card):
+        self.labels.config(self.status_label, text=f"Reward doubled to {self.match.get_reward()}. Guess again.")
+        self.labels.config(self.card_label, text=f"House's Card: {house_card}")
         self.decision_frame.pack_forget()
         self.guess_frame.pack()
 
     def stop_match(self):
         """Stop the match and take the current reward."""
-        logger.info(f"Player stopped match with reward {self.match.get_reward()}")
-        self.status_label.config(text=f"Match stopped with reward {self.match.get_reward()}.")
+        if self.runner.busy:
+            return
+        logger.info("Player stopped match with reward %s", self.match.get_reward())
+        self.labels.config(self.status_label, text=f"Match stopped with reward {self.match.get_reward()}.")
         self.end_match(self.match.get_reward())
 
     def end_match(self, reward):
         """End the match, update points, and check win/lose conditions."""
         self.game.points += reward
+        self.game.record_match(self.match)
         self.update_points()
         self.guess_frame.pack_forget()
         self.decision_frame.pack_forget()
         self.start_button.pack()
 
         if self.game.check_win():
-            logger.info(f"Player wins the game with {self.game.points} points")
-            self.status_label.config(text="Congratulations! You win the game!")
+            logger.info("Player wins the game with %s points", self.game.points)
+            self.labels.config(self.status_label, text="Congratulations! You win the game!")
             self.start_button.config(state=tk.DISABLED)
         elif not self.game.can_play_match():
-            logger.info(f"Player doesn't have enough points to continue ({self.game.points} points)")
-            self.status_label.config(text="Game over: Not enough points to continue.")
+            logger.info("Player doesn't have enough points to continue (%s points)", self.game.points)
+            self.labels.config(self.status_label, text="Game over: Not enough points to continue.")
             self.start_button.config(state=tk.DISABLED)
         else:
-            self.status_label.config(text="Click 'Start Match' for a new match.")
+            self.labels.config(self.status_label, text="Click 'Start Match' for a new match.")
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = GUIApp(root)
-    root.mainloop()
\ No newline at end of file
+    # Log through a background thread so file writes never block the Tk event loop
+    log_listener = start_queued_logging("number_guessing_game.log")
+    try:
+        root = tk.Tk()
+        app = GUIApp(root)
+        root.mainloop()
+        app.runner.shutdown()
+    finally:
+        log_listener.stop()
\ No newline at end of file
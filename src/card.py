@@ -2,39 +2,99 @@ from functools import total_ordering
 
 @total_ordering
 class Card:
+    """
+    A playing card.
+
+    Cards are flyweights: there is exactly one instance per (value, suit) pair,
+    so `Card('A', 'Spade') is Card('A', 'Spade')`. Each instance carries a small
+    integer `ordinal` (value rank * 5 + suit rank, suit rank 0 for no suit) that
+    orders cards by value first and suit second, which keeps comparison and
+    hashing down to integer operations.
+    """
     _VALUES = {'A': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8,
                '9': 9, '10': 10, 'J': 11, 'Q': 12, 'K': 13, 'Black Joker': 14, 'Red Joker': 15}
     _SUITS = {'Spade': 1, 'Club': 2, 'Diamond': 3, 'Heart': 4}
 
-    def __init__(self, value, suit=None):
-        if value not in self._VALUES:
+    # Ordinals fit in 0 <= ordinal < ORDINAL_LIMIT (one byte per card code).
+    ORDINAL_LIMIT = (max(_VALUES.values()) + 1) * 5
+
+    __slots__ = ('value', 'suit', 'ordinal', '_value_rank', '_suit_rank', '_hash')
+
+    _interned = {}
+    _by_ordinal = [None] * ORDINAL_LIMIT
+
+    def __new__(cls, value, suit=None):
+        card = cls._interned.get((value, suit))
+        if card is not None:
+            return card
+        if value not in cls._VALUES:
             raise ValueError(f"Invalid card value: {value}")
-        if suit is not None and suit not in self._SUITS:
+        if suit is not None and suit not in cls._SUITS:
             raise ValueError(f"Invalid card suit: {suit}")
-        self.value = value
-        self.suit = suit
+
+        card = object.__new__(cls)
+        value_rank = cls._VALUES[value]
+        suit_rank = cls._SUITS[suit] if suit is not None else 0
+        ordinal = value_rank * 5 + suit_rank
+        object.__setattr__(card, 'value', value)
+        object.__setattr__(card, 'suit', suit)
+        object.__setattr__(card, 'ordinal', ordinal)
+        object.__setattr__(card, '_value_rank', value_rank)
+        object.__setattr__(card, '_suit_rank', suit_rank)
+        object.__setattr__(card, '_hash', hash(ordinal))
+        cls._interned[(value, suit)] = card
+        cls._by_ordinal[ordinal] = card
+        return card
+
+    @classmethod
+    def from_ordinal(cls, ordinal):
+        """Return the card with the given ordinal. Raises ValueError if none exists."""
+        card = cls._by_ordinal[ordinal] if 0 <= ordinal < cls.ORDINAL_LIMIT else None
+        if card is None:
+            raise ValueError(f"Invalid card ordinal: {ordinal}")
+        return card
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card instances are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card instances are immutable.")
+
+    def __reduce__(self):
+        # Unpickling goes back through __new__ and lands on the interned instance.
+        return (Card, (self.value, self.suit))
 
     def __eq__(self, other):
         if not isinstance(other, Card):
             return NotImplemented
+        # Cards are interned, so equal cards are the same object.
+        return self is other
 
-        if (self.suit is None) != (other.suit is None):
-            return False
-
-        if self.suit is not None:
-            return (self._VALUES[self.value] == self._VALUES[other.value] and
-                    self._SUITS[self.suit] == self._SUITS[other.suit])
-        return self._VALUES[self.value] == self._VALUES[other.value]
+    def __hash__(self):
+        return self._hash
 
     def __lt__(self, other):
         if not isinstance(other, Card):
             return NotImplemented
+        # A card without a suit never ranks below a suited card of the same value.
+        return self.ordinal < other.ordinal and (
+            self._suit_rank != 0 or self._value_rank != other._value_rank)
 
-        if self._VALUES[self.value] != self._VALUES[other.value]:
-            return self._VALUES[self.value] < self._VALUES[other.value]
-        if self.suit is not None and other.suit is not None:
-            return self._SUITS[self.suit] < self._SUITS[other.suit]
-        return False
+    def __gt__(self, other):
+        if not isinstance(other, Card):
+            return NotImplemented
+        # Mirrors total_ordering's "not less and not equal", which makes a card
+        # without a suit rank above a suited card of the same value.
+        return self.ordinal > other.ordinal or (
+            self._suit_rank == 0 and other._suit_rank != 0 and self._value_rank == other._value_rank)
 
     def __repr__(self):
         return f"{self.value} of {self.suit}" if self.suit else f"{self.value}"
+
+
+# Intern every valid card up front so lookups by ordinal always succeed.
+for _value in Card._VALUES:
+    Card(_value)
+    for _suit in Card._SUITS:
+        Card(_value, _suit)
+del _value, _suit
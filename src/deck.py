@@ -1,16 +1,27 @@
 from .card import Card # Assuming Card class is in a 'card' module
+from .rank_index import RankIndex
+from array import array
+from collections import deque
+from itertools import product
 import random
+import threading
+import time
 
 class Deck:
-    def __init__(self, cards, shuffle_on_init=True):
+    def __init__(self, cards, shuffle_on_init=True, rng=None, index=None):
+        # Anything with a shuffle() method: random.Random, numpy.random.Generator, ...
+        self._rng = rng if rng is not None else random
         # Initialize _cards as a list of Card objects
         self._cards = list(cards)
+        # Counts of the remaining cards by rank, kept in step with _cards.
+        # Factories pass the prototype's index, which is copied instead of rebuilt.
+        self._index = index.copy() if index is not None else RankIndex(self._cards)
         if shuffle_on_init:
             self.shuffle()
 
     def shuffle(self):
         """Shuffles the cards in the deck randomly."""
-        random.shuffle(self._cards)
+        self._rng.shuffle(self._cards)
 
     def deal_card(self):
         """
@@ -19,7 +30,9 @@ class Deck:
         """
         if not self._cards:
             raise IndexError("Cannot deal card from an empty deck.")
-        return self._cards.pop()
+        card = self._cards.pop()
+        self._index.remove(card)
+        return card
 
     def add_card(self, card):
         """
@@ -30,6 +43,7 @@ class Deck:
         if not isinstance(card, Card):
             raise TypeError("Only Card objects can be added to the deck.")
         self._cards.append(card)
+        self._index.add(card)
 
     def __len__(self):
         """
@@ -49,14 +63,178 @@ class Deck:
         if not isinstance(card, Card):
             # If the item is not a Card, it cannot be in the deck
             return False
-        return card in self._cards
+        return card in self._index
+
+    def cut_card_reached(self):
+        """Returns True if the deck should be replaced before the next deal (see Shoe)."""
+        return False
+
+    def count_greater(self, card):
+        """Returns the number of cards in the deck that rank above the given card."""
+        return self._index.count_greater(card)
+
+    def count_less(self, card):
+        """Returns the number of cards in the deck that rank below the given card."""
+        return self._index.count_less(card)
+
+    def rank_counts(self):
+        """Returns a new list with the number of remaining cards of each ordinal (see Card.ordinal)."""
+        return list(self._index.counts)
 
     def __repr__(self):
         """Returns a string representation of the Deck."""
         return f"Deck with {len(self)} cards remaining."
 
+class CompactDeck(Deck):
+    """
+    Deck that stores cards as one-byte codes (`Card.ordinal`) in an array('B').
+
+    A presence bitmask over ordinals makes `in` checks O(1), and the codes can be
+    exported with `to_bytes()` and restored with `from_bytes()` without creating
+    per-card objects. The rank index is kept in array('H') rather than lists, so
+    a deck holds at most 65535 cards.
+    """
+    def __init__(self, cards, shuffle_on_init=True, rng=None, index=None):
+        self._rng = rng if rng is not None else random
+        self._init_codes(array('B', [card.ordinal for card in cards]), index)
+        if shuffle_on_init:
+            self.shuffle()
+
+    def _init_codes(self, codes, index=None):
+        self._codes = codes
+        self._index = (index if index is not None else RankIndex.from_ordinals(codes)).copy('H')
+        self._mask = 0
+        for ordinal, count in enumerate(self._index.counts):
+            if count:
+                self._mask |= 1 << ordinal
+
+    @classmethod
+    def from_bytes(cls, data, rng=None):
+        """
+        Creates a deck from card codes produced by `to_bytes()`, keeping their order.
+        Raises ValueError if a code is not a valid card ordinal.
+        """
+        codes = array('B', data)
+        for ordinal in set(codes):
+            Card.from_ordinal(ordinal)
+        deck = cls.__new__(cls)
+        deck._rng = rng if rng is not None else random
+        deck._init_codes(codes)
+        return deck
+
+    def to_bytes(self):
+        """Returns the card codes in deck order, bottom card last."""
+        return self._codes.tobytes()
+
+    @property
+    def _cards(self):
+        """The cards in deck order, as a new list."""
+        from_ordinal = Card.from_ordinal
+        return [from_ordinal(ordinal) for ordinal in self._codes]
+
+    def shuffle(self):
+        """Shuffles the cards in the deck randomly."""
+        self._rng.shuffle(self._codes)
+
+    def deal_card(self):
+        """
+        Deals a single card from the bottom of the deck.
+        Raises IndexError if the deck is empty.
+        """
+        if not self._codes:
+            raise IndexError("Cannot deal card from an empty deck.")
+        card = Card.from_ordinal(self._codes.pop())
+        self._index.remove(card)
+        if not self._index.counts[card.ordinal]:
+            self._mask &= ~(1 << card.ordinal)
+        return card
+
+    def add_card(self, card):
+        """
+        Adds a single card to the bottom of the deck.
+        Args:
+            card (Card): The Card object to add to the deck.
+        """
+        if not isinstance(card, Card):
+            raise TypeError("Only Card objects can be added to the deck.")
+        self._codes.append(card.ordinal)
+        self._index.add(card)
+        self._mask |= 1 << card.ordinal
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __contains__(self, card):
+        if not isinstance(card, Card):
+            return False
+        return (self._mask >> card.ordinal) & 1 == 1
+
+class LazyDeck(Deck):
+    """
+    Deck that shuffles as it deals.
+
+    `shuffle()` only marks every card as unshuffled; each `deal_card()` then does
+    one Fisher-Yates step, swapping a random unshuffled card to the bottom and
+    dealing it. Creating or resetting a deck costs no shuffle at all (factory
+    decks copy a prototype rank index), and the cards still come out in a
+    uniformly random order. Decks that are replaced before they run out, like
+    the fresh deck of every Match in a Game, never pay for the cards they
+    did not deal. Cards added after a
+    shuffle are dealt first, as with Deck.
+    The rng needs randrange() (random.Random) or integers() (numpy Generator).
+    """
+    def __init__(self, cards, shuffle_on_init=True, rng=None, index=None):
+        # _cards[:_pending] is still to be shuffled
+        self._pending = 0
+        super().__init__(cards, shuffle_on_init, rng, index)
+        if hasattr(self._rng, "_randbelow"):
+            # random.Random: the same unbiased draw its shuffle() uses, without randrange's checks
+            self._randbelow = self._rng._randbelow
+        elif hasattr(self._rng, "randrange"):
+            self._randbelow = self._rng.randrange
+        else:
+            self._randbelow = lambda n: int(self._rng.integers(n))
+
+    def shuffle(self):
+        """Marks every card as unshuffled; they are shuffled one at a time as they are dealt."""
+        self._pending = len(self._cards)
+
+    def settle(self):
+        """Finishes the pending shuffle, so `_cards` is in dealing order."""
+        cards = self._cards
+        for last in range(self._pending - 1, 0, -1):
+            j = self._randbelow(last + 1)
+            cards[j], cards[last] = cards[last], cards[j]
+        self._pending = 0
+
+    def deal_card(self):
+        """
+        Deals a single card from the bottom of the deck.
+        Raises IndexError if the deck is empty.
+        """
+        cards = self._cards
+        if not cards:
+            raise IndexError("Cannot deal card from an empty deck.")
+        last = len(cards) - 1
+        if last < self._pending:
+            j = self._randbelow(last + 1)
+            cards[j], cards[last] = cards[last], cards[j]
+            self._pending = last
+        card = cards.pop()
+        self._index.remove(card)
+        return card
+
 class DeckFactory:
     """Abstract base class for creating decks."""
+    def __init__(self, deck_class=Deck, rng=None):
+        """
+        Args:
+            deck_class (type): Deck implementation to build, e.g. Deck or CompactDeck.
+            rng: Random source passed to every deck (the global random module if None).
+        """
+        self.deck_class = deck_class
+        self.rng = rng
+
     def create_deck(self, shuffle_on_init=True):
         """
         Creates and returns a new deck.
@@ -75,10 +253,17 @@ class EmptyDeckFactory(DeckFactory):
             Deck: An empty deck.
         """
         cards = []
-        return Deck(cards)
+        return self.deck_class(cards, rng=self.rng)
 
 class StandardDeckFactory(DeckFactory):
     """Factory for creating a standard 52-card deck."""
+    SUITS = ['Spade', 'Club', 'Diamond', 'Heart']
+    VALUES = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+    # Cards are immutable flyweights, so every deck can share one prototype list.
+    _prototype = tuple(Card(value, suit) for suit, value in product(SUITS, VALUES))
+    # Each deck starts from a copy of the prototype's rank index
+    _prototype_index = RankIndex(_prototype)
+
     def create_deck(self, shuffle_on_init=True):
         """
         Creates a standard 52-card deck (A-K of Spades, Clubs, Diamonds, Hearts).
@@ -87,16 +272,14 @@ class StandardDeckFactory(DeckFactory):
         Returns:
             Deck: A new standard deck.
         """
-        cards = []
-        suits = ['Spade', 'Club', 'Diamond', 'Heart']
-        values = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-        for suit in suits:
-            for value in values:
-                cards.append(Card(value, suit))
-        return Deck(cards, shuffle_on_init)
-
-class JokerDeckFactory(DeckFactory):
+        return self.deck_class(self._prototype, shuffle_on_init, self.rng, index=self._prototype_index)
+
+class JokerDeckFactory(StandardDeckFactory):
     """Factory for creating a deck with standard cards plus two Jokers."""
+    # Note: No suit for Jokers
+    _prototype = StandardDeckFactory._prototype + (Card('Black Joker'), Card('Red Joker'))
+    _prototype_index = RankIndex(_prototype)
+
     def create_deck(self, shuffle_on_init=True):
         """
         Creates a deck with 52 standard cards and two Jokers (Black and Red).
@@ -105,9 +288,100 @@ class JokerDeckFactory(DeckFactory):
         Returns:
             Deck: A new deck including Jokers.
         """
-        # Start with a standard deck's cards
-        standard_deck_cards = StandardDeckFactory().create_deck()._cards
-        cards = standard_deck_cards.copy() # Make a copy to avoid modifying the original list
-        cards.append(Card('Black Joker')) # Note: No suit for Jokers
-        cards.append(Card('Red Joker'))
-        return Deck(cards, shuffle_on_init) # Pass shuffle_on_init to the Deck constructor
+        return self.deck_class(self._prototype, shuffle_on_init, self.rng, index=self._prototype_index)
+
+class DeckPool(DeckFactory):
+    """
+    Factory that hands out pre-shuffled decks from a bounded pool.
+
+    Decks are built by another factory and the pool is topped up by a background
+    thread, so `create_deck()` is a constant-time pop whenever the pool is not empty.
+    When it is empty the deck is built on the spot.
+    """
+    def __init__(self, factory=None, size=8, max_age=None, background=True):
+        """
+        Args:
+            factory (DeckFactory): Factory used to build the decks (JokerDeckFactory by default).
+            size (int): Maximum number of decks kept ready.
+            max_age (float): Seconds after which a pooled deck is evicted instead of dealt, or None.
+            background (bool): If True, refill the pool from a daemon thread.
+        """
+        self.factory = factory if factory is not None else JokerDeckFactory()
+        super().__init__(self.factory.deck_class, self.factory.rng)
+        self.size = size
+        self.max_age = max_age
+        self._decks = deque()  # (created_at, deck), oldest first
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+        self.fill()
+        if background:
+            self._thread = threading.Thread(target=self._refill_forever, name="DeckPool", daemon=True)
+            self._thread.start()
+
+    def __len__(self):
+        """Returns the number of decks ready in the pool."""
+        with self._condition:
+            return len(self._decks)
+
+    def create_deck(self, shuffle_on_init=True):
+        """
+        Returns a shuffled deck from the pool, or a new one if the pool is empty.
+        Args:
+            shuffle_on_init (bool): If False, bypasses the pool and returns an unshuffled deck.
+        """
+        if shuffle_on_init:
+            with self._condition:
+                self._evict_stale()
+                if self._decks:
+                    deck = self._decks.popleft()[1]
+                    self._condition.notify()
+                    return deck
+        return self.factory.create_deck(shuffle_on_init)
+
+    def fill(self):
+        """Tops the pool up to its size on the calling thread."""
+        while True:
+            with self._condition:
+                if self._closed or len(self._decks) >= self.size:
+                    return
+            self._put(self.factory.create_deck())
+
+    def resize(self, size):
+        """Changes the pool size, evicting the oldest decks if it shrinks."""
+        with self._condition:
+            self.size = size
+            while len(self._decks) > size:
+                self._decks.popleft()
+            self._condition.notify()
+
+    def close(self):
+        """Stops the background refill and drops all pooled decks."""
+        with self._condition:
+            self._closed = True
+            self._decks.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _put(self, deck):
+        with self._condition:
+            if not self._closed and len(self._decks) < self.size:
+                self._decks.append((time.monotonic(), deck))
+
+    def _evict_stale(self):
+        if self.max_age is None:
+            return
+        oldest_allowed = time.monotonic() - self.max_age
+        while self._decks and self._decks[0][0] < oldest_allowed:
+            self._decks.popleft()
+
+    def _refill_forever(self):
+        while True:
+            with self._condition:
+                while not self._closed and len(self._decks) >= self.size:
+                    self._condition.wait()
+                if self._closed:
+                    return
+            # Build outside the lock so create_deck() never waits on a shuffle.
+            self._put(self.factory.create_deck())
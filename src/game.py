@@ -1,11 +1,33 @@
+from .history import MatchHistory
 from .match import Match
 
 class Game:
-    def __init__(self, starting_points=60, match_cost=25, win_threshold=1000, lose_threshold=30):
+    def __init__(self, starting_points=60, match_cost=25, win_threshold=1000, lose_threshold=30, rng=None,
+                 journal=None, history_size=None):
         self._points = starting_points
         self.match_cost = match_cost
         self.win_threshold = win_threshold
         self.lose_threshold = lose_threshold
+        self.rng = rng
+        self.matches_played = 0
+        # Opt-in: the last history_size matches, with rolling statistics
+        self.history = MatchHistory(history_size) if history_size else None
+        # Optional src.journal.Journal; the game and its matches record their events in it
+        self.journal = journal.recorder(journal.new_session()) if journal is not None else None
+        if self.journal is not None:
+            self.journal.points(starting_points)
+
+    def new_match(self, **kwargs):
+        """Create a Match that deals from this game's random source."""
+        self.matches_played += 1
+        if self.journal is not None:
+            kwargs.setdefault("journal", self.journal.for_match(self.matches_played))
+        return Match(rng=self.rng, **kwargs)
+
+    def record_match(self, match):
+        """Add a finished match's reward and rounds to the history, if the game keeps one."""
+        if self.history is not None:
+            self.history.add(match.get_reward(), match.rounds)
 
     def can_play_match(self):
         """Check if there are enough points to play a match."""
@@ -31,6 +53,8 @@ class Game:
     def points(self, value):
         """Assignment to points."""
         self._points = value
+        if self.journal is not None:
+            self.journal.points(value)
 
     # Deprecated
     def add_reward(self, reward):
@@ -0,0 +1,89 @@
+"""
+Helpers that keep work off the Tk event loop.
+
+Tk widgets may only be touched from the thread running `mainloop()`.
+`BackgroundRunner` runs game computation on a worker thread and hands the
+results back to the Tk thread by polling a queue with `root.after`, and
+`WidgetBatcher` merges widget updates so the UI redraws at most once per frame.
+Both only need `root.after(ms, callback)`, so they can be driven headless.
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+FRAME_MS = 16
+
+
+class BackgroundRunner:
+    """
+    Runs callables on worker threads and calls their completion callbacks on the Tk thread.
+    With the default single worker, jobs run one at a time in submission order.
+    """
+    def __init__(self, root, max_workers=1, poll_ms=FRAME_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gui-worker")
+        self._done = queue.SimpleQueue()
+        self._pending = 0
+
+    @property
+    def busy(self):
+        """True while a submitted job has not had its callback run yet."""
+        return self._pending > 0
+
+    def submit(self, fn, on_done, *args, on_error=None):
+        """
+        Run `fn(*args)` on a worker, then `on_done(result)` on the Tk thread.
+        If `fn` raises, `on_error(exception)` is called instead, or the exception is re-raised in the Tk thread.
+        """
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda f: self._done.put((f, on_done, on_error)))
+        self._pending += 1
+        if self._pending == 1:
+            self.root.after(self.poll_ms, self._poll)
+        return future
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    future, on_done, on_error = self._done.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending -= 1
+                error = future.exception()
+                if error is None:
+                    on_done(future.result())
+                elif on_error is not None:
+                    on_error(error)
+                else:
+                    raise error
+        finally:
+            # Keep polling for the remaining jobs even if a callback raised
+            if self._pending:
+                self.root.after(self.poll_ms, self._poll)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class WidgetBatcher:
+    """Collects widget.config() options and applies them together once per frame."""
+    def __init__(self, root, frame_ms=FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self._pending = {}
+        self._scheduled = False
+
+    def config(self, widget, **options):
+        """Queue `widget.config(**options)`; later options for the same widget win."""
+        self._pending.setdefault(widget, {}).update(options)
+        if not self._scheduled:
+            self._scheduled = True
+            self.root.after(self.frame_ms, self.flush)
+
+    def flush(self):
+        """Apply every queued update now."""
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        for widget, options in pending.items():
+            widget.config(**options)
@@ -0,0 +1,97 @@
+"""
+Bounded match history with rolling statistics.
+
+`MatchHistory` keeps the last `capacity` matches in preallocated arrays used
+as a ring buffer, so its memory never grows. Window sums of rewards, squared
+rewards and wins are updated as matches are added and evicted, which makes
+the rolling mean, variance and win rate O(1). Rewards are integers, so these
+sums are exact. Streaks are counted over every match ever recorded.
+
+A match counts as won when it ends with a positive reward, i.e. the player
+stopped or reached the win threshold instead of guessing wrong.
+"""
+from array import array
+
+
+class MatchHistory:
+    """
+    Ring buffer of (reward, rounds, won) for the most recent matches.
+    Args:
+        capacity (int): Number of matches kept; older ones are evicted.
+    """
+    def __init__(self, capacity=1000):
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1.")
+        self.capacity = capacity
+        self.rewards = array('q', bytes(8 * capacity))
+        self.rounds = array('i', bytes(array('i').itemsize * capacity))
+        self.won = array('b', bytes(capacity))
+        self.start = 0  # index of the oldest match
+        self.total = 0  # matches ever recorded
+        self._sum = 0
+        self._sum_squares = 0
+        self._wins = 0
+        self.current_streak = 0  # > 0: consecutive wins, < 0: consecutive losses
+        self.longest_win_streak = 0
+        self.longest_loss_streak = 0
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def add(self, reward, rounds):
+        """Record one finished match."""
+        won = 1 if reward > 0 else 0
+        if self.total >= self.capacity:
+            # Evict the oldest match; its slot is reused below
+            index = self.start
+            old = self.rewards[index]
+            self._sum -= old
+            self._sum_squares -= old * old
+            self._wins -= self.won[index]
+            self.start = (index + 1) % self.capacity
+        else:
+            index = self.total
+        self.rewards[index] = reward
+        self.rounds[index] = rounds
+        self.won[index] = won
+        self._sum += reward
+        self._sum_squares += reward * reward
+        self._wins += won
+        self.total += 1
+
+        if won:
+            self.current_streak = self.current_streak + 1 if self.current_streak > 0 else 1
+            self.longest_win_streak = max(self.longest_win_streak, self.current_streak)
+        else:
+            self.current_streak = self.current_streak - 1 if self.current_streak < 0 else -1
+            self.longest_loss_streak = max(self.longest_loss_streak, -self.current_streak)
+
+    @property
+    def mean(self):
+        """Mean reward over the window."""
+        return self._sum / len(self) if self.total else 0.0
+
+    @property
+    def variance(self):
+        """Population variance of the reward over the window."""
+        n = len(self)
+        if not n:
+            return 0.0
+        return (n * self._sum_squares - self._sum * self._sum) / (n * n)
+
+    @property
+    def win_rate(self):
+        """Fraction of won matches over the window."""
+        return self._wins / len(self) if self.total else 0.0
+
+    def to_numpy(self):
+        """
+        Return (rewards, rounds, won) as NumPy views of the buffers, without copying.
+        Entries are in buffer order: once the buffer has wrapped, the oldest match
+        is at index `start`, so use numpy.roll(view, -history.start) for time order.
+        """
+        import numpy as np
+        n = len(self)
+        return (np.frombuffer(self.rewards, dtype=np.int64)[:n],
+                np.frombuffer(self.rounds, dtype=np.intc)[:n],
+                np.frombuffer(self.won, dtype=np.int8)[:n])
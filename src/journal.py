@@ -0,0 +1,202 @@
+"""
+Append-only binary journal of game events.
+
+The file starts with the 8-byte magic "NGJ1\\0\\0\\0\\0" and is only ever
+appended to. Every event after it is one fixed-size little-endian record:
+
+    session id (u32), match number (u32), round (u16),
+    event (u8), house card (u8), player card (u8), guess (u8), correct (u8),
+    pad, value (i64)
+
+Cards are stored as `Card.ordinal` (0 when absent), the guess as the ASCII
+code of its first character. `value` holds the new potential reward for
+REWARD events and the new point total for POINTS events.
+
+Reopening a journal scans its records in fixed-size chunks for the highest
+session id, so new sessions never reuse an id, even when sessions were
+interleaved.
+
+Pass a `Journal` to `Game(journal=...)`; the game and its matches then record
+every deal, guess, reward change and point change. `JournalReader` maps the
+file with NumPy and aggregates it chunk by chunk, so files far larger than
+memory can be analysed.
+"""
+import os
+import struct
+
+RECORD = struct.Struct("<IIHBBBBBxq")
+MAGIC = b"NGJ1\x00\x00\x00\x00"
+# Reads only the session id of a record
+_SESSION_ID = struct.Struct(f"<I{RECORD.size - 4}x")
+_SCAN_RECORDS = 1 << 14
+
+DEAL, GUESS, REWARD, POINTS = 1, 2, 3, 4
+
+
+class Journal:
+    """Writer appending event records to `path`."""
+    def __init__(self, path, buffer_size=1 << 16):
+        self._file = open(path, "ab", buffering=buffer_size)
+        self._last_session = 0
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        else:
+            with open(path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    self._file.close()
+                    raise ValueError(f"{path} is not a game journal.")
+                self._last_session = _highest_session(f)
+
+    def new_session(self):
+        """Return a session id not used earlier in this journal."""
+        self._last_session += 1
+        return self._last_session
+
+    def recorder(self, session_id, match_number=0):
+        return Recorder(self, session_id, match_number)
+
+    def write(self, session_id, match_number, round_number, event, house=0, player=0, guess=0, correct=0,
+              value=0):
+        self._file.write(RECORD.pack(session_id, match_number, round_number, event, house, player, guess,
+                                     correct, value))
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _highest_session(f):
+    """Return the highest session id in the records after the current position, reading in chunks."""
+    highest = 0
+    chunk_size = RECORD.size * _SCAN_RECORDS
+    while True:
+        data = f.read(chunk_size)
+        # A torn record at the end of the file is ignored
+        usable = len(data) - len(data) % RECORD.size
+        if usable:
+            highest = max(highest, max(_SESSION_ID.iter_unpack(data[:usable]))[0])
+        if len(data) < chunk_size:
+            return highest
+
+
+class Recorder:
+    """Writes the events of one session (match number 0) or one match to a Journal."""
+    __slots__ = ("_journal", "_write", "session_id", "match_number", "round")
+
+    def __init__(self, journal, session_id, match_number=0):
+        self._journal = journal
+        self._write = journal.write
+        self.session_id = session_id
+        self.match_number = match_number
+        self.round = 0
+
+    def for_match(self, match_number):
+        """Return a recorder for one match of this session."""
+        return Recorder(self._journal, self.session_id, match_number)
+
+    def deal(self, house_card, player_card):
+        self.round += 1
+        self._write(self.session_id, self.match_number, self.round, DEAL,
+                    house_card.ordinal, player_card.ordinal)
+
+    def guess(self, house_card, player_card, guess, correct):
+        self._write(self.session_id, self.match_number, self.round, GUESS,
+                    house_card.ordinal if house_card else 0, player_card.ordinal if player_card else 0,
+                    ord(guess[:1]) if guess else 0, correct)
+
+    def reward(self, value):
+        self._write(self.session_id, self.match_number, self.round, REWARD, value=value)
+
+    def points(self, value):
+        self._write(self.session_id, self.match_number, self.round, POINTS, value=value)
+
+
+class JournalReader:
+    """
+    Memory-mapped, read-only view of a journal. Requires NumPy.
+    Args:
+        chunk_size (int): Records processed per step by the aggregations.
+    """
+    def __init__(self, path, chunk_size=1 << 20):
+        import numpy as np
+
+        self.dtype = np.dtype({
+            "names": ["session", "match", "round", "event", "house", "player", "guess", "correct", "value"],
+            "formats": ["<u4", "<u4", "<u2", "u1", "u1", "u1", "u1", "u1", "<i8"],
+            "offsets": [0, 4, 8, 10, 11, 12, 13, 14, 16],
+            "itemsize": RECORD.size,
+        })
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a game journal.")
+        count = (os.path.getsize(path) - len(MAGIC)) // RECORD.size
+        self.records = (np.memmap(path, dtype=self.dtype, mode="r", offset=len(MAGIC), shape=(count,))
+                        if count else np.empty(0, dtype=self.dtype))
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return len(self.records)
+
+    def chunks(self):
+        """Yield consecutive record arrays of at most chunk_size records (views, not copies)."""
+        for start in range(0, len(self.records), self.chunk_size):
+            yield self.records[start:start + self.chunk_size]
+
+    def replay(self, callback):
+        """Call `callback(session, match, round, event, house, player, guess, correct, value)` per record."""
+        for chunk in self.chunks():
+            for record in chunk.tolist():
+                callback(*record)
+
+    def event_counts(self):
+        """Return {event: count}."""
+        import numpy as np
+
+        counts = np.zeros(256, dtype=np.int64)
+        for chunk in self.chunks():
+            counts += np.bincount(chunk["event"], minlength=256)
+        return {event: int(counts[event]) for event in (DEAL, GUESS, REWARD, POINTS)}
+
+    def card_win_rates(self):
+        """Return {house card ordinal: (correct guesses, guesses)} over all GUESS events."""
+        import numpy as np
+
+        correct = np.zeros(256, dtype=np.int64)
+        total = np.zeros(256, dtype=np.int64)
+        for chunk in self.chunks():
+            guesses = chunk[chunk["event"] == GUESS]
+            total += np.bincount(guesses["house"], minlength=256)
+            correct += np.bincount(guesses["house"], weights=guesses["correct"], minlength=256).astype(np.int64)
+        return {int(card): (int(correct[card]), int(total[card])) for card in np.flatnonzero(total)}
+
+    def round_survival(self):
+        """Return {round: (correct guesses, guesses)}: how often each round of a match is won."""
+        import numpy as np
+
+        correct = np.zeros(1 << 16, dtype=np.int64)
+        total = np.zeros(1 << 16, dtype=np.int64)
+        for chunk in self.chunks():
+            guesses = chunk[chunk["event"] == GUESS]
+            total += np.bincount(guesses["round"], minlength=1 << 16)
+            correct += np.bincount(guesses["round"], weights=guesses["correct"], minlength=1 << 16).astype(np.int64)
+        return {int(round_number): (int(correct[round_number]), int(total[round_number]))
+                for round_number in np.flatnonzero(total)}
+
+    def reward_curve(self):
+        """Return {potential reward: times it was set} over all REWARD events."""
+        import numpy as np
+
+        counts = {}
+        for chunk in self.chunks():
+            values, hits = np.unique(chunk["value"][chunk["event"] == REWARD], return_counts=True)
+            for value, hit in zip(values.tolist(), hits.tolist()):
+                counts[value] = counts.get(value, 0) + hit
+        return dict(sorted(counts.items()))
@@ -0,0 +1,231 @@
+"""
+Load generator: many simulated players driving Game and Match concurrently.
+
+Each player runs on its own thread and plays the console app's cycle:
+`Game.pay_for_match`, then `Match.deal_cards`, `is_guess_correct` and
+`double_reward` until the match ends, then `Game.add_reward`. Each player
+pauses for a think time before every guess and every continue/stop
+decision. The engine calls are timed individually; think time is not part
+of any latency. Think times come from their own random stream, so changing
+them never changes the games a seed plays.
+
+`run_load()` runs one concurrency level and returns a `LoadReport` with
+p50/p95/p99 latency per action and overall throughput. `ramp()` repeats it
+at growing concurrency.
+
+    python -m src.loadtest --players 1,10,100 --think exp:0.005 --matches 20
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .deck import DeckPool
+from .game import Game
+from .rng import derive_seed, make_rng
+from .session import GUESSES, majority_guess_policy, always_continue_policy, ContinueBelow
+
+ACTIONS = ("pay_for_match", "deal_cards", "is_guess_correct", "double_reward", "add_reward")
+
+
+class ConstantThink:
+    """Think for the same time before every decision."""
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def __call__(self, rng):
+        return self.seconds
+
+
+class UniformThink:
+    """Think for a time drawn uniformly from [low, high]."""
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def __call__(self, rng):
+        return rng.uniform(self.low, self.high)
+
+
+class ExponentialThink:
+    """Think for an exponentially distributed time with the given mean."""
+    def __init__(self, mean):
+        self.mean = mean
+
+    def __call__(self, rng):
+        return rng.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+
+
+def parse_think(spec):
+    """
+    Parse a think-time spec: "0.01" or "const:0.01", "uniform:0:0.02", "exp:0.01" (seconds).
+    Raises ValueError for anything else.
+    """
+    kind, _, args = spec.partition(":")
+    if not args:
+        return ConstantThink(float(kind))
+    values = [float(value) for value in args.split(":")]
+    if kind == "const" and len(values) == 1:
+        return ConstantThink(*values)
+    if kind == "uniform" and len(values) == 2:
+        return UniformThink(*values)
+    if kind == "exp" and len(values) == 1:
+        return ExponentialThink(*values)
+    raise ValueError(f"Unknown think time: {spec}")
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list; 0.0 when empty."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class LoadReport:
+    """Latencies and throughput of one load run."""
+    def __init__(self, players, latencies, matches, games, elapsed):
+        self.players = players
+        self.latencies = {action: sorted(values) for action, values in latencies.items()}
+        self.matches = matches
+        self.games = games
+        self.elapsed = elapsed
+
+    @property
+    def actions(self):
+        return sum(len(values) for values in self.latencies.values())
+
+    @property
+    def actions_per_second(self):
+        return self.actions / self.elapsed if self.elapsed > 0 else float('inf')
+
+    @property
+    def matches_per_second(self):
+        return self.matches / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def percentiles(self, action):
+        """Return (p50, p95, p99) latency of `action` in seconds."""
+        values = self.latencies.get(action, [])
+        return percentile(values, 50), percentile(values, 95), percentile(values, 99)
+
+    def summary(self):
+        lines = [f"Players: {self.players}  games: {self.games}  matches: {self.matches}  "
+                 f"({self.matches_per_second:,.0f} matches/s, {self.actions_per_second:,.0f} actions/s)",
+                 f"  {'action':<18} {'count':>8} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}"]
+        for action in ACTIONS:
+            p50, p95, p99 = self.percentiles(action)
+            lines.append(f"  {action:<18} {len(self.latencies.get(action, [])):>8} "
+                         f"{p50 * 1e6:>9.1f} {p95 * 1e6:>9.1f} {p99 * 1e6:>9.1f}")
+        return "\n".join(lines)
+
+
+def _play(player_seed, max_matches, think, choose_guess, choose_continue, game_config, match_config):
+    """Play one player's game. Returns ({action: [latency]}, matches played)."""
+    rng = make_rng(player_seed)
+    think_rng = make_rng(derive_seed(player_seed, "think"))
+    latencies = {action: [] for action in ACTIONS}
+    clock = time.perf_counter
+    game = Game(rng=rng, **game_config)
+    while game.can_play_match() and game.matches_played < max_matches:
+        start = clock()
+        game.pay_for_match()
+        latencies["pay_for_match"].append(clock() - start)
+        match = game.new_match(**match_config)
+        while True:
+            start = clock()
+            match.deal_cards()
+            latencies["deal_cards"].append(clock() - start)
+            time.sleep(think(think_rng))
+            guess = choose_guess(match)
+            start = clock()
+            correct = match.is_guess_correct(guess)
+            latencies["is_guess_correct"].append(clock() - start)
+            if not correct:
+                match.remove_reward()
+                break
+            if match.get_reward() >= match.win_threshold:
+                break
+            time.sleep(think(think_rng))
+            if not choose_continue(match):
+                break
+            start = clock()
+            match.double_reward()
+            latencies["double_reward"].append(clock() - start)
+        start = clock()
+        game.add_reward(match.get_reward())
+        latencies["add_reward"].append(clock() - start)
+        game.record_match(match)
+        if game.check_win():
+            break
+    return latencies, game.matches_played
+
+
+def run_load(players, think=None, seed=0, max_matches=20, choose_guess=majority_guess_policy,
+             choose_continue=always_continue_policy, game_config=None, match_config=None):
+    """
+    Run `players` simulated players at once, one thread each, and wait for them all.
+    Args:
+        players (int): Number of concurrent players.
+        think (callable): think(rng) returns seconds to pause before each decision; no pause if None.
+        seed (int): Root seed; player i plays from `derive_seed(seed, i)`.
+        max_matches (int): Matches per player at most, so runs stay bounded.
+        choose_guess, choose_continue: Player callables, see `src.session`.
+        game_config (dict): Keyword arguments for `Game`.
+        match_config (dict): Keyword arguments for `Match`, e.g. a shared deck_factory.
+    Returns:
+        LoadReport: Per-action latencies and throughput.
+    """
+    think = think or ConstantThink(0.0)
+    game_config = game_config or {}
+    match_config = match_config or {}
+    latencies = {action: [] for action in ACTIONS}
+    matches = 0
+    start_line = threading.Barrier(players)
+
+    def player(index):
+        start_line.wait()
+        return _play(derive_seed(seed, index), max_matches, think, choose_guess, choose_continue,
+                     game_config, match_config)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=players) as executor:
+        for player_latencies, played in executor.map(player, range(players)):
+            for action, values in player_latencies.items():
+                latencies[action].extend(values)
+            matches += played
+    return LoadReport(players, latencies, matches, players, time.perf_counter() - start)
+
+
+def ramp(levels, **kwargs):
+    """Run `run_load` at each concurrency level in `levels`. Returns the list of reports."""
+    return [run_load(players, **kwargs) for players in levels]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive many concurrent simulated players through the engine.")
+    parser.add_argument('--players', default="1,10,100", help="Comma-separated concurrency levels.")
+    parser.add_argument('--think', type=parse_think, default=ConstantThink(0.0),
+                        help="Think time: 0.01, const:0.01, uniform:0:0.02 or exp:0.01 (seconds).")
+    parser.add_argument('--matches', type=int, default=20, help="Matches per player at most.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--guess', choices=sorted(GUESSES), default='majority')
+    parser.add_argument('--stop-at', type=int, default=None,
+                        help="Stop once the reward reaches this value (default: always continue).")
+    parser.add_argument('--deck-pool', type=int, default=0,
+                        help="Share one DeckPool of this size between all players (0: no pool).")
+    args = parser.parse_args(argv)
+
+    choose_continue = always_continue_policy if args.stop_at is None else ContinueBelow(args.stop_at)
+    pool = DeckPool(size=args.deck_pool) if args.deck_pool else None
+    try:
+        for players in (int(level) for level in args.players.split(",")):
+            report = run_load(players, args.think, args.seed, args.matches, GUESSES[args.guess], choose_continue,
+                              match_config={"deck_factory": pool} if pool is not None else None)
+            print(report.summary())
+    finally:
+        if pool is not None:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
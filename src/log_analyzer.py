@@ -0,0 +1,165 @@
+"""
+Streaming analyzer for the text log written by gui_app.py.
+
+Lines are read one at a time and matched against precompiled patterns, so
+memory use does not depend on the size of the log. Only the match currently
+being replayed is kept. With a checkpoint file the analyzer remembers the
+byte offset of the last complete line it read, together with its running
+totals, and a later run only reads what was appended since.
+
+Run with `python -m src.log_analyzer number_guessing_game.log --checkpoint log.ckpt`.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+
+_LINE = re.compile(
+    r"\[(?:INFO|WARNING|ERROR)\] (?:"
+    r"(?P<start>Attempting to start a new match)"
+    r"|House card dealt: (?P<house>.+)"
+    r"|Player guessed '(?P<guess>\w)'"
+    r"|Guess is (?P<result>correct|wrong)"
+    r"|Reward doubled to (?P<doubled>-?\d+)"
+    r"|Player stopped match with reward (?P<stopped>-?\d+)"
+    r"|Player wins the game with (?P<win>-?\d+) points"
+    r"|Player doesn't have enough points to continue \((?P<bankrupt>-?\d+) points\)"
+    r")"
+)
+
+
+class LogAnalyzer:
+    """
+    Rebuilds matches from log lines and keeps running totals.
+    Args:
+        initial_reward (int): Reward a match starts with (the log does not record it).
+    """
+    def __init__(self, initial_reward=20):
+        self.initial_reward = initial_reward
+        self.stats = {"matches": 0, "guesses": 0, "correct": 0, "total_reward": 0,
+                      "wins": 0, "bankruptcies": 0}
+        # The match being replayed: None, "guessing" or "correct" (awaiting continue/stop)
+        self.match_state = None
+        self.reward = 0
+
+    def _end_match(self, reward):
+        self.stats["matches"] += 1
+        self.stats["total_reward"] += reward
+        self.match_state = None
+
+    def _close_pending(self):
+        # A correct guess that reached the win threshold ends the match without a log line.
+        if self.match_state == "correct":
+            self._end_match(self.reward)
+
+    def feed(self, line):
+        """Process one log line."""
+        found = _LINE.search(line)
+        if found is None:
+            return
+        kind = found.lastgroup
+        if kind == "house":
+            if self.match_state is None:
+                self.reward = self.initial_reward
+            self.match_state = "guessing"
+        elif kind == "guess":
+            self.stats["guesses"] += 1
+        elif kind == "result":
+            if found.group("result") == "correct":
+                self.stats["correct"] += 1
+                self.match_state = "correct"
+            else:
+                self._end_match(0)
+        elif kind == "doubled":
+            self.reward = int(found.group("doubled"))
+        elif kind == "stopped":
+            self._end_match(int(found.group("stopped")))
+        else:
+            self._close_pending()
+            if kind == "win":
+                self.stats["wins"] += 1
+            elif kind == "bankrupt":
+                self.stats["bankruptcies"] += 1
+
+    def summary(self):
+        """Return the totals plus guess accuracy, average reward and bankruptcy rate."""
+        stats = dict(self.stats)
+        stats["accuracy"] = stats["correct"] / stats["guesses"] if stats["guesses"] else 0.0
+        stats["average_reward"] = stats["total_reward"] / stats["matches"] if stats["matches"] else 0.0
+        games = stats["wins"] + stats["bankruptcies"]
+        stats["bankruptcy_rate"] = stats["bankruptcies"] / games if games else 0.0
+        return stats
+
+    def state(self):
+        return {"stats": self.stats, "match_state": self.match_state, "reward": self.reward}
+
+    def restore(self, state):
+        self.stats = dict(state["stats"])
+        self.match_state = state["match_state"]
+        self.reward = state["reward"]
+
+
+def _identity(f):
+    """Identify an open log file by device, inode and a hash of its first line."""
+    stat = os.fstat(f.fileno())
+    f.seek(0)
+    first = f.readline()
+    head = hashlib.sha256(first).hexdigest() if first.endswith(b"\n") else None
+    return {"device": stat.st_dev, "inode": stat.st_ino, "head": head}
+
+
+def analyze(path, checkpoint=None, initial_reward=20):
+    """
+    Analyze the log at `path`, resuming from and updating `checkpoint` if given.
+    The checkpoint records which file it belongs to, so a log that was rotated
+    (a different file now at `path`) or truncated is read from the start.
+    Returns:
+        dict: `LogAnalyzer.summary()` of everything read so far.
+    """
+    analyzer = LogAnalyzer(initial_reward)
+    offset = 0
+    with open(path, "rb") as f:
+        identity = _identity(f)
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint) as ckpt:
+                saved = json.load(ckpt)
+            saved_file = saved.get("file", {})
+            # The first line is only hashed once complete, so a missing hash matches any
+            same_file = (saved_file.get("device"), saved_file.get("inode")) == \
+                (identity["device"], identity["inode"]) and saved_file.get("head") in (None, identity["head"])
+            if same_file and saved["offset"] <= os.fstat(f.fileno()).st_size:
+                offset = saved["offset"]
+                analyzer.restore(saved["state"])
+
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                # Partial last line still being written; read it next time.
+                break
+            offset += len(raw)
+            analyzer.feed(raw.decode("utf-8", errors="replace"))
+        if identity["head"] is None:
+            identity = _identity(f)
+
+    if checkpoint is not None:
+        tmp = f"{checkpoint}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"offset": offset, "file": identity, "state": analyzer.state()}, f)
+        os.replace(tmp, checkpoint)
+    return analyzer.summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize a number guessing game log.")
+    parser.add_argument('log')
+    parser.add_argument('--checkpoint', default=None, help="File remembering how far the log was read.")
+    parser.add_argument('--initial-reward', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    for key, value in analyze(args.log, args.checkpoint, args.initial_reward).items():
+        print(f"{key}: {value:.4f}" if isinstance(value, float) else f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
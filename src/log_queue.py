@@ -0,0 +1,85 @@
+"""
+Logging off the calling thread.
+
+Records go through a `queue.Queue` to a `QueueListener` thread that writes
+them to a size-rotated file (and optionally the console). The queue handler
+keeps `%`-style arguments unformatted, so callers pay neither for string
+formatting nor for disk I/O; the listener flushes in batches, or as soon as
+the queue runs dry.
+"""
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records as they are, leaving the message and its
+    arguments to be formatted by the listener thread. Only use it with an
+    in-process queue and arguments that are not mutated after logging.
+    """
+    def prepare(self, record):
+        return record
+
+
+class DeferredFlushRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that leaves flushing to `flush_now()` instead of flushing every record."""
+    def flush(self):
+        # Called by StreamHandler.emit after every record.
+        pass
+
+    def flush_now(self):
+        super().flush()
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers every `batch_size` records or when the queue is empty."""
+    def __init__(self, log_queue, *handlers, batch_size=64, respect_handler_level=True):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size = batch_size
+        self._pending = 0
+
+    def handle(self, record):
+        super().handle(record)
+        self._pending += 1
+        if self._pending >= self.batch_size or self.queue.empty():
+            self._flush_handlers()
+
+    def stop(self):
+        """Process the records still queued, flush the handlers and stop the thread."""
+        super().stop()
+        self._flush_handlers()
+
+    def _flush_handlers(self):
+        self._pending = 0
+        for handler in self.handlers:
+            getattr(handler, "flush_now", handler.flush)()
+
+
+def start_queued_logging(path, logger=None, level=logging.INFO, max_bytes=1 << 20, backup_count=3,
+                         batch_size=64, console=True):
+    """
+    Route `logger` (the root logger if None) through a queue to a rotating log file.
+    Args:
+        path (str): Log file; rotated to path.1, path.2, ... once it reaches max_bytes.
+        console (bool): Also write records to stderr.
+    Returns:
+        BatchingQueueListener: The running listener; call stop() on exit to flush it.
+    """
+    logger = logger if logger is not None else logging.getLogger()
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [DeferredFlushRotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count)]
+    if console:
+        handlers.append(logging.StreamHandler(sys.stderr))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(LazyQueueHandler(log_queue))
+    logger.setLevel(level)
+    listener = BatchingQueueListener(log_queue, *handlers, batch_size=batch_size)
+    listener.start()
+    return listener
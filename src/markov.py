@@ -0,0 +1,178 @@
+"""
+Exact Game outcome probabilities from an absorbing Markov chain.
+
+With a deck of distinct cards only the number of cards left matters, so a
+round played from n cards is won with a fixed probability: guessing the
+majority side wins with sum(max(i, n - 1 - i)) / (n (n - 1)) over house ranks
+i, and always guessing 'g' wins half the time. A match starts from a fresh
+deck, so every match has the same reward distribution under a given continue
+policy (`match_reward_distribution`).
+
+A Game then moves between point totals: the console loop pays the match cost
+when it can, plays the match either way, and adds the reward. Totals in
+[lose_threshold, win_threshold) are transient; reaching win_threshold or
+falling below lose_threshold absorbs. Every step is a multiple of
+g = gcd(match_cost, initial_reward), so the chain lives on one residue class
+mod g, and a match moves at most max reward up or match_cost down. Cut
+into blocks that wide, the system (I - Q) x = b is block tridiagonal and is
+solved block by block, linear in the number of states. Solutions are cached per
+configuration, so evaluating other starting points is a lookup.
+
+    python -m src.markov --win-threshold 1000 --stop-at 80
+"""
+import argparse
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+from .simulation import always_continue, StopAt
+
+
+def round_win_probability(n, guess="majority"):
+    """
+    Probability of guessing one round right when dealing from `n` distinct cards.
+    Args:
+        guess (str): "majority" (the side holding more of the unseen cards) or "greater".
+    """
+    if guess == "greater":
+        return 0.5
+    if guess != "majority":
+        raise ValueError(f"Unknown guess policy: {guess}")
+    return sum(max(i, n - 1 - i) for i in range(n)) / (n * (n - 1))
+
+
+def match_reward_distribution(initial_reward=20, win_threshold=1000, continue_policy=always_continue,
+                              deck_size=54, guess="majority"):
+    """
+    Return {reward: probability} for one match dealt from a fresh deck of `deck_size` distinct cards.
+    Args:
+        continue_policy: A continue policy from src.simulation, called with one-element arrays.
+    """
+    distribution = {}
+    reward, n, alive, rounds = initial_reward, deck_size, 1.0, 0
+    while True:
+        if n < 2:
+            n = deck_size  # Match.reset_deck_if_needed
+        p = round_win_probability(n, guess)
+        n -= 2
+        rounds += 1
+        distribution[0] = distribution.get(0, 0.0) + alive * (1 - p)
+        alive *= p
+        if reward >= win_threshold or reward <= 0 or \
+                not continue_policy(np.array([reward]), np.array([rounds]), None)[0]:
+            distribution[reward] = distribution.get(reward, 0.0) + alive
+            return distribution
+        reward *= 2
+
+
+class GameOutcome:
+    """Exact outcome of a Game from one starting point."""
+    def __init__(self, win_probability, ruin_probability, expected_matches):
+        self.win_probability = win_probability
+        self.ruin_probability = ruin_probability
+        self.expected_matches = expected_matches
+
+    def __repr__(self):
+        return (f"GameOutcome(win={self.win_probability:.6f}, ruin={self.ruin_probability:.6f}, "
+                f"matches={self.expected_matches:.3f})")
+
+
+def evaluate_game(starting_points=60, match_cost=25, win_threshold=1000, lose_threshold=30,
+                  initial_reward=20, match_win_threshold=1000, continue_policy=always_continue,
+                  deck_size=54, guess="majority"):
+    """
+    Solve the game chain exactly.
+    Returns:
+        GameOutcome: Win and ruin probabilities and the expected number of matches played.
+    """
+    if starting_points >= win_threshold:
+        return GameOutcome(1.0, 0.0, 0.0)
+    if starting_points < lose_threshold:
+        return GameOutcome(0.0, 1.0, 0.0)
+    distribution = match_reward_distribution(initial_reward, match_win_threshold, continue_policy,
+                                             deck_size, guess)
+    step = gcd(match_cost, *distribution)
+    low = lose_threshold + (starting_points - lose_threshold) % step
+    solution = _solve_chain(tuple(sorted(distribution.items())), match_cost, win_threshold, low, step)
+    win, ruin, matches = solution[(starting_points - low) // step]
+    return GameOutcome(float(win), float(ruin), float(matches))
+
+
+@lru_cache(maxsize=64)
+def _solve_chain(distribution, match_cost, win_threshold, low, step):
+    """Solve for every transient state low, low + step, ... below win_threshold. Returns (states, 3)."""
+    points = np.arange(low, win_threshold, step, dtype=np.int64)
+    n = len(points)
+    pays = points >= match_cost
+    offsets = [(reward - match_cost * paying) // step for reward, _ in distribution for paying in (0, 1)
+               if (pays == paying).any()]
+    below = max(0, -min(offsets))
+    above = max(0, max(offsets))
+
+    # Blocks at least as wide as the largest step make I - Q block tridiagonal:
+    # blocks[b, 0] couples block b to block b - 1, blocks[b, 1] to itself and blocks[b, 2] to b + 1
+    size = max(below, above, 32)
+    count = -(-n // size)
+    blocks = np.zeros((count, 3, size, size))
+    rhs = np.zeros((count * size, 3))
+    rhs[:n, 2] = 1.0
+    blocks[:, 1][:, np.arange(size), np.arange(size)] = 1.0
+    for reward, probability in distribution:
+        target = points - np.where(pays, match_cost, 0) + reward
+        won = target >= win_threshold
+        ruined = target < low
+        rhs[:n][won, 0] += probability
+        rhs[:n][ruined, 1] += probability
+        moving = np.flatnonzero(~(won | ruined))
+        column = (target[moving] - low) // step
+        np.subtract.at(blocks, (moving // size, column // size - moving // size + 1, moving % size, column % size),
+                       probability)
+    return _solve_block_tridiagonal(blocks, rhs.reshape(count, size, 3))[:n]
+
+
+def _solve_block_tridiagonal(blocks, rhs):
+    """
+    Solve a block tridiagonal system by block Gaussian elimination.
+    I - Q is row diagonally dominant, so no pivoting across blocks is needed.
+    """
+    count = len(blocks)
+    coupling = np.zeros_like(blocks[:, 1])
+    y = np.zeros_like(rhs)
+    for b in range(count):
+        diagonal = blocks[b, 1]
+        right = rhs[b]
+        if b:
+            diagonal = diagonal - blocks[b, 0] @ coupling[b - 1]
+            right = right - blocks[b, 0] @ y[b - 1]
+        solved = np.linalg.solve(diagonal, np.hstack([blocks[b, 2], right]))
+        coupling[b], y[b] = solved[:, :-3], solved[:, -3:]
+    for b in range(count - 2, -1, -1):
+        y[b] -= coupling[b] @ y[b + 1]
+    return y.reshape(-1, 3)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exact win/ruin probabilities of the card guessing game.")
+    parser.add_argument('--starting-points', type=int, default=60)
+    parser.add_argument('--match-cost', type=int, default=25)
+    parser.add_argument('--win-threshold', type=int, default=1000)
+    parser.add_argument('--lose-threshold', type=int, default=30)
+    parser.add_argument('--initial-reward', type=int, default=20)
+    parser.add_argument('--guess', choices=["majority", "greater"], default="majority")
+    parser.add_argument('--stop-at', type=int, default=None,
+                        help="Stop once the reward reaches this value (default: always continue).")
+    args = parser.parse_args(argv)
+
+    continue_policy = always_continue if args.stop_at is None else StopAt(args.stop_at)
+    distribution = match_reward_distribution(args.initial_reward, continue_policy=continue_policy,
+                                             guess=args.guess)
+    print("Match reward distribution:")
+    for reward, p in sorted(distribution.items()):
+        print(f"  {reward:>6}: {p:.6f}")
+    print(evaluate_game(args.starting_points, args.match_cost, args.win_threshold, args.lose_threshold,
+                        args.initial_reward, continue_policy=continue_policy, guess=args.guess))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,24 +2,35 @@ from .deck import JokerDeckFactory
 from .card import Card
 
 class Match:
-    def __init__(self, initial_reward=20, win_threshold=1000):
-        self.deck = JokerDeckFactory().create_deck()
+    def __init__(self, initial_reward=20, win_threshold=1000, deck_factory=None, rng=None, deck=None,
+                 journal=None):
+        # Any DeckFactory works here, e.g. a shared DeckPool of pre-shuffled decks.
+        # rng seeds the default Joker deck factory and is ignored when a factory is given.
+        self.deck_factory = deck_factory if deck_factory is not None else JokerDeckFactory(rng=rng)
+        # A given deck (e.g. one restored from a snapshot) is dealt before any new one is made
+        self.deck = deck if deck is not None else self.deck_factory.create_deck()
         self.initial_reward = initial_reward
         self.potential_reward = initial_reward
         self.win_threshold = win_threshold
         self.house_card = None
         self.player_card = None
+        self.rounds = 0
+        # Optional journal Recorder that receives every deal, guess and reward change
+        self.journal = journal
 
     def reset_deck_if_needed(self):
-        """Reset the deck if fewer than 2 cards remain."""
-        if len(self.deck) < 2:
-            self.deck = JokerDeckFactory().create_deck()
+        """Reset the deck if fewer than 2 cards remain or a shoe reached its cut card."""
+        if len(self.deck) < 2 or self.deck.cut_card_reached():
+            self.deck = self.deck_factory.create_deck()
 
     def deal_cards(self):
         """Deal house and player cards, return the house card."""
         self.reset_deck_if_needed()
         self.house_card = self.deck.deal_card()
         self.player_card = self.deck.deal_card()
+        self.rounds += 1
+        if self.journal is not None:
+            self.journal.deal(self.house_card, self.player_card)
         return self.house_card
 
     def reveal_player_card(self):
@@ -29,18 +40,38 @@ class Match:
     def is_guess_correct(self, guess):
         """Check if the guess ('g' or 'l') is correct."""
         if guess == "g":
-            return self.player_card > self.house_card
+            correct = self.player_card > self.house_card
         elif guess == "l":
-            return self.player_card < self.house_card
-        return False
+            correct = self.player_card < self.house_card
+        else:
+            correct = False
+        if self.journal is not None:
+            self.journal.guess(self.house_card, self.player_card, guess, correct)
+        return correct
+
+    def odds(self):
+        """
+        Return (P(greater), P(less)) for the player's card against the house card.
+        The player's card is unknown, so it is drawn from the rest of the deck plus itself.
+        """
+        if self.house_card is None:
+            raise ValueError("No house card has been dealt.")
+        unseen = len(self.deck) + 1
+        greater = self.deck.count_greater(self.house_card) + (self.player_card > self.house_card)
+        less = self.deck.count_less(self.house_card) + (self.player_card < self.house_card)
+        return greater / unseen, less / unseen
 
     def double_reward(self):
         """Double the potential reward for the next round."""
         self.potential_reward *= 2
+        if self.journal is not None:
+            self.journal.reward(self.potential_reward)
     
     def remove_reward(self):
         """Set the potential reward to zero."""
         self.potential_reward = 0
+        if self.journal is not None:
+            self.journal.reward(self.potential_reward)
 
     def get_reward(self):
         """Return the current potential reward."""
@@ -48,4 +79,6 @@ class Match:
 
     def reset_reward(self):
         """Reset the potential reward to the initial value."""
-        self.potential_reward = self.initial_reward
\ No newline at end of file
+        self.potential_reward = self.initial_reward
+        if self.journal is not None:
+            self.journal.reward(self.potential_reward)
\ No newline at end of file
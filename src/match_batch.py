@@ -0,0 +1,137 @@
+"""
+Many matches stepped in lockstep, stored as parallel NumPy arrays.
+
+A `MatchBatch` of N matches keeps one row per match: its deck as card
+ordinals (uint8) plus the position of the next card, the house and player
+cards, the potential reward and whether the match is still being played.
+Each method acts on every active match with a handful of array operations,
+instead of N `Match` method calls.
+
+Row i behaves like a `Match`: cards are dealt two at a time from its own
+shuffled deck, the deck is replaced by a freshly shuffled one when fewer
+than 2 cards remain, ties lose both ways, and a wrong guess removes the
+reward. Like the console loop, a match ends on a wrong guess, on `stop()`,
+or once its reward reaches the win threshold.
+"""
+import numpy as np
+
+from .card import Card
+from .deck import Deck
+from .match import Match
+from .simulation import joker_deck_ordinals, _shuffled_decks
+
+
+def correct_guesses(guesses, player, house):
+    """
+    Return a boolean array, True where the guess is right as in `Match.is_guess_correct`.
+    Args:
+        guesses (array-like): 'g'/'l' values, or booleans where True means 'g'.
+        player, house: Card ordinals; arrays or scalars that broadcast together.
+    """
+    guesses = np.asarray(guesses)
+    if guesses.dtype == bool:
+        greater, less = guesses, ~guesses
+    else:
+        greater, less = guesses == "g", guesses == "l"
+    return (greater & (player > house)) | (less & (player < house))
+
+
+class MatchBatch:
+    """
+    N independent matches.
+    Args:
+        n (int): Number of matches.
+        initial_reward, win_threshold: Same meaning as in `Match`.
+        rng (numpy.random.Generator): Source of randomness, a fresh one if None.
+        deck (array-like): Card ordinals of a new deck, the Joker deck if None.
+    """
+    def __init__(self, n, initial_reward=20, win_threshold=1000, rng=None, deck=None):
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.fresh = joker_deck_ordinals() if deck is None else np.asarray(deck, dtype=np.uint8)
+        self.initial_reward = initial_reward
+        self.win_threshold = win_threshold
+        self.decks = _shuffled_decks(self.rng, self.fresh, n)
+        self.position = np.zeros(n, dtype=np.int64)
+        self.house = np.zeros(n, dtype=np.uint8)
+        self.player = np.zeros(n, dtype=np.uint8)
+        self.rewards = np.full(n, initial_reward, dtype=np.int64)
+        self.rounds = np.zeros(n, dtype=np.int64)
+        self.active = np.ones(n, dtype=bool)
+
+    def __len__(self):
+        return len(self.rewards)
+
+    def _rows(self, mask):
+        return np.flatnonzero(self.active if mask is None else self.active & mask)
+
+    def deal(self, mask=None):
+        """
+        Deal house and player cards to every active match (or those in `mask`).
+        Returns:
+            numpy.ndarray: House card ordinals of all matches.
+        """
+        rows = self._rows(mask)
+        empty = rows[self.fresh.size - self.position[rows] < 2]
+        if empty.size:
+            self.decks[empty] = _shuffled_decks(self.rng, self.fresh, empty.size)
+            self.position[empty] = 0
+        position = self.position[rows]
+        self.house[rows] = self.decks[rows, position]
+        self.player[rows] = self.decks[rows, position + 1]
+        self.position[rows] += 2
+        self.rounds[rows] += 1
+        return self.house
+
+    def step(self, guesses):
+        """
+        Check one guess per match and end the matches that guessed wrong.
+        Args:
+            guesses (array-like): 'g'/'l' per match, or booleans where True means 'g'.
+                Anything else is a wrong guess. Inactive matches are ignored.
+        Returns:
+            numpy.ndarray: Boolean array, True where an active match guessed right.
+        """
+        correct = self.active & correct_guesses(guesses, self.player, self.house)
+        wrong = self.active & ~correct
+        self.rewards[wrong] = 0
+        self.active &= correct
+        # A reward at the win threshold ends the match, as in the console app
+        self.active &= self.rewards < self.win_threshold
+        return correct
+
+    def double(self, mask=None):
+        """Double the potential reward of every active match (or those in `mask`)."""
+        self.rewards[self._rows(mask)] *= 2
+
+    def stop(self, mask=None):
+        """
+        End every active match (or those in `mask`) with its current reward.
+        Returns:
+            numpy.ndarray: Rewards of all matches.
+        """
+        self.active[self._rows(mask)] = False
+        return self.rewards
+
+    def odds(self):
+        """
+        Return (P(greater), P(less)) arrays for every match's player card, drawn
+        from the rest of its deck plus itself, as in `Match.odds`.
+        """
+        columns = np.arange(self.fresh.size)
+        unseen = columns >= (self.position - 1)[:, None]
+        house = self.house[:, None]
+        count = unseen.sum(axis=1)
+        greater = np.count_nonzero(unseen & (self.decks > house), axis=1)
+        less = np.count_nonzero(unseen & (self.decks < house), axis=1)
+        return greater / count, less / count
+
+    def to_match(self, i, **kwargs):
+        """Return match `i` as a `Match` with the same cards, reward and remaining deck order."""
+        cards = [Card.from_ordinal(int(ordinal)) for ordinal in self.decks[i, self.position[i]:][::-1]]
+        match = Match(initial_reward=self.initial_reward, win_threshold=self.win_threshold,
+                      deck=Deck(cards, shuffle_on_init=False), **kwargs)
+        match.potential_reward = int(self.rewards[i])
+        if self.rounds[i]:
+            match.house_card = Card.from_ordinal(int(self.house[i]))
+            match.player_card = Card.from_ordinal(int(self.player[i]))
+        return match
@@ -0,0 +1,205 @@
+"""
+Opt-in instrumentation for the game engine.
+
+`enable()` swaps instrumented wrappers into Deck, Match and the deck
+factories; `disable()` puts the original functions back. While disabled the
+classes are exactly as they were, so the overhead is zero rather than a
+flag check on every call. Results live in `REGISTRY` and can be written out
+in the Prometheus text format with `write_prometheus()`.
+
+Counters are updated without locks; under heavy threading they may
+undercount slightly.
+"""
+import os
+import time
+from functools import wraps
+
+from .deck import Deck, CompactDeck, DeckFactory
+from .match import Match
+from .shoe import Shoe
+
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1)
+
+
+class Counter:
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def samples(self):
+        yield self.name, {}, self.value
+
+
+class Histogram:
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS, labels=None):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        self.labels = dict(labels or {})
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def samples(self):
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            yield self.name + "_bucket", dict(self.labels, le="+Inf" if bound == float("inf") else repr(bound)), cumulative
+        yield self.name + "_sum", self.labels, self.sum
+        yield self.name + "_count", self.labels, self.count
+
+
+class Registry:
+    """Named counters and histograms."""
+    def __init__(self):
+        self._metrics = {}
+
+    def counter(self, name, help_text):
+        key = (name, ())
+        if key not in self._metrics:
+            self._metrics[key] = Counter(name, help_text)
+        return self._metrics[key]
+
+    def histogram(self, name, help_text, buckets=DEFAULT_BUCKETS, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        if key not in self._metrics:
+            self._metrics[key] = Histogram(name, help_text, buckets, labels)
+        return self._metrics[key]
+
+    def get(self, name, **labels):
+        return self._metrics[(name, tuple(sorted(labels.items())))]
+
+    def reset(self):
+        self._metrics.clear()
+
+    def to_prometheus(self):
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        described = set()
+        for metric in self._metrics.values():
+            if metric.name not in described:
+                described.add(metric.name)
+                kind = "counter" if isinstance(metric, Counter) else "histogram"
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {kind}")
+            for name, labels, value in metric.samples():
+                label_text = ",".join(f'{key}="{val}"' for key, val in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+_originals = []  # (class, attribute, original function)
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def _patch(cls, attribute, make_wrapper):
+    original = cls.__dict__[attribute]
+    setattr(cls, attribute, wraps(original)(make_wrapper(original)))
+    _originals.append((cls, attribute, original))
+
+
+def _counting(counter):
+    def make_wrapper(original):
+        def wrapper(*args, **kwargs):
+            counter.inc()
+            return original(*args, **kwargs)
+        return wrapper
+    return make_wrapper
+
+
+def _timing(histogram):
+    def make_wrapper(original):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+        return wrapper
+    return make_wrapper
+
+
+def _all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _all_subclasses(subclass)
+
+
+def enable(registry=REGISTRY):
+    """Start collecting metrics into `registry`. Does nothing if already enabled."""
+    if _originals:
+        return
+    constructions = registry.counter("ngg_deck_constructions_total", "Decks constructed.")
+    shuffles = registry.counter("ngg_deck_shuffles_total", "Deck shuffles.")
+    resets = registry.counter("ngg_deck_resets_total", "Decks replaced by Match.reset_deck_if_needed.")
+    deals = registry.counter("ngg_deals_total", "Rounds dealt by Match.deal_cards.")
+    correct = registry.counter("ngg_correct_guesses_total", "Correct guesses.")
+    wrong = registry.counter("ngg_wrong_guesses_total", "Wrong guesses.")
+    doublings = registry.counter("ngg_reward_doublings_total", "Reward doublings.")
+    deal_time = registry.histogram("ngg_match_deal_cards_seconds", "Time spent in Match.deal_cards.")
+
+    for deck_class in (Deck, CompactDeck, Shoe):
+        _patch(deck_class, "__init__", _counting(constructions))
+    # Shoe.shuffle is a no-op, so only the Deck classes' shuffles are counted
+    for deck_class in (Deck, *_all_subclasses(Deck)):
+        if "shuffle" in deck_class.__dict__:
+            _patch(deck_class, "shuffle", _counting(shuffles))
+
+    def reset_wrapper(original):
+        def wrapper(self):
+            deck = self.deck
+            original(self)
+            if self.deck is not deck:
+                resets.inc()
+        return wrapper
+
+    def guess_wrapper(original):
+        def wrapper(self, guess):
+            result = original(self, guess)
+            (correct if result else wrong).inc()
+            return result
+        return wrapper
+
+    _patch(Match, "reset_deck_if_needed", reset_wrapper)
+    _patch(Match, "is_guess_correct", guess_wrapper)
+    _patch(Match, "double_reward", _counting(doublings))
+    _patch(Match, "deal_cards", lambda original: _counting(deals)(_timing(deal_time)(original)))
+
+    for factory_class in _all_subclasses(DeckFactory):
+        if "create_deck" in factory_class.__dict__:
+            histogram = registry.histogram("ngg_create_deck_seconds", "Time spent in DeckFactory.create_deck.",
+                                           factory=factory_class.__name__)
+            _patch(factory_class, "create_deck", _timing(histogram))
+
+
+def disable():
+    """Restore the original, uninstrumented methods."""
+    while _originals:
+        cls, attribute, original = _originals.pop()
+        setattr(cls, attribute, original)
+
+
+def write_prometheus(path, registry=REGISTRY):
+    """Write the registry to `path` in the Prometheus text format, replacing the file atomically."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(registry.to_prometheus())
+    os.replace(tmp, path)
@@ -0,0 +1,138 @@
+from array import array
+
+from .card import Card
+
+class RankIndex:
+    """
+    Multiset of cards keyed by `Card.ordinal`.
+
+    Keeps a count per ordinal for O(1) membership and a Fenwick tree over the
+    counts for O(log n) updates and rank queries. Both are lists, or typed
+    arrays for an index made by `copy(typecode)`.
+    """
+    __slots__ = ('counts', '_tree', '_total')
+
+    def __init__(self, cards=()):
+        self.counts = [0] * Card.ORDINAL_LIMIT
+        self._tree = [0] * (Card.ORDINAL_LIMIT + 1)
+        self._total = 0
+        for card in cards:
+            self.counts[card.ordinal] += 1
+        self._rebuild()
+
+    @classmethod
+    def from_ordinals(cls, ordinals):
+        """Build an index straight from card ordinals without touching Card objects."""
+        index = cls()
+        for ordinal in ordinals:
+            index.counts[ordinal] += 1
+        index._rebuild()
+        return index
+
+    @classmethod
+    def from_counts(cls, counts):
+        """Build an index from a count per ordinal, e.g. another index's `counts`."""
+        index = cls()
+        index.counts[:len(counts)] = [int(count) for count in counts]
+        index._rebuild()
+        return index
+
+    def copy(self, typecode=None):
+        """
+        Return an independent copy; copies the counts and tree instead of rebuilding them.
+        Args:
+            typecode (str): Store them in an array of this type (e.g. 'H') instead of keeping
+                the current storage. Smaller than lists, but every count must fit the type.
+        """
+        index = type(self).__new__(type(self))
+        if typecode is None:
+            index.counts = self.counts[:]
+            index._tree = self._tree[:]
+        else:
+            index.counts = array(typecode, self.counts)
+            index._tree = array(typecode, self._tree)
+        index._total = self._total
+        return index
+
+    def _rebuild(self):
+        """Build the Fenwick tree from `counts` in O(n)."""
+        tree = self._tree
+        size = len(tree)
+        for i in range(1, size):
+            tree[i] = self.counts[i - 1]
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._total = sum(self.counts)
+
+    def add(self, card, count=1):
+        """Add `count` copies of `card` (a negative count removes them)."""
+        ordinal = card.ordinal
+        self.counts[ordinal] += count
+        self._total += count
+        tree = self._tree
+        size = len(tree)
+        i = ordinal + 1
+        while i < size:
+            tree[i] += count
+            i += i & -i
+
+    def remove(self, card):
+        """Remove one copy of `card`."""
+        # Same as add(card, -1), inlined because every deal goes through here
+        ordinal = card.ordinal
+        self.counts[ordinal] -= 1
+        self._total -= 1
+        tree = self._tree
+        size = len(tree)
+        i = ordinal + 1
+        while i < size:
+            tree[i] -= 1
+            i += i & -i
+
+    def count(self, card):
+        """Return how many copies of `card` are indexed."""
+        return self.counts[card.ordinal]
+
+    def __contains__(self, card):
+        return self.counts[card.ordinal] > 0
+
+    def __len__(self):
+        return self._total
+
+    def count_below(self, ordinal):
+        """Return how many cards have an ordinal strictly below `ordinal`."""
+        total = 0
+        tree = self._tree
+        i = ordinal
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, k):
+        """
+        Return the ordinal of the k-th smallest card (0-based), counting copies.
+        Raises IndexError if k is out of range.
+        """
+        if not 0 <= k < self._total:
+            raise IndexError("Rank out of range.")
+        tree = self._tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = position + step
+            if nxt < len(tree) and tree[nxt] <= k:
+                position = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return position
+
+    def count_less(self, card):
+        """Return how many cards rank strictly below `card`."""
+        return self.count_below(card.ordinal)
+
+    def count_greater(self, card):
+        """Return how many cards rank strictly above `card`."""
+        return self._total - self.count_below(card.ordinal + 1)
@@ -0,0 +1,91 @@
+"""
+Record games with their seed and choices, and replay them without `input()`.
+
+A game is fully determined by its configuration, the seed of its random
+source and the sequence of guesses and continue/stop decisions, so a
+`GameRecord` only stores those.
+"""
+import json
+
+from .game import Game
+from .rng import make_rng
+from .session import play_game
+
+
+class GameRecord:
+    """Seed, configuration and player choices of one game."""
+    def __init__(self, seed, config, guesses="", decisions="", final_points=None):
+        self.seed = seed
+        self.config = dict(config)
+        self.guesses = guesses          # 'g'/'l' per round
+        self.decisions = decisions      # 'y' (continue) or 's' (stop) per decision
+        self.final_points = final_points
+
+    def to_dict(self):
+        return {"seed": self.seed, "config": self.config, "guesses": self.guesses,
+                "decisions": self.decisions, "final_points": self.final_points}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["seed"], data["config"], data["guesses"], data["decisions"], data["final_points"])
+
+    def dumps(self):
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def loads(cls, text):
+        return cls.from_dict(json.loads(text))
+
+
+def record_game(seed, choose_guess, choose_continue, **config):
+    """
+    Play a game with a `random.Random(seed)` source and record every choice.
+    Args:
+        seed (int): Seed of the game's random source.
+        choose_guess, choose_continue: Player callables, see `src.session`.
+        **config: Keyword arguments for `Game`.
+    Returns:
+        (Game, GameRecord): The finished game and its record.
+    """
+    guesses = []
+    decisions = []
+
+    def recording_guess(match):
+        guess = choose_guess(match)
+        guesses.append(guess)
+        return guess
+
+    def recording_continue(match):
+        decision = choose_continue(match)
+        decisions.append("y" if decision else "s")
+        return decision
+
+    game = Game(rng=make_rng(seed), **config)
+    play_game(game, recording_guess, recording_continue)
+    record = GameRecord(seed, config, "".join(guesses), "".join(decisions), game.points)
+    return game, record
+
+
+def replay_game(record):
+    """
+    Re-run a recorded game at full speed.
+    Raises ValueError if the record runs out of choices or the final points differ.
+    Returns:
+        Game: The replayed game.
+    """
+    guesses = iter(record.guesses)
+    decisions = iter(record.decisions)
+
+    def next_choice(choices, kind):
+        try:
+            return next(choices)
+        except StopIteration:
+            raise ValueError(f"Record has no more {kind}.") from None
+
+    game = Game(rng=make_rng(record.seed), **record.config)
+    play_game(game,
+              lambda match: next_choice(guesses, "guesses"),
+              lambda match: next_choice(decisions, "decisions") == "y")
+    if record.final_points is not None and game.points != record.final_points:
+        raise ValueError(f"Replay ended with {game.points} points, record has {record.final_points}.")
+    return game
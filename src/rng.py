@@ -0,0 +1,34 @@
+"""
+Seeded random sources for decks, matches and games.
+
+Every Deck, Match and Game accepts an `rng`: any object with a `shuffle()`
+method, such as `random.Random` or `numpy.random.Generator`. The helpers here
+derive independent, reproducible streams from one root seed so parallel
+workers never share random state.
+"""
+import hashlib
+import random
+
+
+def make_rng(seed=None):
+    """Return a `random.Random` seeded with `seed` (from OS entropy if None)."""
+    return random.Random(seed)
+
+
+def derive_seed(seed, *path):
+    """
+    Derive a 64-bit child seed from `seed` and a path of keys, e.g. (worker, chunk).
+    The same inputs always give the same seed, and different paths give unrelated ones.
+    """
+    key = ":".join(str(part) for part in (seed,) + path).encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "little")
+
+
+def spawn_seeds(seed, n):
+    """Return `n` independent child seeds of `seed`."""
+    return [derive_seed(seed, i) for i in range(n)]
+
+
+def split(seed, n):
+    """Return `n` independent `random.Random` streams derived from `seed`."""
+    return [make_rng(child) for child in spawn_seeds(seed, n)]
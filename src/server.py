@@ -0,0 +1,189 @@
+"""
+Asyncio TCP server hosting many concurrent games in one process.
+
+The protocol is line based. The client sends one command per line:
+
+    START           pay for a match and deal the house card
+    G / L           guess greater or less
+    CONTINUE        double the reward and deal again (also Y)
+    STOP            take the current reward
+    STATUS          report the session without changing it
+    STATS           report the session plus server stats (sessions, requests/s, uptime)
+    QUIT            close the connection
+
+and the server answers every command, including the greeting on connect,
+with exactly one JSON object on its own line, e.g.
+
+    {"ok": true, "state": "guessing", "points": 35, "reward": 20, "house": "5 of Heart"}
+
+Failed commands answer with "ok": false and an "error" message. A connection
+that sends nothing for `idle_timeout` seconds, or a line longer than
+`line_limit` bytes, is told so and closed.
+
+Run with `python -m src.server --port 8765`.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from .game import Game
+from .session import GameSession
+
+
+class GameServer:
+    """
+    Args:
+        host, port: Address to listen on; port 0 picks a free port.
+        idle_timeout (float): Seconds of silence before a session is closed.
+        line_limit (int): Longest command line accepted, in bytes.
+        game_config (dict): Keyword arguments for each session's `Game`.
+        match_config (dict): Keyword arguments for each `Match`.
+    """
+    def __init__(self, host="127.0.0.1", port=8765, idle_timeout=300.0, game_config=None, match_config=None,
+                 line_limit=1 << 16):
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.line_limit = line_limit
+        self.game_config = game_config or {}
+        self.match_config = match_config or {}
+        self.active_sessions = 0
+        self.peak_sessions = 0
+        self.total_sessions = 0
+        self.requests = 0
+        self._started = None
+        self._stopped = None
+        self._server = None
+
+    async def start(self):
+        """Start listening. Returns the bound port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=self.line_limit)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started = time.monotonic()
+        self._stopped = None
+        return self.port
+
+    @property
+    def uptime(self):
+        """Seconds since start(), up to close() once the server is closed."""
+        if self._started is None:
+            return 0.0
+        return (self._stopped if self._stopped is not None else time.monotonic()) - self._started
+
+    @property
+    def requests_per_second(self):
+        """Mean command rate over the uptime."""
+        uptime = self.uptime
+        return self.requests / uptime if uptime > 0 else 0.0
+
+    def stats(self):
+        """Return the server counters, request rate and uptime as a dict."""
+        return {"active_sessions": self.active_sessions, "peak_sessions": self.peak_sessions,
+                "total_sessions": self.total_sessions, "requests": self.requests,
+                "requests_per_second": self.requests_per_second, "uptime": self.uptime}
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+        self._stopped = time.monotonic()
+
+    def new_session(self):
+        return GameSession(Game(**self.game_config), **self.match_config)
+
+    def handle_command(self, session, command):
+        """Apply one command line to a session and return the response dict."""
+        command = command.strip().upper()
+        try:
+            extra = {}
+            if command == "START":
+                extra["house"] = repr(session.start_match())
+            elif command in ("G", "L"):
+                extra["correct"] = session.guess(command.lower())
+                extra["house"] = repr(session.match.house_card)
+                extra["player"] = repr(session.match.reveal_player_card())
+            elif command in ("CONTINUE", "Y"):
+                extra["house"] = repr(session.continue_match())
+            elif command == "STOP":
+                extra["taken"] = session.stop_match()
+            elif command == "STATS":
+                extra["server"] = self.stats()
+            elif command != "STATUS":
+                raise ValueError(f"Unknown command: {command}")
+        except ValueError as e:
+            return self._status(session, ok=False, error=str(e))
+        return self._status(session, **extra)
+
+    def _status(self, session, ok=True, **fields):
+        response = {"ok": ok, "state": session.state, "points": session.game.points}
+        if session.match is not None:
+            response["reward"] = session.match.get_reward()
+        if session.state == GameSession.OVER:
+            response["won"] = session.game.check_win()
+        response.update(fields)
+        return response
+
+    async def _handle(self, reader, writer):
+        session = self.new_session()
+        self.active_sessions += 1
+        self.total_sessions += 1
+        self.peak_sessions = max(self.peak_sessions, self.active_sessions)
+        try:
+            writer.write(self._encode(self._status(session)))
+            await writer.drain()
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    writer.write(self._encode({"ok": False, "error": "Idle timeout."}))
+                    break
+                except ValueError:
+                    # readline() reports a line over the stream limit as ValueError
+                    writer.write(self._encode({"ok": False, "error": "Line too long."}))
+                    break
+                if not line:
+                    break
+                command = line.decode(errors="replace")
+                self.requests += 1
+                if command.strip().upper() == "QUIT":
+                    writer.write(self._encode(self._status(session)))
+                    break
+                writer.write(self._encode(self.handle_command(session, command)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def _encode(response):
+        return (json.dumps(response) + "\n").encode()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the card guessing game over TCP.")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--idle-timeout', type=float, default=300.0)
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.host, args.port, args.idle_timeout)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Headless game loops.
+
+These follow the console app's loop exactly, with the player's choices coming
+from callables instead of `input()`:
+
+* `choose_guess(match)` returns 'g' or 'l' once the house card is dealt.
+* `choose_continue(match)` returns True to double the reward after a correct
+  guess, or False to stop and take it.
+
+A few ready-made players are defined at module level so they can be pickled
+and sent to worker processes. `GUESSES` maps the command-line names of the
+guess players to them.
+"""
+
+
+def majority_guess_policy(match):
+    """Guess the side that holds more of the cards the player has not seen."""
+    p_greater, p_less = match.odds()
+    return "g" if p_greater >= p_less else "l"
+
+
+def always_greater_policy(match):
+    """Always guess 'g'."""
+    return "g"
+
+
+def always_stop_policy(match):
+    """Take the reward after the first correct guess."""
+    return False
+
+
+def always_continue_policy(match):
+    """Keep doubling until a wrong guess or the match win threshold."""
+    return True
+
+
+GUESSES = {'majority': majority_guess_policy, 'greater': always_greater_policy}
+
+
+class ContinueBelow:
+    """Keep doubling while the reward is below `target`."""
+    def __init__(self, target):
+        self.target = target
+
+    def __call__(self, match):
+        return match.get_reward() < self.target
+
+
+def play_match(match, choose_guess, choose_continue):
+    """Play one match to the end and return its reward."""
+    while True:
+        match.deal_cards()
+        if match.is_guess_correct(choose_guess(match)):
+            # Automatically end the match if the player reaches win_threshold
+            if match.get_reward() >= match.win_threshold:
+                break
+            if not choose_continue(match):
+                break
+            match.double_reward()
+        else:
+            match.remove_reward()
+            break
+    return match.get_reward()
+
+
+def play_game(game, choose_guess, choose_continue, **match_kwargs):
+    """
+    Play matches until the game is won or the player cannot afford another one.
+    Extra keyword arguments are passed to `game.new_match()`.
+    Returns:
+        Game: The same game, in its final state.
+    """
+    while game.can_play_match():
+        game.pay_for_match()
+        match = game.new_match(**match_kwargs)
+        play_match(match, choose_guess, choose_continue)
+        game.add_reward(match.get_reward())
+        game.record_match(match)
+        if game.check_win():
+            break
+    return game
+
+
+class GameSession:
+    """
+    Turn-by-turn state of one player's game, for front ends that get one
+    action at a time (the GUI, the network server). Follows the GUI's flow:
+    start a match, guess, then continue or stop after a correct guess.
+    Actions that do not fit the current state raise ValueError.
+    """
+    IDLE = "idle"          # waiting for start_match()
+    GUESSING = "guessing"  # house card dealt, waiting for guess()
+    DECIDING = "deciding"  # correct guess, waiting for continue_match() or stop_match()
+    OVER = "over"          # game won or not enough points left
+
+    def __init__(self, game, **match_kwargs):
+        self.game = game
+        self.match_kwargs = match_kwargs
+        self.match = None
+        self.state = self.IDLE if game.can_play_match() else self.OVER
+
+    def _expect(self, state):
+        if self.state != state:
+            raise ValueError(f"Action not allowed while {self.state}.")
+
+    def start_match(self):
+        """Pay for a new match and deal. Returns the house card."""
+        self._expect(self.IDLE)
+        if not self.game.pay_for_match():
+            raise ValueError("Payment for match failed.")
+        self.match = self.game.new_match(**self.match_kwargs)
+        self.state = self.GUESSING
+        return self.match.deal_cards()
+
+    def guess(self, guess):
+        """Guess 'g' or 'l'. Returns True if the guess was correct."""
+        self._expect(self.GUESSING)
+        if self.match.is_guess_correct(guess):
+            if self.match.get_reward() >= self.match.win_threshold:
+                self._end_match(self.match.get_reward())
+            else:
+                self.state = self.DECIDING
+            return True
+        self.match.remove_reward()
+        self._end_match(0)
+        return False
+
+    def continue_match(self):
+        """Double the reward and deal again. Returns the new house card."""
+        self._expect(self.DECIDING)
+        self.match.double_reward()
+        self.state = self.GUESSING
+        return self.match.deal_cards()
+
+    def stop_match(self):
+        """Take the current reward. Returns it."""
+        self._expect(self.DECIDING)
+        reward = self.match.get_reward()
+        self._end_match(reward)
+        return reward
+
+    def _end_match(self, reward):
+        self.game.points += reward
+        self.game.record_match(self.match)
+        if self.game.check_win() or not self.game.can_play_match():
+            self.state = self.OVER
+        else:
+            self.state = self.IDLE
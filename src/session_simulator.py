@@ -0,0 +1,147 @@
+"""
+Headless simulator for complete Game sessions.
+
+A session runs from `Game.can_play_match` through repeated matches until
+`check_win` or the player can no longer afford a match. Sessions are split
+into chunks; every chunk gets its own seed derived from the root seed, so
+results do not depend on how many worker processes run them.
+
+Run with `python -m src.session_simulator --help`.
+"""
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from .game import Game
+from .rng import derive_seed, make_rng
+from .session import GUESSES, play_game, majority_guess_policy, always_continue_policy, ContinueBelow
+
+
+class SessionStats:
+    """Aggregated outcome of many sessions."""
+    def __init__(self):
+        self.sessions = 0
+        self.wins = 0
+        self.bankruptcies = 0
+        self.total_matches = 0
+        self.lengths = Counter()  # matches played -> number of sessions
+        self.elapsed = 0.0
+
+    def add(self, game):
+        """Record one finished game."""
+        self.sessions += 1
+        if game.check_win():
+            self.wins += 1
+        else:
+            self.bankruptcies += 1
+        self.total_matches += game.matches_played
+        self.lengths[game.matches_played] += 1
+
+    def merge(self, other):
+        """Fold the counts of another SessionStats into this one."""
+        self.sessions += other.sessions
+        self.wins += other.wins
+        self.bankruptcies += other.bankruptcies
+        self.total_matches += other.total_matches
+        self.lengths.update(other.lengths)
+        return self
+
+    @property
+    def win_rate(self):
+        return self.wins / self.sessions if self.sessions else 0.0
+
+    @property
+    def bankruptcy_rate(self):
+        return self.bankruptcies / self.sessions if self.sessions else 0.0
+
+    @property
+    def sessions_per_second(self):
+        return self.sessions / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def summary(self):
+        lines = [f"Sessions: {self.sessions} ({self.sessions_per_second:,.0f} sessions/s)",
+                 f"Win rate: {self.win_rate:.4%}",
+                 f"Bankruptcy rate: {self.bankruptcy_rate:.4%}",
+                 f"Mean session length: {self.total_matches / max(self.sessions, 1):.2f} matches",
+                 "Session length histogram (matches: sessions):"]
+        lines.extend(f"  {length:>6}: {count}" for length, count in sorted(self.lengths.items()))
+        return "\n".join(lines)
+
+
+def run_chunk(seed, sessions, game_config, match_config, choose_guess, choose_continue):
+    """Play `sessions` games from one seeded stream and return their SessionStats."""
+    rng = make_rng(seed)
+    stats = SessionStats()
+    for _ in range(sessions):
+        game = Game(rng=rng, **game_config)
+        stats.add(play_game(game, choose_guess, choose_continue, **match_config))
+    return stats
+
+
+def _run_chunk(args):
+    return run_chunk(*args)
+
+
+def simulate_sessions(sessions, seed=0, workers=None, chunk_size=10000, game_config=None, match_config=None,
+                      choose_guess=majority_guess_policy, choose_continue=always_continue_policy):
+    """
+    Simulate `sessions` complete games across a process pool.
+    Args:
+        sessions (int): Number of games to play.
+        seed (int): Root seed; chunk i plays from `derive_seed(seed, i)`.
+        workers (int): Number of processes, os.cpu_count() if None. 1 runs in-process.
+        chunk_size (int): Games per task sent to a worker.
+        game_config (dict): Keyword arguments for `Game`.
+        match_config (dict): Keyword arguments for `Match`, e.g. initial_reward.
+        choose_guess, choose_continue: Picklable player callables, see `src.session`.
+    Returns:
+        SessionStats: Aggregated results.
+    """
+    game_config = game_config or {}
+    match_config = match_config or {}
+    workers = workers or os.cpu_count() or 1
+    tasks = [(derive_seed(seed, index), min(chunk_size, sessions - start), game_config, match_config,
+              choose_guess, choose_continue)
+             for index, start in enumerate(range(0, sessions, chunk_size))]
+
+    stats = SessionStats()
+    start = time.perf_counter()
+    if workers == 1:
+        for task in tasks:
+            stats.merge(_run_chunk(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_stats in executor.map(_run_chunk, tasks):
+                stats.merge(chunk_stats)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate complete game sessions.")
+    parser.add_argument('--sessions', type=int, default=100000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--starting-points', type=int, default=60)
+    parser.add_argument('--match-cost', type=int, default=25)
+    parser.add_argument('--win-threshold', type=int, default=1000)
+    parser.add_argument('--lose-threshold', type=int, default=30)
+    parser.add_argument('--initial-reward', type=int, default=20)
+    parser.add_argument('--guess', choices=sorted(GUESSES), default='majority')
+    parser.add_argument('--stop-at', type=int, default=None,
+                        help="Stop once the reward reaches this value (default: always continue).")
+    args = parser.parse_args(argv)
+
+    game_config = {'starting_points': args.starting_points, 'match_cost': args.match_cost,
+                   'win_threshold': args.win_threshold, 'lose_threshold': args.lose_threshold}
+    choose_continue = always_continue_policy if args.stop_at is None else ContinueBelow(args.stop_at)
+    stats = simulate_sessions(args.sessions, args.seed, args.workers, args.chunk_size, game_config,
+                              {'initial_reward': args.initial_reward}, GUESSES[args.guess], choose_continue)
+    print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Multi-deck shoes stored as per-card counts.
+
+A Shoe never materializes its cards: it keeps one count per card in a
+RankIndex and deals by drawing a uniformly random position among the cards
+left, found in O(log k) through the index's Fenwick tree. Memory is constant
+per card type, however many decks the shoe holds.
+"""
+import random
+
+from .card import Card
+from .deck import DeckFactory, JokerDeckFactory, StandardDeckFactory
+from .rank_index import RankIndex
+
+
+class Shoe:
+    """
+    Drop-in replacement for Deck holding `num_decks` copies of a deck.
+    Args:
+        cards (iterable of Card): Cards of one deck.
+        num_decks (int): Number of copies in the shoe.
+        penetration (float): Fraction of the shoe dealt before the cut card is reached.
+        rng: Random source with randrange() (random.Random) or integers() (numpy Generator).
+    """
+    def __init__(self, cards, num_decks=8, penetration=0.75, rng=None):
+        self._index = RankIndex()
+        for card in cards:
+            self._index.add(card, num_decks)
+        self.size = len(self._index)
+        self.penetration = penetration
+        self._rng = rng if rng is not None else random
+        if hasattr(self._rng, "randrange"):
+            self._randbelow = self._rng.randrange
+        else:
+            self._randbelow = lambda n: int(self._rng.integers(n))
+
+    @classmethod
+    def from_counts(cls, counts, size=None, penetration=0.75, rng=None):
+        """
+        Creates a shoe holding `counts[i]` cards of ordinal i.
+        Args:
+            size (int): Full size the cut card is measured from; the number of cards held if None.
+        """
+        shoe = cls((), penetration=penetration, rng=rng)
+        shoe._index = RankIndex.from_counts(counts)
+        shoe.size = size if size is not None else len(shoe._index)
+        return shoe
+
+    def shuffle(self):
+        """Does nothing: every deal is already a uniformly random draw."""
+
+    def deal_card(self):
+        """
+        Deals a uniformly random card from the shoe.
+        Raises IndexError if the shoe is empty.
+        """
+        remaining = len(self._index)
+        if not remaining:
+            raise IndexError("Cannot deal card from an empty deck.")
+        card = Card.from_ordinal(self._index.find(self._randbelow(remaining)))
+        self._index.remove(card)
+        return card
+
+    def add_card(self, card):
+        """
+        Returns a card to the shoe. Unlike Deck, it is mixed back in rather than dealt next.
+        Args:
+            card (Card): The Card object to add to the shoe.
+        """
+        if not isinstance(card, Card):
+            raise TypeError("Only Card objects can be added to the deck.")
+        self._index.add(card)
+
+    def cut_card_reached(self):
+        """Returns True once the penetration point has been dealt."""
+        return self.size - len(self._index) >= self.penetration * self.size
+
+    def count_greater(self, card):
+        """Returns the number of cards in the shoe that rank above the given card."""
+        return self._index.count_greater(card)
+
+    def count_less(self, card):
+        """Returns the number of cards in the shoe that rank below the given card."""
+        return self._index.count_less(card)
+
+    def rank_counts(self):
+        """Returns a new list with the number of remaining cards of each ordinal (see Card.ordinal)."""
+        return list(self._index.counts)
+
+    @property
+    def _cards(self):
+        """The remaining cards in rank order, as a new list."""
+        return [Card.from_ordinal(ordinal) for ordinal, count in enumerate(self._index.counts)
+                for _ in range(count)]
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, card):
+        if not isinstance(card, Card):
+            return False
+        return card in self._index
+
+    def __repr__(self):
+        return f"Shoe with {len(self)} cards remaining."
+
+
+class ShoeFactory(DeckFactory):
+    """
+    Factory for multi-deck shoes, usable as `Match(deck_factory=ShoeFactory(...))`.
+    Args:
+        num_decks (int): Decks per shoe.
+        penetration (float): Fraction dealt before the match replaces the shoe.
+        jokers (bool): Build from the Joker deck (True) or the standard 52-card deck.
+        rng: Random source passed to every shoe.
+    """
+    def __init__(self, num_decks=8, penetration=0.75, jokers=True, rng=None):
+        super().__init__(Shoe, rng)
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self._prototype = (JokerDeckFactory if jokers else StandardDeckFactory)._prototype
+
+    def create_deck(self, shuffle_on_init=True):
+        """
+        Creates a full shoe. Shoes deal at random, so shuffle_on_init has no effect.
+        Returns:
+            Shoe: A new shoe.
+        """
+        return Shoe(self._prototype, self.num_decks, self.penetration, self.rng)
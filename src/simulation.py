@@ -0,0 +1,286 @@
+"""
+Vectorized Monte Carlo engine for Match and Game.
+
+Cards are handled as their integer ordinals, so comparing two ordinals gives
+the same answer as `Card.__lt__` for every card in the Joker deck, and ties
+(possible with custom decks) lose for both guesses just like
+`Match.is_guess_correct`. All matches in a batch advance in lockstep: every
+match deals from its own shuffled deck, and a deck is replaced with a freshly
+shuffled one when fewer than 2 cards remain, as in `Match.reset_deck_if_needed`.
+
+Policies are plain callables working on arrays:
+
+* a guess policy is called as `policy(house, unseen, rng)` where `house` holds
+  the house card ordinals of the active matches and `unseen` holds, row by row,
+  every card the player has not seen yet (their own card and the rest of the
+  deck). It returns a boolean array, True meaning guess 'g'.
+* a continue policy is called as `policy(rewards, rounds, rng)` after a correct
+  guess below the match win threshold. It returns a boolean array, True meaning
+  double the reward and play another round.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from .deck import JokerDeckFactory
+
+
+def joker_deck_ordinals():
+    """Return the ordinals of the 54-card Joker deck as a uint8 array."""
+    counts = JokerDeckFactory().create_deck(shuffle_on_init=False).rank_counts()
+    return np.repeat(np.arange(len(counts), dtype=np.uint8), counts)
+
+
+# Guess policies
+
+def always_greater(house, unseen, rng):
+    """Always guess 'g'."""
+    return np.ones(house.shape[0], dtype=bool)
+
+
+def random_guess(house, unseen, rng):
+    """Guess 'g' or 'l' with equal probability."""
+    return rng.random(house.shape[0]) < 0.5
+
+
+def majority_guess(house, unseen, rng):
+    """Guess the side that holds more of the unseen cards."""
+    greater = np.count_nonzero(unseen > house[:, None], axis=1)
+    less = np.count_nonzero(unseen < house[:, None], axis=1)
+    return greater >= less
+
+
+# Continue policies
+
+def always_stop(rewards, rounds, rng):
+    """Take the reward after the first correct guess."""
+    return np.zeros(rewards.shape[0], dtype=bool)
+
+
+def always_continue(rewards, rounds, rng):
+    """Keep doubling until a wrong guess or the match win threshold."""
+    return np.ones(rewards.shape[0], dtype=bool)
+
+
+class StopAt:
+    """Continue policy that stops once the reward reaches `target`."""
+    def __init__(self, target):
+        self.target = target
+
+    def __call__(self, rewards, rounds, rng):
+        return rewards < self.target
+
+
+class MatchStats:
+    """Outcome of a batch of simulated matches."""
+    def __init__(self, rewards, rounds, elapsed):
+        self.rewards = rewards
+        self.rounds = rounds
+        self.elapsed = elapsed
+
+    def __len__(self):
+        return len(self.rewards)
+
+    @property
+    def total_rounds(self):
+        return int(self.rounds.sum())
+
+    @property
+    def rounds_per_second(self):
+        return self.total_rounds / self.elapsed if self.elapsed > 0 else float('inf')
+
+    @property
+    def mean_reward(self):
+        return float(self.rewards.mean()) if len(self) else 0.0
+
+    def house_edge(self, match_cost):
+        """Return the house's expected profit per match as a fraction of `match_cost`."""
+        return (match_cost - self.mean_reward) / match_cost
+
+    def reward_distribution(self):
+        """Return {reward: probability} over all matches."""
+        return _distribution(self.rewards)
+
+    def rounds_distribution(self):
+        """Return {rounds played: probability} over all matches."""
+        return _distribution(self.rounds)
+
+    def summary(self, match_cost=None):
+        lines = [f"Matches: {len(self)}",
+                 f"Rounds: {self.total_rounds} ({self.rounds_per_second:,.0f} rounds/s)",
+                 f"Mean reward: {self.mean_reward:.4f}"]
+        if match_cost is not None:
+            lines.append(f"House edge at match cost {match_cost}: {self.house_edge(match_cost):.4%}")
+        lines.append("Reward distribution:")
+        lines.extend(f"  {reward:>6}: {p:.6f}" for reward, p in self.reward_distribution().items())
+        lines.append("Rounds distribution:")
+        lines.extend(f"  {rounds:>6}: {p:.6f}" for rounds, p in self.rounds_distribution().items())
+        return "\n".join(lines)
+
+
+class GameStats:
+    """Outcome of a batch of simulated games."""
+    def __init__(self, points, matches, won, elapsed):
+        self.points = points
+        self.matches = matches
+        self.won = won
+        self.elapsed = elapsed
+        self.total_rounds = 0
+
+    def __len__(self):
+        return len(self.points)
+
+    @property
+    def win_rate(self):
+        return float(self.won.mean()) if len(self) else 0.0
+
+    @property
+    def rounds_per_second(self):
+        return self.total_rounds / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def match_count_distribution(self):
+        """Return {matches played: probability} over all games."""
+        return _distribution(self.matches)
+
+    def summary(self):
+        lines = [f"Games: {len(self)}",
+                 f"Rounds: {self.total_rounds} ({self.rounds_per_second:,.0f} rounds/s)",
+                 f"Win rate: {self.win_rate:.4%}",
+                 f"Mean final points: {float(self.points.mean()):.2f}",
+                 "Matches per game:"]
+        lines.extend(f"  {matches:>6}: {p:.6f}" for matches, p in self.match_count_distribution().items())
+        return "\n".join(lines)
+
+
+def _distribution(values):
+    outcomes, counts = np.unique(values, return_counts=True)
+    total = counts.sum()
+    return {int(outcome): count / total for outcome, count in zip(outcomes, counts)}
+
+
+def _shuffled_decks(rng, deck, n):
+    decks = np.tile(deck, (n, 1))
+    return rng.permuted(decks, axis=1, out=decks)
+
+
+def _play_matches(n, initial_reward, win_threshold, guess_policy, continue_policy, rng, deck):
+    """Play `n` matches in lockstep. Returns (rewards, rounds, total rounds)."""
+    decks = _shuffled_decks(rng, deck, n)
+    rewards = np.full(n, initial_reward, dtype=np.int64)
+    rounds = np.zeros(n, dtype=np.int64)
+    active = np.arange(n)
+    position = 0
+    total_rounds = 0
+    while active.size:
+        if deck.size - position < 2:
+            decks[active] = _shuffled_decks(rng, deck, active.size)
+            position = 0
+        house = decks[active, position]
+        player = decks[active, position + 1]
+        unseen = decks[active, position + 1:]
+        position += 2
+        rounds[active] += 1
+        total_rounds += active.size
+
+        guess_greater = np.asarray(guess_policy(house, unseen, rng), dtype=bool)
+        correct = np.where(guess_greater, player > house, player < house)
+        rewards[active[~correct]] = 0
+        active = active[correct]
+
+        # Matches that reached the win threshold end automatically.
+        active = active[rewards[active] < win_threshold]
+        active = active[np.asarray(continue_policy(rewards[active], rounds[active], rng), dtype=bool)]
+        rewards[active] *= 2
+    return rewards, rounds, total_rounds
+
+
+def simulate_matches(n, initial_reward=20, win_threshold=1000, guess_policy=majority_guess,
+                     continue_policy=always_continue, rng=None, deck=None, batch_size=1 << 20):
+    """
+    Simulate `n` independent matches.
+    Args:
+        n (int): Number of matches.
+        initial_reward, win_threshold: Same meaning as in `Match`.
+        guess_policy, continue_policy: See the module docstring.
+        rng (numpy.random.Generator): Source of randomness, a fresh one if None.
+        deck (array-like): Card ordinals to deal from, the Joker deck if None.
+        batch_size (int): Maximum number of matches held in memory at once.
+    Returns:
+        MatchStats: Per-match rewards and round counts.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    deck = joker_deck_ordinals() if deck is None else np.asarray(deck, dtype=np.uint8)
+    rewards = np.empty(n, dtype=np.int64)
+    rounds = np.empty(n, dtype=np.int64)
+    start = time.perf_counter()
+    for lo in range(0, n, batch_size):
+        hi = min(n, lo + batch_size)
+        rewards[lo:hi], rounds[lo:hi], _ = _play_matches(
+            hi - lo, initial_reward, win_threshold, guess_policy, continue_policy, rng, deck)
+    return MatchStats(rewards, rounds, time.perf_counter() - start)
+
+
+def simulate_games(n, starting_points=60, match_cost=25, win_threshold=1000, lose_threshold=30,
+                   initial_reward=20, match_win_threshold=1000, guess_policy=majority_guess,
+                   continue_policy=always_continue, rng=None, deck=None, max_matches=100000):
+    """
+    Simulate `n` games following the console app's loop: pay for a match while
+    `can_play_match`, add the match reward and stop on `check_win`. Games still
+    running after `max_matches` matches count as neither won nor lost.
+    Returns:
+        GameStats: Final points, matches played and win flags per game.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    deck = joker_deck_ordinals() if deck is None else np.asarray(deck, dtype=np.uint8)
+    points = np.full(n, starting_points, dtype=np.int64)
+    matches = np.zeros(n, dtype=np.int64)
+    active = np.flatnonzero(points >= lose_threshold)
+    total_rounds = 0
+    start = time.perf_counter()
+    for _ in range(max_matches):
+        if not active.size:
+            break
+        paid = active[points[active] >= match_cost]
+        points[paid] -= match_cost
+        rewards, _, played = _play_matches(
+            active.size, initial_reward, match_win_threshold, guess_policy, continue_policy, rng, deck)
+        total_rounds += played
+        points[active] += rewards
+        matches[active] += 1
+        still_playing = (points[active] < win_threshold) & (points[active] >= lose_threshold)
+        active = active[still_playing]
+    stats = GameStats(points, matches, points >= win_threshold, time.perf_counter() - start)
+    stats.total_rounds = total_rounds
+    return stats
+
+
+_GUESS_POLICIES = {'majority': majority_guess, 'greater': always_greater, 'random': random_guess}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation of the card guessing game.")
+    parser.add_argument('--matches', type=int, default=1000000)
+    parser.add_argument('--games', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--guess', choices=sorted(_GUESS_POLICIES), default='majority')
+    parser.add_argument('--stop-at', type=int, default=None,
+                        help="Stop once the reward reaches this value (default: always continue).")
+    parser.add_argument('--initial-reward', type=int, default=20)
+    parser.add_argument('--match-cost', type=int, default=25)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    guess_policy = _GUESS_POLICIES[args.guess]
+    continue_policy = always_continue if args.stop_at is None else StopAt(args.stop_at)
+    stats = simulate_matches(args.matches, initial_reward=args.initial_reward, guess_policy=guess_policy,
+                             continue_policy=continue_policy, rng=rng)
+    print(stats.summary(args.match_cost))
+    if args.games:
+        games = simulate_games(args.games, match_cost=args.match_cost, initial_reward=args.initial_reward,
+                               guess_policy=guess_policy, continue_policy=continue_policy, rng=rng)
+        print(games.summary())
+
+
+if __name__ == "__main__":
+    main()
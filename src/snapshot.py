@@ -0,0 +1,221 @@
+"""
+Versioned binary snapshots of a GameSession.
+
+A snapshot is a fixed-layout header (struct, little-endian) followed by the
+remaining deck as one byte per card (`Card.ordinal`), bottom card last:
+
+    magic "NGSS", version
+    session state, match present flag, deck kind
+    game: points, match_cost, win_threshold, lose_threshold, matches played
+    match: initial_reward, potential_reward, win_threshold, rounds dealt,
+           house card, player card (0 when not dealt), deck length in bytes,
+           unshuffled cards left in a lazy deck
+    deck codes, or for a shoe: full size, penetration and a count per ordinal
+
+Bulk files ("NGSB") hold many sessions as fixed-size records, each padded to
+the deck capacity given in the file header, so record i lives at a known
+offset and `SnapshotReader` can serve it straight from a memory map.
+
+Shoes are saved as their remaining counts together with their full size and
+penetration, so the restored shoe reaches its cut card at the same point.
+Lazy decks are saved as they are, with the number of cards still waiting
+to be shuffled; saving never touches the live deck or its random source.
+The random source is not saved: the restored deck keeps its order, and any
+new deck (or pending lazy shuffle) draws from the rng given when loading.
+"""
+import mmap
+import struct
+
+from .card import Card
+from .deck import Deck, CompactDeck, LazyDeck
+from .game import Game
+from .match import Match
+from .session import GameSession
+from .shoe import Shoe
+
+MAGIC = b"NGSS"
+BULK_MAGIC = b"NGSB"
+VERSION = 4
+
+_HEADER = struct.Struct("<4sB")
+_BULK_HEADER = struct.Struct("<4sBH")
+_SESSION = struct.Struct("<BBBqqqqIqqqqBBIH")
+_SHOE = struct.Struct(f"<Id{Card.ORDINAL_LIMIT}I")
+
+_STATES = [GameSession.IDLE, GameSession.GUESSING, GameSession.DECIDING, GameSession.OVER]
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+_DECK_KINDS = [Deck, CompactDeck, Shoe, LazyDeck]
+
+
+def _pack_session(session, buffer, offset):
+    """Pack a session's fixed fields at `offset`. Returns the deck codes."""
+    game = session.game
+    match = session.match
+    if match is None:
+        codes = b""
+        _SESSION.pack_into(buffer, offset, _STATE_CODES[session.state], 0, 0,
+                           game.points, game.match_cost, game.win_threshold, game.lose_threshold,
+                           game.matches_played, 0, 0, 0, 0, 0, 0, 0, 0)
+        return codes
+    deck = match.deck
+    pending = 0
+    if isinstance(deck, CompactDeck):
+        kind, codes = 1, deck.to_bytes()
+    elif isinstance(deck, Shoe):
+        kind, codes = 2, _SHOE.pack(deck.size, deck.penetration, *deck.rank_counts())
+    else:
+        kind = _DECK_KINDS.index(type(deck)) if type(deck) in _DECK_KINDS else 0
+        if isinstance(deck, LazyDeck):
+            # The first `pending` codes are still unshuffled; their order does not matter
+            pending = deck._pending
+        codes = bytes(card.ordinal for card in deck._cards)
+    _SESSION.pack_into(buffer, offset, _STATE_CODES[session.state], 1, kind,
+                       game.points, game.match_cost, game.win_threshold, game.lose_threshold,
+                       game.matches_played, match.initial_reward, match.potential_reward, match.win_threshold,
+                       match.rounds,
+                       match.house_card.ordinal if match.house_card else 0,
+                       match.player_card.ordinal if match.player_card else 0,
+                       len(codes), pending)
+    return codes
+
+
+def _unpack_session(buffer, offset, rng, match_kwargs):
+    (state, has_match, kind, points, match_cost, win_threshold, lose_threshold, matches_played,
+     initial_reward, potential_reward, match_win_threshold, rounds, house, player, deck_len, pending) = \
+        _SESSION.unpack_from(buffer, offset)
+    game = Game(points, match_cost, win_threshold, lose_threshold, rng=rng)
+    game.matches_played = matches_played
+    session = GameSession(game, **match_kwargs)
+    session.state = _STATES[state]
+    if has_match:
+        start = offset + _SESSION.size
+        codes = bytes(buffer[start:start + deck_len])
+        if _DECK_KINDS[kind] is CompactDeck:
+            deck = CompactDeck.from_bytes(codes, rng)
+        elif _DECK_KINDS[kind] is Shoe:
+            size, penetration, *counts = _SHOE.unpack(codes)
+            deck = Shoe.from_counts(counts, size, penetration, rng)
+        elif _DECK_KINDS[kind] is LazyDeck:
+            deck = LazyDeck([Card.from_ordinal(code) for code in codes], shuffle_on_init=False, rng=rng)
+            deck._pending = pending
+        else:
+            deck = Deck([Card.from_ordinal(code) for code in codes], shuffle_on_init=False, rng=rng)
+        match = Match(**{**match_kwargs, "initial_reward": initial_reward, "win_threshold": match_win_threshold,
+                         "rng": rng, "deck": deck})
+        match.potential_reward = potential_reward
+        match.rounds = rounds
+        match.house_card = Card.from_ordinal(house) if house else None
+        match.player_card = Card.from_ordinal(player) if player else None
+        session.match = match
+    return session
+
+
+def dump_session(session):
+    """Return a snapshot of `session` as bytes."""
+    buffer = bytearray(_HEADER.size + _SESSION.size)
+    _HEADER.pack_into(buffer, 0, MAGIC, VERSION)
+    buffer += _pack_session(session, buffer, _HEADER.size)
+    return bytes(buffer)
+
+
+def load_session(data, rng=None, **match_kwargs):
+    """
+    Restore a GameSession from `dump_session()` bytes.
+    Args:
+        rng: Random source for the restored game and any new decks.
+        **match_kwargs: Match options for the session's future matches (e.g. deck_factory).
+    Raises ValueError on a wrong magic number or version.
+    """
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} session snapshot.")
+    return _unpack_session(data, _HEADER.size, rng, match_kwargs)
+
+
+class SnapshotWriter:
+    """
+    Write many session snapshots to one bulk file as fixed-size records.
+    A shoe always takes `_SHOE.size` bytes, so files holding shoes need at least that capacity.
+    """
+    def __init__(self, path, deck_capacity=54):
+        self.deck_capacity = deck_capacity
+        self.record_size = _SESSION.size + deck_capacity
+        self._record = bytearray(self.record_size)
+        self._file = open(path, "wb")
+        self._file.write(_BULK_HEADER.pack(BULK_MAGIC, VERSION, deck_capacity))
+        self.count = 0
+
+    def write(self, session):
+        """Append one session. Raises ValueError if its deck exceeds the capacity."""
+        record = self._record
+        codes = _pack_session(session, record, 0)
+        if len(codes) > self.deck_capacity:
+            raise ValueError(f"Deck of {len(codes)} cards exceeds capacity {self.deck_capacity}.")
+        end = _SESSION.size + len(codes)
+        record[_SESSION.size:end] = codes
+        record[end:] = bytes(self.record_size - end)
+        self._file.write(record)
+        self.count += 1
+
+    def write_many(self, sessions):
+        for session in sessions:
+            self.write(session)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SnapshotReader:
+    """Random access to a bulk snapshot file through a read-only memory map."""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            header = f.read(_BULK_HEADER.size)
+            magic, version, self.deck_capacity = _BULK_HEADER.unpack(header)
+            if magic != BULK_MAGIC or version != VERSION:
+                raise ValueError(f"Not a version {VERSION} bulk snapshot file.")
+            f.seek(0, 2)
+            size = f.tell()
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size > _BULK_HEADER.size else b""
+        self.record_size = _SESSION.size + self.deck_capacity
+        self._count = (size - _BULK_HEADER.size) // self.record_size
+
+    def __len__(self):
+        return self._count
+
+    def _offset(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Snapshot index out of range.")
+        return _BULK_HEADER.size + index * self.record_size
+
+    def load(self, index, rng=None, **match_kwargs):
+        """Restore session `index` as a GameSession."""
+        return _unpack_session(self._map, self._offset(index), rng, match_kwargs)
+
+    def points(self, index):
+        """Read only the points of session `index`, without restoring it."""
+        return _SESSION.unpack_from(self._map, self._offset(index))[3]
+
+    def __getitem__(self, index):
+        return self.load(index)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self.load(index)
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,212 @@
+"""
+Expected-value-optimal guesses and continue/stop decisions for a Match.
+
+Only the relative order of the remaining cards matters, so a deck is encoded
+as the tuple of its non-zero per-rank counts in rank order (ties lose both
+ways, as in `Match.is_guess_correct`). For decks of distinct cards this
+collapses to "n cards left", which keeps the memo table tiny: the whole
+standard 54-card Joker deck needs a few hundred entries.
+
+Values are computed by dynamic programming over two functions:
+
+* `_round_value(R, S)`: expected reward of dealing a round at potential
+  reward R from composition S and guessing optimally.
+* `_decision_value(R, S)`: expected reward right after a correct guess at
+  reward R with composition S left, choosing optimally between stopping
+  (R) and continuing (`_round_value(2R, S)`); R is final once it reaches
+  the win threshold.
+
+Decks with repeated ranks are solved exactly as well, but their state space
+grows quickly with the number of copies.
+
+Run `python -m src.solver --output table.json` to precompute and save the
+table for the standard Joker deck.
+"""
+import argparse
+import json
+
+from .deck import JokerDeckFactory
+
+
+def composition(cards):
+    """Return the compact composition key of an iterable of cards."""
+    counts = {}
+    for card in cards:
+        counts[card.ordinal] = counts.get(card.ordinal, 0) + 1
+    return tuple(counts[ordinal] for ordinal in sorted(counts))
+
+
+def deck_composition(deck):
+    """Return the compact composition key of a Deck's remaining cards."""
+    return _canonical(deck.rank_counts())
+
+
+class OptimalStopSolver:
+    """
+    Memoized solver for one match configuration. Asking it about a match with a
+    different win threshold raises ValueError.
+    Args:
+        win_threshold (int): Match win threshold; rewards at or above it end the match.
+        fresh_deck (iterable of Card): Cards of a new deck, dealt from after a reset.
+            Defaults to the 54-card Joker deck.
+    """
+    def __init__(self, win_threshold=1000, fresh_deck=None):
+        self.win_threshold = win_threshold
+        if fresh_deck is None:
+            self.fresh = deck_composition(JokerDeckFactory().create_deck(shuffle_on_init=False))
+        else:
+            self.fresh = composition(fresh_deck)
+        self._round_memo = {}
+
+    def _round_value(self, reward, counts):
+        if sum(counts) < 2:
+            # Match.reset_deck_if_needed deals from a fresh deck
+            counts = self.fresh
+        key = (reward, counts)
+        value = self._round_memo.get(key)
+        if value is not None:
+            return value
+
+        n = sum(counts)
+        if len(counts) == n:
+            # All cards distinct: every child composition is n - 2 distinct cards,
+            # and a house card of rank i has i cards below it and n - 1 - i above.
+            child = self._decision_value(reward, counts[:-2])
+            value = sum(max(i, n - 1 - i) for i in range(n)) * child / (n * (n - 1))
+        else:
+            value = 0.0
+            for i, house_count in enumerate(counts):
+                after_house = _take(counts, i)
+                less = greater = 0.0
+                for j, count in enumerate(after_house):
+                    if j == i or not count:
+                        continue
+                    child = self._decision_value(reward, _canonical(_take(after_house, j)))
+                    if j < i:
+                        less += count * child
+                    else:
+                        greater += count * child
+                value += house_count * max(less, greater)
+            value /= n * (n - 1)
+        self._round_memo[key] = value
+        return value
+
+    def _decision_value(self, reward, counts):
+        if reward >= self.win_threshold or reward <= 0:
+            return reward
+        return max(reward, self._round_value(reward * 2, counts))
+
+    def value(self, reward, deck_counts):
+        """Expected reward of playing a round at `reward` from a deck with the given composition."""
+        return self._round_value(reward, tuple(deck_counts))
+
+    def _check(self, match):
+        if match.win_threshold != self.win_threshold:
+            raise ValueError(f"Solver was built for win threshold {self.win_threshold}, "
+                             f"but the match uses {match.win_threshold}.")
+
+    def continue_value(self, match):
+        """Expected reward of doubling after a correct guess in `match`."""
+        self._check(match)
+        return self._round_value(match.get_reward() * 2, deck_composition(match.deck))
+
+    def should_continue(self, match):
+        """Return True if doubling beats taking the current reward after a correct guess."""
+        self._check(match)
+        reward = match.get_reward()
+        if reward >= self.win_threshold or reward <= 0:
+            return False
+        return self.continue_value(match) > reward
+
+    def best_guess(self, match):
+        """
+        Return the guess ('g' or 'l') with the higher expected reward for the
+        current house card. The player's card is unknown, so it is drawn from
+        the rest of the deck plus itself.
+        """
+        self._check(match)
+        house = match.house_card.ordinal
+        unseen = match.deck.rank_counts()
+        unseen[match.player_card.ordinal] += 1
+        reward = match.get_reward()
+        less = greater = 0.0
+        if all(count <= 1 for count in unseen):
+            # Every outcome leaves the same composition, so compare card counts.
+            less = sum(unseen[:house])
+            greater = sum(unseen[house + 1:])
+        else:
+            for ordinal, count in enumerate(unseen):
+                if not count or ordinal == house:
+                    continue
+                unseen[ordinal] -= 1
+                child = self._decision_value(reward, _canonical(unseen))
+                unseen[ordinal] += 1
+                if ordinal < house:
+                    less += count * child
+                else:
+                    greater += count * child
+        return "g" if greater >= less else "l"
+
+    def precompute(self, initial_reward=20):
+        """
+        Fill the memo table for every reward level a match starting at
+        `initial_reward` can reach. For decks of distinct cards every deck size
+        is covered, so later queries are table lookups.
+        Returns:
+            float: Expected reward of a new match under optimal play.
+        """
+        distinct = len(self.fresh) == sum(self.fresh)
+        reward = initial_reward
+        while reward > 0:
+            if distinct:
+                for n in range(2, len(self.fresh) + 1):
+                    self._round_value(reward, (1,) * n)
+            if reward >= self.win_threshold:
+                break
+            reward *= 2
+        return self._round_value(initial_reward, self.fresh)
+
+    def save(self, path):
+        """Write the memo table to a JSON file."""
+        entries = [[reward, list(counts), value] for (reward, counts), value in self._round_memo.items()]
+        with open(path, "w") as f:
+            json.dump({"win_threshold": self.win_threshold, "fresh": list(self.fresh), "entries": entries}, f)
+
+    @classmethod
+    def load(cls, path):
+        """Read a solver and its memo table from a JSON file written by `save()`."""
+        with open(path) as f:
+            data = json.load(f)
+        solver = cls.__new__(cls)
+        solver.win_threshold = data["win_threshold"]
+        solver.fresh = tuple(data["fresh"])
+        solver._round_memo = {(reward, tuple(counts)): value for reward, counts, value in data["entries"]}
+        return solver
+
+
+def _take(counts, i):
+    counts = list(counts)
+    counts[i] -= 1
+    return counts
+
+
+def _canonical(counts):
+    return tuple(count for count in counts if count)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the optimal-stopping table for the Joker deck.")
+    parser.add_argument('--initial-reward', type=int, default=20)
+    parser.add_argument('--win-threshold', type=int, default=1000)
+    parser.add_argument('--output', default="solver_table.json")
+    args = parser.parse_args(argv)
+
+    solver = OptimalStopSolver(args.win_threshold)
+    value = solver.precompute(args.initial_reward)
+    solver.save(args.output)
+    print(f"Expected match reward under optimal play: {value:.4f}")
+    print(f"Saved {len(solver._round_memo)} entries to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Parameter sweeps over Game and Match settings.
+
+Every grid point is a full configuration (starting_points, match_cost,
+win_threshold, lose_threshold, initial_reward) simulated with
+`session_simulator.simulate_sessions`. Points are spread over a process pool
+and finish in any order. Results are stored in a content-addressed cache:
+one JSON file per point, named by the SHA-256 of the configuration, player,
+session count and seed. Points already in the cache are not recomputed.
+
+Results are appended to a CSV file as they complete. The file has a `key`
+column, so an interrupted sweep can simply be run again: cached points are
+skipped and rows already in the CSV are not written twice. Only a couple of
+points per worker are queued at a time, and an interrupted sweep cancels
+them instead of waiting for the rest of the grid.
+
+    python -m src.sweep --starting-points 60,100 --match-cost 20,25,30 --output sweep.csv
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice, product
+
+from .session import GUESSES, always_continue_policy, ContinueBelow
+from .session_simulator import simulate_sessions
+
+AXES = ("starting_points", "match_cost", "win_threshold", "lose_threshold", "initial_reward")
+DEFAULTS = {"starting_points": 60, "match_cost": 25, "win_threshold": 1000, "lose_threshold": 30,
+            "initial_reward": 20}
+RESULT_FIELDS = ("sessions", "win_rate", "bankruptcy_rate", "mean_matches", "elapsed")
+
+
+def grid(**axes):
+    """
+    Return every combination of the given axis values as config dicts.
+    Axes that are not given keep their default value.
+    Example: grid(match_cost=[20, 25], initial_reward=[10, 20]) gives 4 configs.
+    """
+    unknown = set(axes) - set(AXES)
+    if unknown:
+        raise ValueError(f"Unknown sweep axes: {sorted(unknown)}")
+    values = [axes.get(axis, [DEFAULTS[axis]]) for axis in AXES]
+    return [dict(zip(AXES, combination)) for combination in product(*values)]
+
+
+def point_key(config, sessions, seed, guess="majority", stop_at=None):
+    """Return the cache key of one grid point: the SHA-256 of its canonical JSON description."""
+    description = {"config": {axis: config[axis] for axis in AXES}, "sessions": sessions, "seed": seed,
+                   "guess": guess, "stop_at": stop_at}
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    """Directory of JSON results, one file per key, written atomically."""
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def get(self, key):
+        """Return the stored result for `key`, or None."""
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, result):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp, path)
+
+
+def evaluate_point(config, sessions, seed, guess="majority", stop_at=None):
+    """Simulate one grid point in this process and return its result dict."""
+    game_config = {axis: config[axis] for axis in AXES if axis != "initial_reward"}
+    choose_continue = always_continue_policy if stop_at is None else ContinueBelow(stop_at)
+    stats = simulate_sessions(sessions, seed, workers=1, game_config=game_config,
+                              match_config={"initial_reward": config["initial_reward"]},
+                              choose_guess=GUESSES[guess], choose_continue=choose_continue)
+    return {"sessions": stats.sessions, "win_rate": stats.win_rate, "bankruptcy_rate": stats.bankruptcy_rate,
+            "mean_matches": stats.total_matches / max(stats.sessions, 1), "elapsed": stats.elapsed}
+
+
+def _written_keys(csv_path):
+    if csv_path is None or not os.path.exists(csv_path):
+        return set()
+    with open(csv_path, newline="") as f:
+        return {row["key"] for row in csv.DictReader(f)}
+
+
+def _run_pool(pending, workers, args, cache, finish):
+    """Evaluate `pending` {key: config} on a process pool, keeping at most 2 points per worker in flight."""
+    todo = iter(pending.items())
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(evaluate_point, config, *args): key
+                   for key, config in islice(todo, 2 * workers)}
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = futures.pop(future)
+                result = future.result()
+                cache.put(key, result)
+                finish(key, pending[key], result)
+            for key, config in islice(todo, len(done)):
+                futures[executor.submit(evaluate_point, config, *args)] = key
+    except BaseException:
+        # Ctrl-C or a failed point: drop the queued points instead of running them to completion
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def run_sweep(configs, sessions=10000, seed=0, cache_dir=".sweep_cache", csv_path=None, workers=None,
+              guess="majority", stop_at=None):
+    """
+    Evaluate every config, reusing cached results.
+    Args:
+        configs (list of dict): Grid points, e.g. from `grid()`.
+        sessions (int): Games simulated per point.
+        seed (int): Seed shared by every point, so points are compared on the same random streams.
+        cache_dir (str): Directory of the result cache.
+        csv_path (str): CSV file results are appended to as they complete; None to skip.
+        workers (int): Number of processes, os.cpu_count() if None. 1 runs in-process.
+        guess (str): 'majority' or 'greater'.
+        stop_at (int): Stop a match once its reward reaches this value; None always continues.
+    Returns:
+        list of dict: One row per config, in `configs` order, with its key, config and results.
+    """
+    cache = ResultCache(cache_dir)
+    keys = [point_key(config, sessions, seed, guess, stop_at) for config in configs]
+    written = _written_keys(csv_path)
+    rows = {}
+
+    out = writer = None
+    if csv_path is not None:
+        new_file = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+        out = open(csv_path, "a", newline="")
+        writer = csv.DictWriter(out, fieldnames=("key",) + AXES + RESULT_FIELDS)
+        if new_file:
+            writer.writeheader()
+
+    def finish(key, config, result):
+        row = {"key": key, **{axis: config[axis] for axis in AXES}, **result}
+        rows[key] = row
+        if writer is not None and key not in written:
+            writer.writerow(row)
+            out.flush()
+            written.add(key)
+
+    try:
+        pending = {}
+        for key, config in zip(keys, configs):
+            if key in rows or key in pending:
+                continue
+            result = cache.get(key)
+            if result is not None:
+                finish(key, config, result)
+            else:
+                pending[key] = config
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            for key, config in pending.items():
+                result = evaluate_point(config, sessions, seed, guess, stop_at)
+                cache.put(key, result)
+                finish(key, config, result)
+        elif pending:
+            _run_pool(pending, workers, (sessions, seed, guess, stop_at), cache, finish)
+    finally:
+        if out is not None:
+            out.close()
+    return [rows[key] for key in keys]
+
+
+def _int_list(text):
+    return [int(value) for value in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep Game and Match settings with a persistent result cache.")
+    for axis in AXES:
+        parser.add_argument('--' + axis.replace('_', '-'), type=_int_list, default=[DEFAULTS[axis]],
+                            help="Comma-separated values.")
+    parser.add_argument('--sessions', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--cache-dir', default=".sweep_cache")
+    parser.add_argument('--output', default="sweep.csv")
+    parser.add_argument('--guess', choices=sorted(GUESSES), default='majority')
+    parser.add_argument('--stop-at', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    configs = grid(**{axis: getattr(args, axis) for axis in AXES})
+    rows = run_sweep(configs, args.sessions, args.seed, args.cache_dir, args.output, args.workers,
+                     args.guess, args.stop_at)
+    best = max(rows, key=lambda row: row["win_rate"])
+    print(f"Swept {len(rows)} points into {args.output}")
+    print("Highest win rate: " + ", ".join(f"{axis}={best[axis]}" for axis in AXES) + f" ({best['win_rate']:.4%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Multiplayer tables: many players against one shared house card per round.
+
+A `Table` deals from a count-based shoe like `Shoe`, kept as a NumPy array
+of per-ordinal counts. Each round deals one house card and then every
+active player's card in a single multivariate hypergeometric draw from the
+counts, followed by one permutation. Guesses are checked against the house
+card in one vectorized comparison, and rewards live in an array, so a round
+costs a few array operations however many players sit at the table.
+
+Each player follows the `Match` rules: ties lose both ways, a wrong guess
+removes the reward, and, as in `MatchBatch`, a player's match ends on a
+wrong guess, on `stop()`, or when the reward reaches the win threshold.
+The shoe is refilled before a round once its cut card is reached or it
+cannot serve every active player.
+"""
+import numpy as np
+
+from .card import Card
+from .match_batch import correct_guesses
+from .shoe import ShoeFactory
+
+
+class Table:
+    """
+    A house and `players` players sharing one shoe.
+    Args:
+        players (int): Number of players.
+        initial_reward, win_threshold: Same meaning as in `Match`.
+        deck_factory (DeckFactory): Gives the shoe's composition; defaults to a Joker
+            ShoeFactory with enough decks for every player.
+        penetration (float): Fraction of the shoe dealt before it is refilled.
+        rng (numpy.random.Generator): Source of randomness, a fresh one if None.
+    """
+    def __init__(self, players, initial_reward=20, win_threshold=1000, deck_factory=None, penetration=0.75,
+                 rng=None):
+        self.rng = np.random.default_rng() if rng is None else rng
+        if deck_factory is None:
+            deck_factory = ShoeFactory(num_decks=max(8, -(-(players + 1) * 2 // 54)))
+        self.fresh = np.array(deck_factory.create_deck(shuffle_on_init=False).rank_counts(), dtype=np.int64)
+        if self.fresh.sum() < players + 1:
+            raise ValueError("The deck is too small to deal a card to every player.")
+        self.size = int(self.fresh.sum())
+        self.penetration = penetration
+        self.initial_reward = initial_reward
+        self.win_threshold = win_threshold
+        self.counts = self.fresh.copy()
+        self.house = 0
+        self.player = np.zeros(players, dtype=np.uint8)
+        self.rewards = np.full(players, initial_reward, dtype=np.int64)
+        self.rounds = np.zeros(players, dtype=np.int64)
+        self.active = np.ones(players, dtype=bool)
+
+    def __len__(self):
+        return len(self.rewards)
+
+    @property
+    def house_card(self):
+        """The current house card, or None before the first deal."""
+        return Card.from_ordinal(self.house) if self.rounds.any() else None
+
+    def shuffle(self):
+        """Refill the shoe with its full composition."""
+        self.counts = self.fresh.copy()
+
+    def cut_card_reached(self):
+        """Returns True once the penetration point has been dealt."""
+        return self.size - self.counts.sum() >= self.penetration * self.size
+
+    def _rows(self, mask):
+        return np.flatnonzero(self.active if mask is None else self.active & mask)
+
+    def deal(self):
+        """
+        Deal the shared house card and one card to every active player.
+        Returns:
+            Card: The house card.
+        """
+        rows = self._rows(None)
+        if self.counts.sum() < rows.size + 1 or self.cut_card_reached():
+            self.shuffle()
+        position = self.rng.integers(self.counts.sum())
+        self.house = int(np.searchsorted(np.cumsum(self.counts), position, side="right"))
+        self.counts[self.house] -= 1
+        drawn = self.rng.multivariate_hypergeometric(self.counts, rows.size)
+        self.counts -= drawn
+        ordinals = np.repeat(np.arange(Card.ORDINAL_LIMIT, dtype=np.uint8), drawn)
+        self.player[rows] = self.rng.permutation(ordinals)
+        self.rounds[rows] += 1
+        return Card.from_ordinal(self.house)
+
+    def step(self, guesses):
+        """
+        Check every player's guess against the house card and end the matches that guessed wrong.
+        Args:
+            guesses (array-like): 'g'/'l' per player, or booleans where True means 'g'.
+                Anything else is a wrong guess. Inactive players are ignored.
+        Returns:
+            numpy.ndarray: Boolean array, True where an active player guessed right.
+        """
+        correct = self.active & correct_guesses(guesses, self.player, self.house)
+        self.rewards[self.active & ~correct] = 0
+        self.active &= correct
+        self.active &= self.rewards < self.win_threshold
+        return correct
+
+    def double(self, mask=None):
+        """Double the potential reward of every active player (or those in `mask`)."""
+        self.rewards[self._rows(mask)] *= 2
+
+    def stop(self, mask=None):
+        """
+        End the match of every active player (or those in `mask`) with their current reward.
+        Returns:
+            numpy.ndarray: Rewards of all players.
+        """
+        self.active[self._rows(mask)] = False
+        return self.rewards
+
+    def odds(self):
+        """
+        Return (P(greater), P(less)) arrays for every player's card, drawn from
+        the rest of the shoe plus their own card, as in `Match.odds`.
+        """
+        unseen = self.counts.sum() + 1
+        greater = self.counts[self.house + 1:].sum() + (self.player > self.house)
+        less = self.counts[:self.house].sum() + (self.player < self.house)
+        return greater / unseen, less / unseen
@@ -0,0 +1,33 @@
+import io
+import random
+import app
+from src.game import Game
+
+def test_batch_strategy_is_reproducible():
+    first, second = io.StringIO(), io.StringIO()
+    app.play_batch(20, app.strategy_reader(*app.STRATEGIES["majority"]), first, seed=1)
+    app.play_batch(20, app.strategy_reader(*app.STRATEGIES["majority"]), second, seed=1)
+    assert first.getvalue() == second.getvalue()
+    summaries = [line for line in first.getvalue().splitlines() if line.startswith("game=")]
+    assert len(summaries) == 20
+    assert all("result=win" in line or "result=bankrupt" in line for line in summaries)
+
+def test_batch_script_runs_out():
+    out = io.StringIO()
+    # One answer is never enough: a game has at least two guesses or a guess and a decision
+    games = app.play_batch(3, app.script_reader(["g\n"]), out, seed=2,
+                           transcript=False)
+    assert games == []
+    assert out.getvalue().startswith("game=1 result=unfinished")
+
+def test_run_game_rules():
+    lines = []
+    answers = app.script_reader(["G\n", " y \n"] * 200)
+    game = app.run_game(Game(rng=random.Random(3)), answers, lines.append)
+    assert lines[0] == "START THE GAME WITH 60 POINTS"
+    assert lines[-1] == f"Final score: {game.points}"
+    # Answers are normalized, and anything but "stop" doubles the reward
+    for previous, line in zip(lines, lines[1:]):
+        if line.startswith("Reward doubled"):
+            assert previous == "Correct!"
+    assert "Reward doubled to 40" in lines or "Wrong!" in lines
@@ -0,0 +1,17 @@
+from benchmarks.bench import BENCHMARKS, find_regressions, measure, missing_benchmarks
+
+def test_find_regressions():
+    baseline = {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}}
+    results = {"a": {"ops_per_sec": 85.0}, "b": {"ops_per_sec": 70.0}, "c": {"ops_per_sec": 1.0}}
+    assert find_regressions(results, baseline, 0.2) == [("b", 70.0, 100.0)]
+    assert find_regressions(results, baseline, 0.2, ["a"]) == []
+    # A checked name that was not run or has no baseline is reported, not skipped
+    assert missing_benchmarks(results, baseline, ["a", "c", "typo"]) == ["c", "typo"]
+
+def test_measure():
+    assert "match_round" in BENCHMARKS
+    result = measure("card_sort", repeat=1, min_time=0)
+    assert result["ops_per_sec"] > 0
+    assert result["peak_bytes"] >= 0
+    # The sorted list it returns is one block of at least 54 pointers
+    assert result["alloc_blocks"] >= 1 and result["alloc_bytes"] >= 54 * 8
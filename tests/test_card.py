@@ -106,4 +106,27 @@ def test_repr():
 
     card3 = Card('10', 'Club')
     assert repr(card3) == "10 of Club"
-    
\ No newline at end of file
+    
+def test_flyweight():
+    # Equal cards are the same interned instance
+    assert Card('A', 'Spade') is Card('A', 'Spade')
+    assert Card('Red Joker') is Card('Red Joker')
+
+    # Cards can be looked up by ordinal and used as dict keys
+    card = Card('Q', 'Diamond')
+    assert Card.from_ordinal(card.ordinal) is card
+    assert {card: 1}[Card('Q', 'Diamond')] == 1
+    with pytest.raises(ValueError):
+        Card.from_ordinal(0)
+
+    # Interned cards cannot be mutated
+    with pytest.raises(AttributeError):
+        card.value = 'K'
+
+def test_suitless_ordering():
+    # A card without a suit is neither equal to nor less than a suited card of the same value
+    plain_A = Card('A')
+    spade_A = Card('A', 'Spade')
+    assert plain_A != spade_A
+    assert not (plain_A < spade_A)
+    assert not (spade_A < plain_A)
@@ -0,0 +1,132 @@
+import heapq
+import itertools
+import threading
+import time
+import types
+import pytest
+import gui_app
+from src.gui_worker import BackgroundRunner, WidgetBatcher
+
+class FakeRoot:
+    """Stands in for tk.Tk: runs after() callbacks from run_until() on the test thread."""
+    def __init__(self):
+        self._timers = []
+        self._order = itertools.count()
+
+    def title(self, text):
+        pass
+
+    def after(self, ms, callback):
+        heapq.heappush(self._timers, (time.perf_counter() + ms / 1000, next(self._order), callback))
+
+    def run_until(self, condition, timeout=5.0):
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline:
+                raise TimeoutError("Condition not reached.")
+            if self._timers and self._timers[0][0] <= time.perf_counter():
+                heapq.heappop(self._timers)[2]()
+            else:
+                time.sleep(0.001)
+
+class FakeWidget:
+    def __init__(self, parent=None, **options):
+        self.options = dict(options)
+        self.config_calls = 0
+        self.visible = False
+
+    def config(self, **options):
+        self.config_calls += 1
+        self.options.update(options)
+
+    def pack(self, **options):
+        self.visible = True
+
+    def pack_forget(self):
+        self.visible = False
+
+@pytest.fixture
+def app(monkeypatch):
+    fake_tk = types.SimpleNamespace(Label=FakeWidget, Button=FakeWidget, Frame=FakeWidget,
+                                    LEFT="left", DISABLED="disabled")
+    monkeypatch.setattr(gui_app, "tk", fake_tk)
+    app = gui_app.GUIApp(FakeRoot())
+    yield app
+    app.runner.shutdown()
+
+def test_runner_delivers_on_calling_thread():
+    root = FakeRoot()
+    runner = BackgroundRunner(root)
+    results = []
+    runner.submit(threading.get_ident, results.append)
+    assert runner.busy
+    root.run_until(lambda: results)
+    assert results[0] != threading.get_ident()
+    assert not runner.busy
+
+    errors = []
+    runner.submit(lambda: 1 / 0, results.append, on_error=errors.append)
+    root.run_until(lambda: errors)
+    assert isinstance(errors[0], ZeroDivisionError)
+    runner.shutdown()
+
+def test_runner_recovers_from_unhandled_error():
+    root = FakeRoot()
+    runner = BackgroundRunner(root)
+    results = []
+    runner.submit(lambda: 1 / 0, results.append)
+    runner.submit(lambda: "next", results.append)
+    with pytest.raises(ZeroDivisionError):
+        root.run_until(lambda: False)
+    # The other job is still delivered and the runner becomes idle again
+    root.run_until(lambda: results)
+    assert results == ["next"]
+    assert not runner.busy
+    runner.shutdown()
+
+def test_failed_deal_restores_start(app, monkeypatch):
+    def broken():
+        raise RuntimeError("deck factory failed")
+    monkeypatch.setattr(app, "_deal_new_match", broken)
+    app.start_match()
+    app.root.run_until(lambda: not app.runner.busy)
+    assert app.start_button.visible
+    assert app.game.points == 60
+    app.root.run_until(lambda: "try again" in app.status_label.options.get("text", ""))
+
+def test_batcher_coalesces_updates():
+    root = FakeRoot()
+    batcher = WidgetBatcher(root)
+    label = FakeWidget()
+    for i in range(100):
+        batcher.config(label, text=str(i))
+    assert label.config_calls == 0
+    root.run_until(lambda: label.config_calls)
+    assert label.config_calls == 1
+    assert label.options["text"] == "99"
+
+def test_callback_latency(app):
+    # Clicking only queues work: the callbacks return long before the results are shown
+    start = time.perf_counter()
+    app.start_match()
+    callback_latency = time.perf_counter() - start
+    app.root.run_until(lambda: app.card_label.options["text"].startswith("House's Card:"))
+    shown_latency = time.perf_counter() - start
+    assert app.match is not None
+    assert app.guess_frame.visible
+
+    start = time.perf_counter()
+    app.make_guess("g")
+    guess_latency = time.perf_counter() - start
+    app.root.run_until(lambda: not app.runner.busy and "Your Card" in app.card_label.options.get("text", ""))
+
+    assert shown_latency < 5.0
+    assert callback_latency < 0.05
+    assert guess_latency < 0.05
+
+def test_clicks_while_busy_are_ignored(app):
+    app.start_match()
+    app.start_match()
+    app.root.run_until(lambda: not app.runner.busy)
+    # Only one match was paid for
+    assert app.game.points == 35
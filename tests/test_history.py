@@ -0,0 +1,52 @@
+import random
+import statistics
+import pytest
+from src.game import Game
+from src.history import MatchHistory
+from src.session import play_game, majority_guess_policy, ContinueBelow
+
+def test_rolling_statistics_match_window():
+    rng = random.Random(1)
+    history = MatchHistory(capacity=50)
+    matches = [(rng.choice([0, 0, 20, 40, 80]), rng.randint(1, 4)) for _ in range(180)]
+    for reward, rounds in matches:
+        history.add(reward, rounds)
+
+    window = [reward for reward, _ in matches[-50:]]
+    assert len(history) == 50
+    assert history.total == 180
+    assert history.mean == pytest.approx(statistics.fmean(window))
+    assert history.variance == pytest.approx(statistics.pvariance(window))
+    assert history.win_rate == pytest.approx(sum(reward > 0 for reward in window) / 50)
+
+def test_streaks():
+    history = MatchHistory(capacity=3)
+    for reward in [20, 40, 20, 0, 0, 20, 0, 0, 0, 0]:
+        history.add(reward, 1)
+    assert history.longest_win_streak == 3
+    assert history.longest_loss_streak == 4
+    assert history.current_streak == -4
+
+def test_to_numpy_views():
+    np = pytest.importorskip("numpy")
+    history = MatchHistory(capacity=4)
+    for reward in [10, 20, 30, 40, 50, 60]:
+        history.add(reward, reward // 10)
+    rewards, rounds, won = history.to_numpy()
+    assert np.roll(rewards, -history.start).tolist() == [30, 40, 50, 60]
+    assert np.roll(rounds, -history.start).tolist() == [3, 4, 5, 6]
+    assert won.all()
+    # The views share memory with the history
+    history.add(0, 1)
+    assert 0 in rewards.tolist()
+
+def test_game_records_matches():
+    game = play_game(Game(rng=random.Random(4), history_size=5), majority_guess_policy, ContinueBelow(80))
+    assert game.history.total == game.matches_played
+    rewards, rounds, _ = game.history.to_numpy()
+    assert (rounds >= 1).all()
+    assert set(rewards.tolist()) <= {0, 80}
+
+def test_history_is_opt_in():
+    game = play_game(Game(rng=random.Random(5)), majority_guess_policy, ContinueBelow(80))
+    assert game.history is None
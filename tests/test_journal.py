@@ -0,0 +1,84 @@
+import random
+import pytest
+from src.card import Card
+from src.game import Game
+from src import journal as journal_module
+from src.journal import Journal, JournalReader, DEAL, GUESS, REWARD, POINTS
+from src.session import play_game, majority_guess_policy, ContinueBelow
+
+def _play(journal, seeds):
+    games = []
+    for seed in seeds:
+        game = Game(rng=random.Random(seed), journal=journal)
+        games.append(play_game(game, majority_guess_policy, ContinueBelow(80)))
+    journal.flush()
+    return games
+
+def test_journal_records_every_event(tmp_path):
+    path = tmp_path / "games.journal"
+    with Journal(path) as journal:
+        games = _play(journal, range(20))
+
+    reader = JournalReader(path, chunk_size=7)
+    counts = reader.event_counts()
+    assert counts[DEAL] == counts[GUESS]
+    assert counts[POINTS] > 0 and counts[REWARD] > 0
+
+    # Replaying the POINTS events gives every game's final score
+    final_points = {}
+    def on_record(session, match, round_number, event, house, player, guess, correct, value):
+        if event == POINTS:
+            final_points[session] = value
+        if event == GUESS and chr(guess) == "g":
+            assert correct == (Card.from_ordinal(player) > Card.from_ordinal(house))
+    reader.replay(on_record)
+    assert [final_points[session] for session in sorted(final_points)] == [game.points for game in games]
+
+def test_journal_aggregates(tmp_path):
+    path = tmp_path / "games.journal"
+    with Journal(path) as journal:
+        _play(journal, range(30))
+    reader = JournalReader(path)
+
+    win_rates = reader.card_win_rates()
+    assert sum(total for _, total in win_rates.values()) == reader.event_counts()[GUESS]
+    # The Red Joker is the highest card, so guessing 'l' against it always wins
+    correct, total = win_rates.get(Card('Red Joker').ordinal, (0, 0))
+    assert correct == total
+
+    survival = reader.round_survival()
+    assert min(survival) == 1
+    assert set(reader.reward_curve()) <= {0, 20, 40, 80}
+
+def test_journal_appends_sessions(tmp_path):
+    path = tmp_path / "games.journal"
+    with Journal(path) as journal:
+        assert journal.new_session() == 1
+        journal.write(1, 0, 0, POINTS, value=60)
+    with Journal(path) as journal:
+        assert journal.new_session() == 2
+    assert len(JournalReader(path)) == 1
+
+    (tmp_path / "other").write_bytes(b"not a journal")
+    with pytest.raises(ValueError):
+        JournalReader(tmp_path / "other")
+
+def test_reopen_with_interleaved_sessions(tmp_path, monkeypatch):
+    # Scan a few records at a time so the test crosses chunk boundaries
+    monkeypatch.setattr(journal_module, "_SCAN_RECORDS", 2)
+    path = tmp_path / "games.journal"
+    with Journal(path) as journal:
+        first, second = journal.new_session(), journal.new_session()
+        for _ in range(3):
+            journal.write(second, 0, 0, POINTS, value=60)
+        # Session 1 writes last, after session 2 has already started
+        journal.write(first, 0, 0, POINTS, value=60)
+    size = path.stat().st_size
+    with Journal(path) as journal:
+        assert journal.new_session() == 3
+    # Reopening only ever appends
+    assert path.stat().st_size == size
+
+    (tmp_path / "other").write_bytes(b"not a journal")
+    with pytest.raises(ValueError):
+        Journal(tmp_path / "other")
@@ -0,0 +1,54 @@
+import pytest
+from src.deck import DeckPool
+from src.loadtest import (parse_think, percentile, run_load, ramp, ConstantThink, UniformThink, ExponentialThink)
+from src.session import always_stop_policy, majority_guess_policy
+
+def test_parse_think():
+    assert isinstance(parse_think("0.01"), ConstantThink)
+    assert parse_think("const:0.02").seconds == 0.02
+    assert isinstance(parse_think("uniform:0:0.02"), UniformThink)
+    assert parse_think("exp:0.5").mean == 0.5
+    with pytest.raises(ValueError):
+        parse_think("normal:1:2")
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0.0
+
+def test_run_load_counts_every_action():
+    report = run_load(8, think=ExponentialThink(0.0005), seed=1, max_matches=5)
+    counts = {action: len(values) for action, values in report.latencies.items()}
+    assert counts["pay_for_match"] == counts["add_reward"] == report.matches
+    assert counts["deal_cards"] == counts["is_guess_correct"] >= report.matches
+    assert report.games == 8
+    assert report.actions_per_second > 0
+    p50, p95, p99 = report.percentiles("deal_cards")
+    assert 0 < p50 <= p95 <= p99
+
+    # Every player has its own seeded stream, so the games do not depend on thread timing
+    again = run_load(8, think=ExponentialThink(0.0005), seed=1, max_matches=5)
+    assert again.matches == report.matches
+
+def test_think_time_does_not_change_games():
+    def house_cards(think):
+        seen = []
+        def choose_guess(match):
+            seen.append((match.house_card.ordinal, match.player_card.ordinal))
+            return majority_guess_policy(match)
+        run_load(6, think=think, seed=2, max_matches=8, choose_guess=choose_guess)
+        # Threads interleave, so compare the deals as a multiset
+        return sorted(seen)
+    assert house_cards(ConstantThink(0.0)) == house_cards(UniformThink(0.0, 0.0002)) == \
+        house_cards(ExponentialThink(0.0001))
+
+def test_ramp_with_shared_pool():
+    pool = DeckPool(size=4)
+    try:
+        reports = ramp([1, 4, 16], max_matches=3, choose_continue=always_stop_policy,
+                       match_config={"deck_factory": pool})
+    finally:
+        pool.close()
+    assert [report.players for report in reports] == [1, 4, 16]
+    assert all("double_reward" in report.summary() for report in reports)
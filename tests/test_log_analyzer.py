@@ -0,0 +1,79 @@
+from src.log_analyzer import analyze
+
+LOG = """\
+2025-07-18 00:05:43,326 [INFO] Attempting to start a new match. Current point is 60
+2025-07-18 00:05:43,326 [INFO] House card dealt: 5 of Heart
+2025-07-18 00:05:45,057 [INFO] Player guessed 'g'
+2025-07-18 00:05:45,057 [INFO] House card: 5 of Heart, Player card: J of Diamond
+2025-07-18 00:05:45,068 [INFO] Guess is correct.
+2025-07-18 00:05:47,122 [INFO] Reward doubled to 40
+2025-07-18 00:05:47,122 [INFO] House card dealt: 8 of Heart
+2025-07-18 00:05:48,702 [INFO] Player guessed 'g'
+2025-07-18 00:05:48,702 [INFO] House card: 8 of Heart, Player card: Black Joker
+2025-07-18 00:05:48,702 [INFO] Guess is correct.
+2025-07-18 00:05:49,000 [INFO] Player stopped match with reward 40
+"""
+
+MORE = """\
+2025-07-18 00:05:50,626 [INFO] Attempting to start a new match. Current point is 75
+2025-07-18 00:05:50,626 [INFO] House card dealt: 6 of Heart
+2025-07-18 00:05:52,260 [INFO] Player guessed 'g'
+2025-07-18 00:05:52,260 [INFO] House card: 6 of Heart, Player card: 4 of Spade
+2025-07-18 00:05:52,260 [INFO] Guess is wrong! Match ended.
+2025-07-18 00:05:53,000 [INFO] Attempting to start a new match. Current point is 50
+2025-07-18 00:05:53,000 [INFO] House card dealt: 2 of Club
+2025-07-18 00:05:54,000 [INFO] Player guessed 'g'
+2025-07-18 00:05:54,000 [INFO] Guess is correct.
+2025-07-18 00:05:55,000 [INFO] Player wins the game with 70 points
+"""
+
+def test_analyze(tmp_path):
+    path = tmp_path / "game.log"
+    path.write_text(LOG + MORE)
+    stats = analyze(path)
+    assert stats["matches"] == 3
+    assert stats["guesses"] == 4
+    assert stats["correct"] == 3
+    # The last match ended on the win threshold with its initial reward
+    assert stats["total_reward"] == 40 + 0 + 20
+    assert stats["wins"] == 1 and stats["bankruptcies"] == 0
+    assert stats["accuracy"] == 0.75
+
+def test_resume_from_checkpoint(tmp_path):
+    path = tmp_path / "game.log"
+    checkpoint = tmp_path / "log.ckpt"
+    full = LOG + MORE
+    split = len(LOG) + 40  # in the middle of a line
+
+    path.write_text(full[:split])
+    first = analyze(path, checkpoint)
+    assert first["matches"] == 1
+
+    path.write_text(full)
+    resumed = analyze(path, checkpoint)
+    fresh = analyze(path)
+    assert resumed == fresh
+
+    # Nothing new to read
+    assert analyze(path, checkpoint) == fresh
+
+def test_truncated_log_restarts(tmp_path):
+    path = tmp_path / "game.log"
+    checkpoint = tmp_path / "log.ckpt"
+    path.write_text(LOG + MORE)
+    analyze(path, checkpoint)
+    path.write_text(LOG)
+    assert analyze(path, checkpoint)["matches"] == 1
+
+def test_rotated_log_restarts(tmp_path):
+    path = tmp_path / "game.log"
+    checkpoint = tmp_path / "log.ckpt"
+    path.write_text(LOG)
+    analyze(path, checkpoint)
+
+    # The handler renames the log and starts a new one that grows past the old offset
+    path.rename(tmp_path / "game.log.1")
+    path.write_text(MORE + MORE)
+    assert len(MORE + MORE) > len(LOG)
+    assert analyze(path, checkpoint) == analyze(path)
+    assert analyze(path, checkpoint)["matches"] == 4
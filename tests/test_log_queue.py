@@ -0,0 +1,40 @@
+import logging
+import queue
+from src.log_queue import LazyQueueHandler, start_queued_logging
+
+class CountingArg:
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "arg"
+
+def test_lazy_formatting():
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger("test_lazy_formatting")
+    logger.propagate = False
+    logger.addHandler(LazyQueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+
+    arg = CountingArg()
+    logger.info("House card dealt: %s", arg)
+    record = log_queue.get_nowait()
+    # Nothing was formatted on the logging thread
+    assert arg.calls == 0
+    assert record.getMessage() == "House card dealt: arg"
+
+def test_queued_file_logging(tmp_path):
+    path = tmp_path / "game.log"
+    logger = logging.getLogger("test_queued_file_logging")
+    logger.propagate = False
+    listener = start_queued_logging(str(path), logger, max_bytes=2000, backup_count=2, console=False)
+    for i in range(100):
+        logger.info("Reward doubled to %s", i)
+    listener.stop()
+
+    # Records are written in order and the file was rotated by size
+    lines = path.read_text().splitlines()
+    assert lines[-1].endswith("[INFO] Reward doubled to 99")
+    assert (tmp_path / "game.log.1").exists()
+    assert path.stat().st_size <= 2000
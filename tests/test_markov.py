@@ -0,0 +1,34 @@
+import numpy as np
+from src import markov
+from src.markov import round_win_probability, match_reward_distribution, evaluate_game
+from src.simulation import simulate_games, always_stop, StopAt
+
+def test_round_win_probability():
+    # With two cards left the majority side always wins
+    assert round_win_probability(2) == 1.0
+    assert round_win_probability(54, "greater") == 0.5
+    assert 0.5 < round_win_probability(54) < 0.8
+
+def test_match_reward_distribution():
+    distribution = match_reward_distribution(continue_policy=always_stop)
+    assert set(distribution) == {0, 20}
+    assert distribution[20] == round_win_probability(54)
+    distribution = match_reward_distribution(continue_policy=StopAt(160))
+    assert set(distribution) == {0, 160}
+    assert abs(sum(distribution.values()) - 1) < 1e-12
+
+def test_matches_monte_carlo():
+    outcome = evaluate_game()
+    assert abs(outcome.win_probability + outcome.ruin_probability - 1) < 1e-9
+    games = simulate_games(50000, rng=np.random.default_rng(1))
+    assert abs(games.win_rate - outcome.win_probability) < 0.01
+    assert abs(games.matches.mean() - outcome.expected_matches) / outcome.expected_matches < 0.03
+
+def test_edges_and_cache():
+    assert evaluate_game(starting_points=1000).win_probability == 1.0
+    assert evaluate_game(starting_points=10).ruin_probability == 1.0
+    markov._solve_chain.cache_clear()
+    evaluate_game(starting_points=60, win_threshold=5000)
+    evaluate_game(starting_points=110, win_threshold=5000)
+    # Both starting points share one residue class, so the second is a lookup
+    assert markov._solve_chain.cache_info().hits == 1
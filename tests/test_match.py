@@ -0,0 +1,28 @@
+import random
+from src.card import Card
+from src.deck import Deck
+from src.match import Match
+
+def test_odds():
+    match = Match()
+    house_card = match.deal_cards()
+    p_greater, p_less = match.odds()
+
+    # Brute force over every card the player has not seen
+    unseen = list(match.deck._cards) + [match.player_card]
+    assert p_greater == sum(card > house_card for card in unseen) / len(unseen)
+    assert p_less == sum(card < house_card for card in unseen) / len(unseen)
+
+def test_odds_small_deck():
+    match = Match()
+    match.deck = Deck([Card('2', 'Spade'), Card('9', 'Heart'), Card('5', 'Club')], shuffle_on_init=False)
+    assert match.deal_cards() == Card('5', 'Club')
+    assert match.odds() == (0.5, 0.5)
+
+def test_rounds():
+    match = Match(rng=random.Random(3))
+    assert match.rounds == 0
+    for _ in range(30):
+        match.deal_cards()
+    # Rounds keep counting across a deck reset
+    assert match.rounds == 30
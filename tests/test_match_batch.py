@@ -0,0 +1,63 @@
+import numpy as np
+from src.card import Card
+from src.match_batch import MatchBatch
+
+def test_matches_single_match_behavior():
+    # Each row plays exactly like a Match dealing from the same deck order
+    batch = MatchBatch(200, win_threshold=10 ** 12, rng=np.random.default_rng(1))
+    matches = [batch.to_match(i) for i in range(len(batch))]
+    for _ in range(26):
+        if not batch.active.any():
+            break
+        rows = np.flatnonzero(batch.active)
+        house = batch.deal()
+        greater, less = batch.odds()
+        guesses = np.where(greater >= less, "g", "l")
+        for i in rows:
+            assert matches[i].deal_cards().ordinal == house[i]
+            assert np.allclose(matches[i].odds(), (greater[i], less[i]))
+        correct = batch.step(guesses)
+        for i in rows:
+            assert matches[i].is_guess_correct(guesses[i]) == correct[i]
+            if not correct[i]:
+                matches[i].remove_reward()
+            else:
+                matches[i].double_reward()
+        batch.double()
+        assert batch.rewards.tolist() == [match.get_reward() for match in matches]
+
+def test_stop_and_win_threshold():
+    batch = MatchBatch(1000, rng=np.random.default_rng(2))
+    batch.deal()
+    correct = batch.step(batch.player > batch.house)
+    assert correct.all()
+    batch.double(np.arange(1000) < 500)
+    rewards = batch.stop()
+    assert not batch.active.any()
+    assert rewards.tolist() == [40] * 500 + [20] * 500
+
+    # Always guessing right ends every match once the reward reaches the threshold
+    batch = MatchBatch(100, win_threshold=160, rng=np.random.default_rng(3))
+    while batch.active.any():
+        batch.deal()
+        batch.step(batch.player > batch.house)
+        batch.double()
+    assert batch.rewards.tolist() == [160] * 100
+    assert batch.rounds.tolist() == [4] * 100
+
+def test_ties_and_deck_reset():
+    # Ties lose both ways, and a two-card deck is replaced after every deal
+    same = [Card('5', 'Heart').ordinal] * 2
+    batch = MatchBatch(10, deck=same, rng=np.random.default_rng(4))
+    batch.deal()
+    assert not batch.step(np.full(10, "g")).any()
+    assert batch.rewards.tolist() == [0] * 10
+
+    batch = MatchBatch(10, deck=[1, 2, 3], rng=np.random.default_rng(5))
+    for _ in range(3):
+        batch.deal()
+        batch.step(batch.player > batch.house)
+    assert batch.position.tolist() == [2] * 10
+    # Invalid guesses are wrong
+    batch.deal()
+    assert not batch.step(np.full(10, "x")).any()
@@ -0,0 +1,58 @@
+import random
+from src import metrics
+from src.deck import Deck, JokerDeckFactory, LazyDeck
+from src.game import Game
+from src.match import Match
+from src.session import play_game, majority_guess_policy, always_continue_policy
+
+def test_disabled_leaves_classes_untouched():
+    originals = (Match.deal_cards, Deck.shuffle, JokerDeckFactory.create_deck)
+    metrics.enable(metrics.Registry())
+    assert Match.deal_cards is not originals[0]
+    metrics.disable()
+    assert (Match.deal_cards, Deck.shuffle, JokerDeckFactory.create_deck) == originals
+    assert not metrics.is_enabled()
+
+def test_counts(tmp_path):
+    registry = metrics.Registry()
+    metrics.enable(registry)
+    try:
+        match = Match(rng=random.Random(1))
+        for _ in range(30):
+            match.deal_cards()
+            match.is_guess_correct("g")
+        match.double_reward()
+        play_game(Game(rng=random.Random(2)), majority_guess_policy, always_continue_policy)
+    finally:
+        metrics.disable()
+
+    deals = registry.get("ngg_deals_total").value
+    guesses = registry.get("ngg_correct_guesses_total").value + registry.get("ngg_wrong_guesses_total").value
+    assert deals == guesses >= 30
+    # 30 rounds of a 54-card deck need one reset
+    assert registry.get("ngg_deck_resets_total").value >= 1
+    assert registry.get("ngg_deck_constructions_total").value == registry.get("ngg_deck_shuffles_total").value
+    assert registry.get("ngg_reward_doublings_total").value >= 1
+    assert registry.get("ngg_match_deal_cards_seconds").count == deals
+    assert registry.get("ngg_create_deck_seconds", factory="JokerDeckFactory").count >= 2
+
+    path = tmp_path / "metrics.prom"
+    metrics.write_prometheus(path, registry)
+    text = path.read_text()
+    assert "# TYPE ngg_deals_total counter" in text
+    assert f"ngg_deals_total {deals}" in text
+    assert 'ngg_create_deck_seconds_bucket{factory="JokerDeckFactory",le="+Inf"}' in text
+
+def test_lazy_deck_shuffles_are_counted():
+    registry = metrics.Registry()
+    metrics.enable(registry)
+    try:
+        match = Match(rng=random.Random(3), deck_factory=JokerDeckFactory(deck_class=LazyDeck, rng=random.Random(4)))
+        for _ in range(30):
+            match.deal_cards()
+    finally:
+        metrics.disable()
+    assert LazyDeck.shuffle is LazyDeck.__dict__["shuffle"]
+    constructions = registry.get("ngg_deck_constructions_total").value
+    assert constructions >= 2
+    assert registry.get("ngg_deck_shuffles_total").value == constructions
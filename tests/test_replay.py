@@ -0,0 +1,32 @@
+import pytest
+from src.game import Game
+from src.replay import GameRecord, record_game, replay_game
+from src.rng import split, spawn_seeds
+from src.session import play_game, majority_guess_policy, ContinueBelow
+
+continue_below_160 = ContinueBelow(160)
+
+def test_split_streams():
+    # Child streams are reproducible and independent
+    assert spawn_seeds(1, 3) == spawn_seeds(1, 3)
+    assert len(set(spawn_seeds(1, 100))) == 100
+    first, second = split(1, 2)
+    assert first.random() != second.random()
+
+def test_seeded_games_are_reproducible():
+    points = {play_game(Game(rng=rng), majority_guess_policy, continue_below_160).points
+              for rng in split(5, 1) + split(5, 1)}
+    assert len(points) == 1
+
+def test_replay():
+    for seed in range(20):
+        game, record = record_game(seed, majority_guess_policy, continue_below_160, starting_points=60)
+        assert record.final_points == game.points
+        restored = GameRecord.loads(record.dumps())
+        assert replay_game(restored).points == game.points
+
+def test_replay_detects_divergence():
+    _, record = record_game(3, majority_guess_policy, continue_below_160)
+    record.guesses = "".join("l" if guess == "g" else "g" for guess in record.guesses)
+    with pytest.raises(ValueError):
+        replay_game(record)
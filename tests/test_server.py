@@ -0,0 +1,114 @@
+import asyncio
+import json
+from src.server import GameServer
+
+async def _send(reader, writer, command):
+    writer.write((command + "\n").encode())
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+async def _play(port, rounds):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    greeting = json.loads(await reader.readline())
+    assert greeting["state"] == "idle"
+    requests = 0
+    for _ in range(rounds):
+        response = await _send(reader, writer, "START")
+        requests += 1
+        if not response["ok"]:
+            break
+        response = await _send(reader, writer, "G")
+        requests += 1
+        if response["state"] == "deciding":
+            response = await _send(reader, writer, "STOP")
+            requests += 1
+        if response["state"] == "over":
+            break
+    await _send(reader, writer, "QUIT")
+    writer.close()
+    return requests
+
+def test_protocol():
+    async def run():
+        server = GameServer(port=0)
+        port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+
+        response = await _send(reader, writer, "G")
+        assert not response["ok"] and "idle" in response["error"]
+        response = await _send(reader, writer, "bogus")
+        assert not response["ok"]
+
+        response = await _send(reader, writer, "start")
+        assert response["ok"] and response["points"] == 35 and response["reward"] == 20
+        assert "house" in response
+
+        response = await _send(reader, writer, "L")
+        assert response["ok"] and response["state"] in ("deciding", "idle")
+        assert "player" in response
+
+        response = await _send(reader, writer, "QUIT")
+        assert await reader.readline() == b""
+        writer.close()
+        await server.close()
+    asyncio.run(run())
+
+def test_idle_timeout():
+    async def run():
+        server = GameServer(port=0, idle_timeout=0.05)
+        port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+        response = json.loads(await reader.readline())
+        assert response["error"] == "Idle timeout."
+        assert await reader.readline() == b""
+        writer.close()
+        await server.close()
+        assert server.active_sessions == 0
+    asyncio.run(run())
+
+def test_concurrent_sessions():
+    async def run():
+        server = GameServer(port=0)
+        port = await server.start()
+        requests = await asyncio.gather(*(_play(port, 5) for _ in range(200)))
+        await server.close()
+        assert server.total_sessions == 200
+        assert server.peak_sessions > 1
+        assert server.requests >= sum(requests)
+        # About 1,600 commands from 200 clients; one process serves well over 1,000/s
+        assert server.uptime > 0
+        assert server.requests_per_second > 200
+        assert server.stats()["requests_per_second"] == server.requests_per_second
+    asyncio.run(run())
+
+def test_stats_command():
+    async def run():
+        server = GameServer(port=0)
+        port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+        await _send(reader, writer, "START")
+        response = await _send(reader, writer, "STATS")
+        assert response["ok"] and response["state"] == "guessing"
+        stats = response["server"]
+        assert stats["active_sessions"] == 1 and stats["requests"] == 2
+        assert stats["uptime"] > 0 and stats["requests_per_second"] > 0
+        writer.close()
+        await server.close()
+    asyncio.run(run())
+
+def test_line_too_long():
+    async def run():
+        server = GameServer(port=0, line_limit=64)
+        port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+        response = await _send(reader, writer, "G" * 1000)
+        assert response == {"ok": False, "error": "Line too long."}
+        assert await reader.readline() == b""
+        writer.close()
+        await server.close()
+        assert server.active_sessions == 0
+    asyncio.run(run())
@@ -0,0 +1,46 @@
+import random
+import pytest
+from src.game import Game
+from src.session import GameSession
+
+def test_session_flow():
+    session = GameSession(Game(starting_points=60, rng=random.Random(1)))
+    assert session.state == GameSession.IDLE
+
+    # Guessing before a match starts is rejected
+    with pytest.raises(ValueError):
+        session.guess("g")
+
+    session.start_match()
+    assert session.game.points == 35
+    assert session.state == GameSession.GUESSING
+
+    # Guess whichever way is right for the dealt cards
+    match = session.match
+    guess = "g" if match.player_card > match.house_card else "l"
+    assert session.guess(guess)
+    assert session.state == GameSession.DECIDING
+
+    session.continue_match()
+    assert match.get_reward() == 40
+    guess = "l" if match.player_card > match.house_card else "g"
+    assert not session.guess(guess)
+    assert session.game.points == 35
+    assert session.state == GameSession.IDLE
+
+    session.start_match()
+    match = session.match
+    session.guess("g" if match.player_card > match.house_card else "l")
+    assert session.stop_match() == 20
+    assert session.game.points == 30
+
+def test_session_over():
+    session = GameSession(Game(starting_points=30, win_threshold=40, rng=random.Random(2)))
+    session.start_match()
+    match = session.match
+    session.guess("g" if match.player_card > match.house_card else "l")
+    session.stop_match()
+    # 30 - 25 + 20 = 25 points is below the lose threshold
+    assert session.state == GameSession.OVER
+    with pytest.raises(ValueError):
+        session.start_match()
@@ -0,0 +1,23 @@
+from src.session import ContinueBelow, always_stop_policy
+from src.session_simulator import simulate_sessions
+
+def test_simulate_sessions():
+    stats = simulate_sessions(300, seed=1, workers=1, chunk_size=64)
+    assert stats.sessions == 300
+    assert stats.wins + stats.bankruptcies == 300
+    assert sum(stats.lengths.values()) == 300
+    assert stats.total_matches == sum(length * count for length, count in stats.lengths.items())
+
+def test_results_do_not_depend_on_workers():
+    config = {'starting_points': 100}
+    inline = simulate_sessions(200, seed=2, workers=1, chunk_size=50, game_config=config,
+                               choose_continue=ContinueBelow(80))
+    pooled = simulate_sessions(200, seed=2, workers=2, chunk_size=50, game_config=config,
+                               choose_continue=ContinueBelow(80))
+    assert inline.lengths == pooled.lengths
+    assert inline.wins == pooled.wins
+
+def test_stopping_early_always_goes_bankrupt():
+    # Taking 20 for every 25 paid can never reach the win threshold
+    stats = simulate_sessions(50, seed=3, workers=1, choose_continue=always_stop_policy)
+    assert stats.bankruptcy_rate == 1.0
@@ -0,0 +1,54 @@
+import random
+from collections import Counter
+import pytest
+from src.card import Card
+from src.match import Match
+from src.shoe import Shoe, ShoeFactory
+
+def test_shoe_counts():
+    shoe = ShoeFactory(num_decks=6, rng=random.Random(1)).create_deck()
+    assert len(shoe) == 6 * 54
+    assert shoe.count_greater(Card('K', 'Heart')) == 6 * 2
+    assert Card('Red Joker') in shoe
+    assert sum(shoe.rank_counts()) == len(shoe)
+    assert shoe.rank_counts()[Card('Red Joker').ordinal] == 6
+
+    dealt = Counter(shoe.deal_card() for _ in range(len(shoe)))
+    # Every card comes out exactly once per deck
+    assert set(dealt.values()) == {6}
+    assert len(dealt) == 54
+    with pytest.raises(IndexError):
+        shoe.deal_card()
+
+    shoe.add_card(Card('2', 'Club'))
+    assert shoe.deal_card() == Card('2', 'Club')
+    with pytest.raises(TypeError):
+        shoe.add_card("not a card")
+
+def test_shoe_draws_are_uniform():
+    shoe = Shoe([Card('A', 'Spade'), Card('K', 'Heart')], num_decks=1000, rng=random.Random(2))
+    aces = sum(shoe.deal_card() == Card('A', 'Spade') for _ in range(1000))
+    assert 400 < aces < 600
+
+def test_penetration():
+    shoe = ShoeFactory(num_decks=2, penetration=0.5, rng=random.Random(3)).create_deck()
+    for _ in range(53):
+        shoe.deal_card()
+    assert not shoe.cut_card_reached()
+    shoe.deal_card()
+    assert shoe.cut_card_reached()
+
+def test_match_with_shoe():
+    factory = ShoeFactory(num_decks=400, penetration=0.5, rng=random.Random(4))
+    match = Match(deck_factory=factory)
+    first_shoe = match.deck
+    assert len(first_shoe) == 400 * 54
+    match.deal_cards()
+    p_greater, p_less = match.odds()
+    assert 0 < p_greater < 1 and 0 < p_less < 1
+
+    # The match replaces the shoe once the cut card is reached
+    while not first_shoe.cut_card_reached():
+        match.deal_cards()
+    match.deal_cards()
+    assert match.deck is not first_shoe
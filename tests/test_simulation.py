@@ -0,0 +1,49 @@
+import numpy as np
+from src.card import Card
+from src.simulation import (simulate_matches, simulate_games, joker_deck_ordinals,
+                            majority_guess, always_greater, always_stop, always_continue, StopAt)
+
+def test_joker_deck_ordinals():
+    deck = joker_deck_ordinals()
+    assert len(deck) == 54
+    assert len(set(deck.tolist())) == 54
+    assert Card('Red Joker').ordinal in deck
+
+def test_always_stop_rewards():
+    stats = simulate_matches(20000, guess_policy=majority_guess, continue_policy=always_stop,
+                             rng=np.random.default_rng(1))
+    assert set(stats.reward_distribution()) <= {0, 20}
+    assert (stats.rounds == 1).all()
+
+    # With 54 distinct cards the majority guess wins with probability
+    # sum(max(i, 53 - i)) / (54 * 53) for a house card of rank i
+    expected = sum(max(i, 53 - i) for i in range(54)) / (54 * 53)
+    win_rate = np.count_nonzero(stats.rewards) / len(stats)
+    assert abs(win_rate - expected) < 0.02
+
+def test_ties_lose_both_ways():
+    same = [Card('7', 'Heart').ordinal] * 10
+    stats = simulate_matches(1000, guess_policy=always_greater, deck=same, rng=np.random.default_rng(2))
+    assert (stats.rewards == 0).all()
+
+def test_win_threshold_ends_match():
+    stats = simulate_matches(50000, continue_policy=always_continue, rng=np.random.default_rng(3))
+    # 20 doubles up to 1280, the first reward at or above the threshold
+    assert stats.rewards.max() <= 1280
+    assert set(stats.reward_distribution()) <= {0, 1280}
+
+    stats = simulate_matches(10000, continue_policy=StopAt(80), rng=np.random.default_rng(4))
+    assert set(stats.reward_distribution()) <= {0, 80}
+
+def test_deck_reset():
+    # A 4-card deck runs out after two rounds and must be reshuffled
+    deck = [Card(v, 'Spade').ordinal for v in ['2', '5', '9', 'K']]
+    stats = simulate_matches(1000, continue_policy=StopAt(10 ** 6), win_threshold=10 ** 9,
+                             deck=deck, rng=np.random.default_rng(5))
+    assert stats.rounds.max() > 2
+
+def test_simulate_games():
+    stats = simulate_games(2000, rng=np.random.default_rng(6))
+    assert len(stats) == 2000
+    assert ((stats.points >= 1000) | (stats.points < 30)).all()
+    assert stats.win_rate == np.mean(stats.points >= 1000)
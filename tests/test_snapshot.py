@@ -0,0 +1,121 @@
+import random
+import pytest
+from src.deck import CompactDeck, LazyDeck, JokerDeckFactory
+from src.game import Game
+from src.session import GameSession
+from src.snapshot import dump_session, load_session, SnapshotWriter, SnapshotReader
+
+def _session_in_progress(seed, deck_factory=None):
+    session = GameSession(Game(rng=random.Random(seed)), deck_factory=deck_factory)
+    session.start_match()
+    match = session.match
+    if session.guess("g" if match.player_card > match.house_card else "l"):
+        session.continue_match()
+    return session
+
+def _assert_same(restored, session):
+    assert restored.state == session.state
+    assert restored.game.points == session.game.points
+    assert restored.game.matches_played == session.game.matches_played
+    assert restored.match.potential_reward == session.match.potential_reward
+    assert restored.match.rounds == session.match.rounds
+    assert restored.match.house_card is session.match.house_card
+    assert restored.match.player_card is session.match.player_card
+    assert restored.match.deck._cards == session.match.deck._cards
+
+def test_round_trip():
+    session = _session_in_progress(1)
+    restored = load_session(dump_session(session))
+    _assert_same(restored, session)
+
+    # The restored session plays on from the same deck
+    guess = "g" if session.match.player_card > session.match.house_card else "l"
+    assert restored.guess(guess) == session.guess(guess)
+    assert restored.game.points == session.game.points
+
+def test_round_trip_compact_deck():
+    session = _session_in_progress(2, JokerDeckFactory(CompactDeck))
+    restored = load_session(dump_session(session))
+    assert isinstance(restored.match.deck, CompactDeck)
+    _assert_same(restored, session)
+
+def test_round_trip_lazy_deck():
+    deck_rng = random.Random(7)
+    session = _session_in_progress(3, JokerDeckFactory(LazyDeck, rng=deck_rng))
+    data = dump_session(session)
+    # Restored with a random source in the same state, both decks deal the same cards
+    restored_rng = random.Random()
+    restored_rng.setstate(deck_rng.getstate())
+    restored = load_session(data, rng=restored_rng)
+    assert isinstance(restored.match.deck, LazyDeck)
+    _assert_same(restored, session)
+    assert restored.match.deck._pending == session.match.deck._pending > 0
+    assert [restored.match.deck.deal_card() for _ in range(10)] == \
+        [session.match.deck.deal_card() for _ in range(10)]
+
+def test_dump_does_not_change_a_lazy_session():
+    def deals(snapshot):
+        session = _session_in_progress(5, JokerDeckFactory(LazyDeck, rng=random.Random(11)))
+        if snapshot:
+            dump_session(session)
+        return [session.match.deck.deal_card() for _ in range(20)]
+    assert deals(snapshot=True) == deals(snapshot=False)
+
+def test_idle_session():
+    session = GameSession(Game(starting_points=100))
+    restored = load_session(dump_session(session))
+    assert restored.match is None
+    assert restored.game.points == 100
+    assert restored.start_match() is restored.match.house_card
+
+def test_bad_snapshot():
+    with pytest.raises(ValueError):
+        load_session(b"XXXX\x01" + bytes(100))
+
+def test_bulk(tmp_path):
+    path = tmp_path / "sessions.bin"
+    sessions = [_session_in_progress(seed) for seed in range(50)]
+    with SnapshotWriter(path) as writer:
+        writer.write_many(sessions)
+    with SnapshotReader(path) as reader:
+        assert len(reader) == 50
+        for session, restored in zip(sessions, reader):
+            _assert_same(restored, session)
+        assert reader.points(-1) == sessions[-1].game.points
+        with pytest.raises(IndexError):
+            reader[50]
+
+def test_bulk_capacity(tmp_path):
+    with SnapshotWriter(tmp_path / "small.bin", deck_capacity=10) as writer:
+        with pytest.raises(ValueError):
+            writer.write(_session_in_progress(3))
+    with SnapshotReader(tmp_path / "small.bin") as reader:
+        assert len(reader) == 0
+
+def test_round_trip_shoe():
+    from src.shoe import Shoe, ShoeFactory
+    session = _session_in_progress(4, ShoeFactory(num_decks=4, rng=random.Random(4)))
+    restored = load_session(dump_session(session))
+    assert isinstance(restored.match.deck, Shoe)
+    _assert_same(restored, session)
+
+def test_shoe_keeps_size_and_penetration():
+    from src.shoe import Shoe, ShoeFactory
+    session = _session_in_progress(5, ShoeFactory(num_decks=8, penetration=0.5, rng=random.Random(5)))
+    restored = load_session(dump_session(session), rng=random.Random(6))
+    shoe, restored_shoe = session.match.deck, restored.match.deck
+    assert (restored_shoe.size, restored_shoe.penetration) == (8 * 54, 0.5)
+    assert restored_shoe._index.counts == shoe._index.counts
+
+    # Both reach the cut card after the same number of deals
+    def deals_to_cut(deck):
+        deals = 0
+        while not deck.cut_card_reached():
+            deck.deal_card()
+            deals += 1
+        return deals
+    assert deals_to_cut(restored_shoe) == deals_to_cut(shoe) > 0
+
+    # Shoes of any size fit the layout
+    big = _session_in_progress(6, ShoeFactory(num_decks=1300))
+    assert len(load_session(dump_session(big)).match.deck) == len(big.match.deck)
@@ -0,0 +1,51 @@
+import pytest
+from src.card import Card
+from src.deck import Deck
+from src.match import Match
+from src.solver import OptimalStopSolver, composition
+
+def test_always_continue_is_optimal_for_joker_deck():
+    solver = OptimalStopSolver()
+    # Doubling from 20 to 1280 needs 7 correct guesses from 54, 52, ..., 42 cards
+    expected = 1280.0
+    for n in range(54, 40, -2):
+        expected *= sum(max(i, n - 1 - i) for i in range(n)) / (n * (n - 1))
+    assert abs(solver.precompute(20) - expected) < 1e-9
+
+def test_single_round_value():
+    solver = OptimalStopSolver(win_threshold=10)
+    # Three distinct cards: the middle house card wins half the time, the others always
+    assert abs(solver.value(10, (1, 1, 1)) - 10 * (1 + 0.5 + 1) / 3) < 1e-9
+    # Two equal cards always tie, and ties lose
+    assert solver.value(10, (2,)) == 0
+
+def test_match_advice():
+    solver = OptimalStopSolver()
+    match = Match()
+    match.deck = Deck([Card('2', 'Spade'), Card('9', 'Heart'), Card('K', 'Club'), Card('3', 'Club')],
+                      shuffle_on_init=False)
+    match.deal_cards()  # House 3 of Club, player K of Club
+    assert solver.best_guess(match) == "g"
+    assert solver.should_continue(match)
+
+    # Rewards at the win threshold end the match
+    match.potential_reward = 1000
+    assert not solver.should_continue(match)
+
+def test_threshold_mismatch():
+    solver = OptimalStopSolver(win_threshold=100)
+    match = Match(win_threshold=1000)
+    match.deal_cards()
+    for advice in (solver.best_guess, solver.should_continue, solver.continue_value):
+        with pytest.raises(ValueError):
+            advice(match)
+
+def test_save_and_load(tmp_path):
+    solver = OptimalStopSolver()
+    value = solver.precompute()
+    path = tmp_path / "table.json"
+    solver.save(path)
+    loaded = OptimalStopSolver.load(path)
+    assert loaded._round_memo == solver._round_memo
+    assert loaded.value(20, composition(Deck([Card('A', 'Spade')] * 2, False)._cards)) == 0
+    assert loaded.precompute() == value
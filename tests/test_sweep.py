@@ -0,0 +1,78 @@
+import csv
+import pytest
+from src import sweep
+from src.sweep import grid, point_key, run_sweep
+
+def test_grid():
+    configs = grid(match_cost=[20, 25], initial_reward=[10, 20, 40])
+    assert len(configs) == 6
+    assert all(config["starting_points"] == 60 for config in configs)
+    with pytest.raises(ValueError):
+        grid(points=[1])
+
+def test_point_key():
+    config = grid()[0]
+    assert point_key(config, 100, 1) == point_key(dict(reversed(list(config.items()))), 100, 1)
+    assert point_key(config, 100, 1) != point_key(config, 100, 2)
+    assert point_key(config, 100, 1) != point_key(config, 100, 1, stop_at=80)
+
+def test_resume(tmp_path, monkeypatch):
+    configs = grid(match_cost=[20, 25, 30])
+    cache_dir, csv_path = tmp_path / "cache", tmp_path / "sweep.csv"
+
+    # The first run is interrupted after two points
+    evaluate = sweep.evaluate_point
+    calls = []
+    def interrupted(*args):
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        calls.append(args)
+        return evaluate(*args)
+    monkeypatch.setattr(sweep, "evaluate_point", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        run_sweep(configs, sessions=20, cache_dir=cache_dir, csv_path=csv_path, workers=1)
+    with open(csv_path, newline="") as f:
+        assert len(list(csv.DictReader(f))) == 2
+
+    # Resuming only computes the missing point and completes the CSV
+    calls.clear()
+    rows = run_sweep(configs, sessions=20, cache_dir=cache_dir, csv_path=csv_path, workers=1)
+    assert len(calls) == 1
+    assert [row["match_cost"] for row in rows] == [20, 25, 30]
+    with open(csv_path, newline="") as f:
+        written = list(csv.DictReader(f))
+    assert sorted(int(row["match_cost"]) for row in written) == [20, 25, 30]
+    assert {row["key"]: float(row["win_rate"]) for row in written} == {row["key"]: row["win_rate"] for row in rows}
+
+def test_pool_matches_inline(tmp_path):
+    configs = grid(initial_reward=[10, 20])
+    inline = run_sweep(configs, sessions=20, seed=3, cache_dir=tmp_path / "a", workers=1)
+    pooled = run_sweep(configs, sessions=20, seed=3, cache_dir=tmp_path / "b", workers=2)
+    assert [row["win_rate"] for row in inline] == [row["win_rate"] for row in pooled]
+
+def test_pool_interrupt_and_resume(tmp_path, monkeypatch):
+    configs = grid(match_cost=[20, 25, 30], initial_reward=[10, 20])
+    cache_dir, csv_path = tmp_path / "cache", tmp_path / "sweep.csv"
+
+    submitted = []
+    class CountingExecutor(sweep.ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):
+            submitted.append(args)
+            return super().submit(*args, **kwargs)
+    monkeypatch.setattr(sweep, "ProcessPoolExecutor", CountingExecutor)
+
+    # Ctrl-C in the parent while the first result is being stored
+    put = sweep.ResultCache.put
+    def interrupted(self, key, result):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(sweep.ResultCache, "put", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        run_sweep(configs, sessions=20, cache_dir=cache_dir, csv_path=csv_path, workers=2)
+    # Only the first window of points was ever queued
+    assert len(submitted) == 4
+
+    monkeypatch.setattr(sweep.ResultCache, "put", put)
+    rows = run_sweep(configs, sessions=20, cache_dir=cache_dir, csv_path=csv_path, workers=2)
+    assert len(rows) == 6
+    with open(csv_path, newline="") as f:
+        assert sorted(row["key"] for row in csv.DictReader(f)) == sorted(row["key"] for row in rows)
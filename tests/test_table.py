@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from src.card import Card
+from src.deck import JokerDeckFactory
+from src.shoe import ShoeFactory
+from src.table import Table
+
+def test_deal_draws_from_the_shoe():
+    table = Table(300, rng=np.random.default_rng(1))
+    house = table.deal()
+    assert table.house_card is house
+    # Every dealt card left the shoe
+    dealt = np.bincount(table.player, minlength=Card.ORDINAL_LIMIT)
+    dealt[house.ordinal] += 1
+    assert (table.counts + dealt == table.fresh).all()
+    greater, less = table.odds()
+    assert ((greater + less) <= 1).all()
+
+def test_step_and_rewards():
+    table = Table(500, rng=np.random.default_rng(2))
+    table.deal()
+    correct = table.step(table.player > table.house)
+    # Only ties with the house card lose
+    assert (correct == (table.player != table.house)).all()
+    assert (table.rewards[~correct] == 0).all()
+    table.double()
+    assert (table.rewards[correct] == 40).all()
+    table.stop(np.arange(500) < 100)
+    assert not table.active[:100].any()
+
+    # Inactive players are not dealt to
+    before = table.player.copy()
+    table.deal()
+    assert (table.player[~table.active] == before[~table.active]).all()
+    assert (table.rounds == np.where(table.active, 2, 1)).all()
+
+def test_refill():
+    table = Table(10, deck_factory=JokerDeckFactory(), penetration=0.5, rng=np.random.default_rng(3))
+    dealt = []
+    for _ in range(20):
+        table.deal()
+        dealt.append(table.size - table.counts.sum())
+    # The shoe is refilled once 27 cards are out, before a round of 11 cards
+    assert dealt[:3] == [11, 22, 33]
+    assert dealt[3] == 11
+    assert max(dealt) <= 26 + 11
+    with pytest.raises(ValueError):
+        Table(60, deck_factory=JokerDeckFactory())
+    assert Table(10, deck_factory=ShoeFactory(num_decks=2)).size == 108